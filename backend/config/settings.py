@@ -43,8 +43,10 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",          # must be first
+    "f1.metrics.MetricsMiddleware",                    # retiré si F1_METRICS=False
+    "f1.timing.ServerTimingMiddleware",                # retiré si F1_SERVER_TIMING=False
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",      # static files
+    "f1.static.StaticFilesMiddleware",                 # static files (WhiteNoise, async)
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -85,13 +87,18 @@ CSRF_TRUSTED_ORIGINS = [o.strip() for o in _csrf_env.split(",") if o.strip()] or
 _database_url = os.environ.get("DATABASE_URL")
 
 if _database_url:
+    # Sous ASGI, chaque requête exécute l'ORM dans son propre thread : une
+    # connexion persistante (conn_max_age) serait ouverte à chaque requête puis
+    # abandonnée avec le thread. Pool psycopg 3 partagé par le worker à la place.
     DATABASES = {
-        "default": dj_database_url.parse(
-            _database_url,
-            conn_max_age=600,
-            conn_health_checks=True,
-        )
+        "default": dj_database_url.parse(_database_url, conn_max_age=0)
     }
+    if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+        DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+            "min_size": int(os.environ.get("DB_POOL_MIN", "2")),
+            "max_size": int(os.environ.get("DB_POOL_MAX", "10")),
+            "timeout": 10,
+        }
 else:
     DATABASES = {
         "default": {
@@ -100,6 +107,33 @@ else:
         }
     }
 
+# ── Cache ─────────────────────────────────────────────────────────────────────
+# locmem par défaut ; en production, n'importe quel backend partagé
+# (ex: CACHE_BACKEND=django.core.cache.backends.redis.RedisCache,
+#      CACHE_LOCATION=redis://…)
+
+_cache_backend = os.environ.get("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache")
+_cache_location = os.environ.get("CACHE_LOCATION", "f1-manager")
+
+CACHES = {
+    "default": {
+        "BACKEND": _cache_backend,
+        "LOCATION": _cache_location,
+    },
+    # résultats de session seedés (re-runs force=True) : à part, pour ne pas
+    # chasser les réponses en cache (locmem : 300 entrées par LOCATION ;
+    # backend partagé : même serveur, préfixe distinct)
+    "outcomes": {
+        "BACKEND": _cache_backend,
+        "LOCATION": "f1-outcomes" if _cache_backend.endswith("LocMemCache") else _cache_location,
+        "KEY_PREFIX": "outcome",
+    },
+}
+
+# Durée de vie (s) des réponses en cache ; une nouvelle version les rend
+# de toute façon inaccessibles
+F1_READ_CACHE_TIMEOUT = int(os.environ.get("F1_READ_CACHE_TIMEOUT", "86400"))
+
 # ── REST Framework ─────────────────────────────────────────────────────────────
 
 REST_FRAMEWORK = {
@@ -111,6 +145,51 @@ REST_FRAMEWORK = {
     ),
 }
 
+SIMPLE_JWT = {
+    # login : crée la partie du joueur s'il n'en a pas (voir f1.auth_views)
+    "TOKEN_OBTAIN_SERIALIZER": "f1.auth_views.LoginSerializer",
+}
+
+# ── Simulation ────────────────────────────────────────────────────────────────
+
+# Processus pour les gros batchs NumPy (Monte Carlo…) ; 0 = tous les cœurs
+F1_SIM_WORKERS = int(os.environ.get("F1_SIM_WORKERS", "1"))
+
+# Durée de vie (s) du cache des résultats de session seedés
+F1_SIM_CACHE_TIMEOUT = int(os.environ.get("F1_SIM_CACHE_TIMEOUT", "3600"))
+
+# Courses (S/GP) : "simple" (un tirage par pilote) ou "laps" (tour par tour :
+# régularité, erreurs, abandons, meilleur tour). À changer entre deux saisons :
+# une saison rejouée (replay) doit l'être avec le mode qui l'a simulée.
+F1_RACE_MODE = os.environ.get("F1_RACE_MODE", "simple")
+
+# ── Instrumentation ───────────────────────────────────────────────────────────
+
+# Header Server-Timing + ligne de log JSON par requête (temps total, DB,
+# spans du moteur) ; désactivé = middleware retiré, coût nul
+F1_SERVER_TIMING = os.environ.get("F1_SERVER_TIMING", "False").lower() == "true"
+
+# Métriques Prometheus (/metrics) ; F1_METRICS_TOKEN = bearer exigé si défini.
+# Multi-workers : PROMETHEUS_MULTIPROC_DIR (voir entrypoint.sh)
+F1_METRICS = os.environ.get("F1_METRICS", "True").lower() == "true"
+F1_METRICS_TOKEN = os.environ.get("F1_METRICS_TOKEN", "")
+
+# Profils cProfile demandés par un superuser (X-F1-Profile) : anneau de
+# F1_PROFILE_KEEP fichiers .prof (voir `manage.py profiles`)
+F1_PROFILE_DIR = os.environ.get("F1_PROFILE_DIR", "/tmp/f1-profiles")
+F1_PROFILE_KEEP = int(os.environ.get("F1_PROFILE_KEEP", "20"))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "f1": {"handlers": ["console"], "level": os.environ.get("F1_LOG_LEVEL", "INFO")},
+    },
+}
+
 # ── Templates ────────────────────────────────────────────────────────────────
 
 ROOT_URLCONF = "config.urls"
@@ -2,6 +2,8 @@ from django.contrib import admin
 from django.urls import path, include
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from f1.metrics import metrics_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
 
@@ -9,4 +11,6 @@ urlpatterns = [
     path("api/auth/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
 
     path("api/", include("f1.urls")),
+
+    path("metrics", metrics_view, name="metrics"),
 ]
\ No newline at end of file
@@ -19,8 +19,15 @@ else:
 echo "▶ Creating admin user (if DJANGO_SU_NAME is set)..."
 python manage.py create_default_admin
 
+# métriques multi-workers : un répertoire vide par démarrage
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/f1-metrics}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
 echo "▶ Starting gunicorn on port ${PORT:-8000}..."
-exec gunicorn config.wsgi:application \
+# ASGI (workers uvicorn) : les vues async / flux SSE ne bloquent pas de worker
+exec gunicorn config.asgi:application \
+    --worker-class uvicorn_worker.UvicornWorker \
     --bind "0.0.0.0:${PORT:-8000}" \
     --workers "${GUNICORN_WORKERS:-2}" \
     --timeout 120 \
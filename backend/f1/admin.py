@@ -1,7 +1,10 @@
 from django.contrib import admin
-from .models import Driver, Team, SeasonSession, SessionResult
+from .models import Career, Driver, DriverBaseline, Team, SeasonSession, SessionResult, StandingsSnapshot
 
 admin.site.register(Team)
 admin.site.register(Driver)
+admin.site.register(DriverBaseline)
 admin.site.register(SeasonSession)
-admin.site.register(SessionResult)
\ No newline at end of file
+admin.site.register(SessionResult)
+admin.site.register(Career)
+admin.site.register(StandingsSnapshot)
\ No newline at end of file
@@ -0,0 +1,321 @@
+# f1/async_views.py
+"""
+Vues async (ASGI) des lectures fréquentes : health, teams, drivers,
+team standings, calendar, résultats de sessions, budget, me.
+
+Même contrat que les anciennes vues DRF (payloads, noms de cache, ETag /
+304), mais l'ORM async (afirst, aget, async for) remplace les appels
+bloquants : sous ASGI, une lecture attend la DB sans occuper de worker.
+L'authentification JWT est sans état (signature et claims du token, pas
+de lecture de l'utilisateur en base). Un client à jour (If-None-Match) reçoit
+son 304 depuis le cache seul, avant toute requête DB : id de partie
+mémorisé pour ce client, puis version du scope.
+
+Sous WSGI (config.wsgi), Django exécute ces vues dans une boucle
+d'événements dédiée : elles restent fonctionnelles, sans le gain.
+Comparaison des deux : `manage.py bench_http`.
+"""
+from functools import wraps
+
+from django.contrib.auth.models import User
+from django.db.models import Count, Sum
+from django.http import Http404, JsonResponse
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+
+from .cache import (
+    CATALOG,
+    acached_json,
+    anot_modified,
+    budget_scope,
+    name_part,
+    profile_scope,
+    season_scope,
+    static_json,
+)
+from .models import Career, Profile, SessionResult, Team
+from .services import budget, simulation
+from .services.careers import acareer_hint, aremember_career, aresolve_career
+
+
+def authenticate(request):
+    """Utilisateur du JWT (TokenUser, sans requête DB), sinon anonyme (None)."""
+    if "Authorization" not in request.headers:
+        return None
+    result = JWTStatelessUserAuthentication().authenticate(request)
+    return result[0] if result else None
+
+
+def json_errors(view):
+    """Erreurs d'auth / de partie -> {"detail": ...} comme les vues DRF."""
+
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        try:
+            return await view(request, *args, **kwargs)
+        except AuthenticationFailed as e:
+            # même corps que le handler DRF (InvalidToken porte un dict)
+            data = e.detail if isinstance(e.detail, dict) else {"detail": e.detail}
+            return JsonResponse(data, status=e.status_code)
+        except Http404 as e:
+            return JsonResponse({"detail": str(e)}, status=404)
+
+    return wrapper
+
+
+async def _career(request, name: str, scope):
+    """
+    (partie, None), ou (None, 304) pour un client à jour.
+
+    Partie ciblée : `?career=<id>` pour un joueur connecté, sinon sa partie
+    courante. Lecture seule : jamais créée ici (404 si elle n'existe pas).
+    Le 304 est décidé avant toute requête DB, avec l'id de partie mémorisé
+    pour ce client : `name` (avec `{career}`) et `scope(id)` donnent l'ETag.
+    """
+    user, career_id = authenticate(request), request.GET.get("career")
+    hint = await acareer_hint(user, career_id)
+    if hint is not None:
+        not_modified = await anot_modified(request, name.format(career=hint), scope(hint))
+        if not_modified is not None:
+            return None, not_modified
+
+    career = await aresolve_career(user, career_id)
+    if career.pk != hint:
+        await aremember_career(user, career_id, career)
+    return career, None
+
+
+@require_GET
+async def health(request):
+    return static_json(request, {"ok": True})
+
+
+@require_GET
+@json_errors
+async def teams_list(request):
+    return await acached_json(request, "teams", _teams_payload, scope=CATALOG)
+
+
+async def _teams_payload():
+    return [
+        {"id": t.id, "name": t.name, "logo_url": getattr(t, "logo_url", None)}
+        async for t in Team.objects.all().order_by("name")
+    ]
+
+
+@require_GET
+@json_errors
+async def drivers_list(request):
+    career, not_modified = await _career(request, "drivers:{career}", season_scope)
+    if not_modified is not None:
+        return not_modified
+    return await acached_json(request, f"drivers:{career.id}", lambda: _drivers_payload(career),
+                              scope=season_scope(career.id))
+
+
+async def _drivers_payload(career: Career):
+    qs = career.drivers.select_related("team").all().order_by("-points", "-wins")
+    return [_driver_row(d) async for d in qs]
+
+
+def _driver_row(d) -> dict:
+    return {
+        "id": d.id,
+        "name": d.name,
+        "surname": d.surname,
+        "team": d.team.name if d.team_id else None,
+        "team_id": d.team_id,
+        "team_logo_url": getattr(d.team, "logo_url", None) if d.team_id else None,
+        "image_url": getattr(d, "image_url", None),
+        "image_key": getattr(d, "image_key", None),
+        "country": getattr(d, "country", None),
+        "number": getattr(d, "number", None),
+        "points": getattr(d, "points", 0),
+        "wins": getattr(d, "wins", 0),
+        "podiums": getattr(d, "podiums", 0),
+        "pole_positions": getattr(d, "pole_positions", 0),
+        "fastest_laps": getattr(d, "fastest_laps", 0),
+        "speed": getattr(d, "speed", None),
+        "racing": getattr(d, "racing", None),
+        "reaction": getattr(d, "reaction", None),
+        "experience": getattr(d, "experience", None),
+        "consistency": getattr(d, "consistency", None),
+        "error_rate": getattr(d, "error_rate", None),
+        "street_circuit_affinity": getattr(d, "street_affinity", getattr(d, "street_circuit_affinity", 0)),
+        "high_speed_circuit_affinity": getattr(d, "high_speed_affinity", getattr(d, "high_speed_circuit_affinity", 0)),
+        "wet_circuit_affinity": getattr(d, "wet_affinity", getattr(d, "wet_circuit_affinity", 0)),
+    }
+
+
+@require_GET
+@json_errors
+async def team_standings(request):
+    """
+    Championnat constructeurs : un GROUP BY par écurie sur Driver.
+    `?history=1` ajoute les points par session (GROUP BY sur SessionResult).
+    """
+    history = request.GET.get("history") in ("1", "true", "True", "yes")
+    career, not_modified = await _career(request, f"team_standings:{{career}}:{int(history)}", season_scope)
+    if not_modified is not None:
+        return not_modified
+    name = f"team_standings:{career.id}:{int(history)}"
+    return await acached_json(request, name, lambda: _team_standings_payload(career, history),
+                              scope=season_scope(career.id))
+
+
+async def _team_standings_payload(career: Career, history: bool):
+    qs = (
+        career.drivers.values("team_id", "team__name", "team__logo_url")
+        .annotate(points=Sum("points"), wins=Sum("wins"), podiums=Sum("podiums"),
+                  pole_positions=Sum("pole_positions"), fastest_laps=Sum("fastest_laps"),
+                  drivers=Count("id"))
+        .order_by("-points", "-wins", "-podiums", "team__name")
+    )
+    standings = [
+        {
+            "position": position,
+            "id": row["team_id"],
+            "name": row["team__name"],
+            "logo_url": row["team__logo_url"],
+            "points": row["points"],
+            "wins": row["wins"],
+            "podiums": row["podiums"],
+            "pole_positions": row["pole_positions"],
+            "fastest_laps": row["fastest_laps"],
+            "drivers": row["drivers"],
+        }
+        for position, row in enumerate([row async for row in qs], start=1)
+    ]
+    if not history:
+        return standings
+    return {"standings": standings, "history": await _team_history(career)}
+
+
+async def _team_history(career: Career) -> list:
+    """Points par écurie pour chaque session jouée qui en attribue (S, GP)."""
+    qs = (
+        SessionResult.objects.filter(session__career=career, session__session_type__in=("S", "GP"))
+        .values("session__index", "session__gp_name", "session__session_type", "driver__team_id")
+        .annotate(points=Sum("points_gained"))
+        .order_by("session__index", "-points", "driver__team_id")
+    )
+    rounds = []
+    async for row in qs:
+        if not rounds or rounds[-1]["index"] != row["session__index"]:
+            rounds.append({
+                "index": row["session__index"],
+                "gp_name": row["session__gp_name"],
+                "session_type": row["session__session_type"],
+                "teams": [],
+            })
+        rounds[-1]["teams"].append({"id": row["driver__team_id"], "points": row["points"]})
+    return rounds
+
+
+@require_GET
+@json_errors
+async def calendar_list(request):
+    career, not_modified = await _career(request, "calendar:{career}", season_scope)
+    if not_modified is not None:
+        return not_modified
+    return await acached_json(request, f"calendar:{career.id}", lambda: _calendar_payload(career),
+                              scope=season_scope(career.id))
+
+
+async def _calendar_payload(career: Career):
+    return [
+        {
+            "index": s.index,
+            "gp_name": s.gp_name,
+            "circuit_name": s.circuit_name,
+            "date": s.date.isoformat() if s.date else None,
+            "session_type": s.session_type,
+            "circuit_type": s.circuit_type,
+            "is_simulated": s.is_simulated,
+        }
+        async for s in career.sessions.all().order_by("index")
+    ]
+
+
+@require_GET
+@json_errors
+async def session_results(request, session_index: int):
+    """Résultats enregistrés d'une session : lecture seule, sans verrou ni transaction."""
+    career, not_modified = await _career(request, f"results:{{career}}:{session_index}", season_scope)
+    if not_modified is not None:
+        return not_modified
+
+    async def build():
+        return (await _stored_results(career, index=session_index))[0]
+
+    return await acached_json(request, f"results:{career.id}:{session_index}", build,
+                              scope=season_scope(career.id))
+
+
+@require_GET
+@json_errors
+async def weekend_results(request):
+    """Résultats enregistrés d'un week-end de GP (`?gp=<nom>`), session par session."""
+    gp_name = (request.GET.get("gp") or "").strip()
+    if not gp_name:
+        return JsonResponse({"detail": "Paramètre gp requis."}, status=400)
+    career, not_modified = await _career(request, f"results:{{career}}:gp:{name_part(gp_name)}", season_scope)
+    if not_modified is not None:
+        return not_modified
+
+    async def build():
+        return {"gp_name": gp_name, "sessions": await _stored_results(career, gp_name=gp_name)}
+
+    return await acached_json(request, f"results:{career.id}:gp:{name_part(gp_name)}", build,
+                              scope=season_scope(career.id))
+
+
+async def _stored_results(career: Career, **lookup) -> list:
+    """
+    Toutes les sessions ciblées, jouées ou non (FP et sessions à venir :
+    résultats vides), avec leurs résultats : une seule requête (jointure
+    résultats / driver / team).
+    """
+    rows = [row async for row in simulation.stored_results_query(career.sessions.filter(**lookup))]
+    if not rows:
+        raise Http404("Session introuvable.")
+    return simulation.stored_results(rows)
+
+
+@require_GET
+@json_errors
+async def budget_get(request):
+    career, not_modified = await _career(request, "budget:{career}", budget_scope)
+    if not_modified is not None:
+        return not_modified
+
+    async def build():
+        return {"budget": await budget.abalance(career.pk)}
+
+    return await acached_json(request, f"budget:{career.id}", build, scope=budget_scope(career.id))
+
+
+@require_GET
+@json_errors
+async def me(request):
+    user = authenticate(request)
+    if user is None:
+        return JsonResponse({"detail": "Authentication credentials were not provided."}, status=401)
+    not_modified = await anot_modified(request, f"me:{user.pk}", profile_scope(user.pk))
+    if not_modified is not None:
+        return not_modified
+
+    async def build():
+        account = await User.objects.filter(pk=user.pk, is_active=True).afirst()
+        if account is None:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        profile, _ = await Profile.objects.aget_or_create(user=account)
+        return {
+            "id": account.id,
+            "username": account.username,
+            "avatar_key": profile.avatar_key,
+            "avatar_url": profile.avatar_url,
+        }
+
+    return await acached_json(request, f"me:{user.pk}", build, scope=profile_scope(user.pk))
@@ -1,5 +1,7 @@
 # f1/auth_views.py
+from .cache import bump_version, profile_scope
 from .models import Profile
+from .services.careers import ensure_career
 
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
@@ -9,6 +11,7 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework_simplejwt.tokens import RefreshToken
 
 
@@ -42,6 +45,18 @@ def issue_tokens(user: User):
     }
 
 
+class LoginSerializer(TokenObtainPairSerializer):
+    """
+    Login JWT (/api/auth/login/, settings.SIMPLE_JWT) : crée aussi la partie
+    d'un joueur qui n'en a pas encore, les lectures n'en créant plus.
+    """
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        ensure_career(self.user)
+        return data
+
+
 # ==========================
 # LOGIN (NOUVEAU)
 # ==========================
@@ -65,6 +80,7 @@ def login(request):
         )
 
     profile, _ = Profile.objects.get_or_create(user=user)
+    ensure_career(user)
     tokens = issue_tokens(user)
 
     return Response(
@@ -78,23 +94,6 @@ def login(request):
     )
 
 
-# ==========================
-# ME
-# ==========================
-@api_view(["GET"])
-@permission_classes([IsAuthenticated])
-def me(request):
-    profile, _ = Profile.objects.get_or_create(user=request.user)
-    return Response(
-        {
-            "id": request.user.id,
-            "username": request.user.username,
-            "avatar_key": profile.avatar_key,
-            "avatar_url": profile.avatar_url,
-        }
-    )
-
-
 # ==========================
 # SET AVATAR
 # ==========================
@@ -109,6 +108,7 @@ def set_avatar(request):
     profile, _ = Profile.objects.get_or_create(user=request.user)
     profile.avatar_key = key
     profile.save(update_fields=["avatar_key"])
+    bump_version(profile_scope(request.user.id))
 
     return Response(
         {
@@ -149,6 +149,7 @@ def register(request):
     profile, _ = Profile.objects.get_or_create(user=user)
     profile.avatar_key = avatar_key
     profile.save(update_fields=["avatar_key"])
+    ensure_career(user)
 
     tokens = issue_tokens(user)
 
@@ -0,0 +1,207 @@
+"""
+Cache des lectures (drivers, teams, calendrier…) indexé par version.
+
+Chaque "scope" (ex: la saison d'une partie) a une version monotone stockée dans le cache
+Django. Les écritures la font avancer au commit (`bump_version`) ; les
+lectures mettent en cache les octets JSON déjà sérialisés sous la clé
+(nom, version). Une nouvelle version rend donc les anciennes entrées
+inaccessibles, sans invalidation explicite.
+
+La version est un timestamp en millisecondes (incrémenté si besoin) : elle
+sert aussi de date de dernière modification. Les réponses portent un ETag
+fort dérivé de (nom, version) et un Last-Modified : un client à jour reçoit
+un 304 sans requête DB ni sérialisation.
+
+Fonctionne avec n'importe quel backend de cache Django (locmem/fichier en
+local, backend partagé en production). `acached_json` est la variante des
+vues async (API async du cache, `build` coroutine).
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.renderers import JSONRenderer
+
+from .metrics import CACHE_REQUESTS
+
+
+# données partagées par toutes les parties (teams…)
+CATALOG = "catalog"
+
+
+def season_scope(career_id: int) -> str:
+    return f"season:{career_id}"
+
+
+def budget_scope(career_id: int) -> str:
+    return f"budget:{career_id}"
+
+
+def profile_scope(user_id: int) -> str:
+    return f"profile:{user_id}"
+
+
+def _version_key(scope: str) -> str:
+    return f"f1:version:{scope}"
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def get_version(scope: str) -> int:
+    key = _version_key(scope)
+    version = cache.get(key)
+    if version is None:
+        # clé absente (cache vidé / évincé) : repartir de "maintenant" garde
+        # la version strictement au-dessus de toute version déjà servie
+        cache.add(key, _now_ms(), None)
+        version = cache.get(key, _now_ms())
+    return version
+
+
+async def aget_version(scope: str) -> int:
+    key = _version_key(scope)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, _now_ms(), None)
+        version = await cache.aget(key, _now_ms())
+    return version
+
+
+def _bump(scope: str) -> int:
+    key = _version_key(scope)
+    now = _now_ms()
+    try:
+        # incr est atomique sur locmem/memcached/redis : deux commits
+        # concurrents obtiennent deux versions distinctes
+        version = cache.incr(key)
+    except ValueError:
+        cache.add(key, now, None)
+        return get_version(scope)
+
+    if version < now:
+        cache.set(key, now, None)
+        version = now
+    return version
+
+
+def bump_version(scope: str) -> None:
+    """
+    Fait avancer la version de `scope` quand la transaction courante commit
+    (immédiatement hors transaction).
+    """
+    transaction.on_commit(lambda: _bump(scope))
+
+
+def cached_json(request, name: str, build, scope: str) -> HttpResponse:
+    """
+    Réponse JSON servie depuis le cache pour la version courante de `scope`.
+
+    - If-None-Match / If-Modified-Since à jour -> 304, sans appeler `build`
+    - sinon octets en cache, et `build()` (requêtes DB + sérialisation)
+      seulement en cas de miss
+    """
+    version = get_version(scope)
+    etag, last_modified, not_modified = _conditional(request, name, version)
+    if not_modified is not None:
+        return not_modified
+
+    key = f"f1:response:{name}:{version}"
+    body = cache.get(key)
+    if body is None:
+        CACHE_REQUESTS.labels("response", "miss").inc()
+        body = JSONRenderer().render(build())
+        cache.set(key, body, settings.F1_READ_CACHE_TIMEOUT)
+    else:
+        CACHE_REQUESTS.labels("response", "hit").inc()
+
+    response = HttpResponse(body, content_type="application/json")
+    return _with_validators(response, etag, last_modified)
+
+
+async def acached_json(request, name: str, build, scope: str) -> HttpResponse:
+    """cached_json pour les vues async : `build` est une coroutine (ORM async)."""
+    version = await aget_version(scope)
+    etag, last_modified, not_modified = _conditional(request, name, version)
+    if not_modified is not None:
+        return not_modified
+
+    key = f"f1:response:{name}:{version}"
+    body = await cache.aget(key)
+    if body is None:
+        CACHE_REQUESTS.labels("response", "miss").inc()
+        body = JSONRenderer().render(await build())
+        await cache.aset(key, body, settings.F1_READ_CACHE_TIMEOUT)
+    else:
+        CACHE_REQUESTS.labels("response", "hit").inc()
+
+    response = HttpResponse(body, content_type="application/json")
+    return _with_validators(response, etag, last_modified)
+
+
+def _is_conditional(request) -> bool:
+    return "If-None-Match" in request.headers or "If-Modified-Since" in request.headers
+
+
+def not_modified(request, name: str, scope: str):
+    """
+    304 si le client a déjà (name, version courante de scope), sinon None.
+    Cache seul : à appeler avant toute requête DB (résolution de la partie…).
+    """
+    if not _is_conditional(request):
+        return None
+    return _conditional(request, name, get_version(scope))[2]
+
+
+async def anot_modified(request, name: str, scope: str):
+    if not _is_conditional(request):
+        return None
+    return _conditional(request, name, await aget_version(scope))[2]
+
+
+def _conditional(request, name: str, version: int):
+    """(etag, last_modified, réponse 304 ou None) pour (name, version)."""
+    etag = f'"{name}-{version}"'
+    last_modified = version // 1000
+
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        CACHE_REQUESTS.labels("response", "not_modified").inc()
+        not_modified = _with_validators(not_modified, etag, last_modified)
+    return etag, last_modified, not_modified
+
+
+def name_part(value: str) -> str:
+    """
+    Fragment de nom (clé de cache + ETag) pour une valeur libre venue du
+    client : haché, donc sans espaces ni caractères refusés par memcached.
+    """
+    return hashlib.blake2b(value.encode(), digest_size=8).hexdigest()
+
+
+def static_json(request, payload) -> HttpResponse:
+    """Réponse JSON conditionnelle pour un contenu constant (ETag = hash)."""
+    body = JSONRenderer().render(payload)
+    etag = '"{}"'.format(hashlib.blake2b(body, digest_size=8).hexdigest())
+
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return _with_validators(not_modified, etag)
+
+    return _with_validators(HttpResponse(body, content_type="application/json"), etag)
+
+
+def _with_validators(response, etag: str, last_modified: int | None = None):
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    # le navigateur garde la réponse mais revalide à chaque fois
+    response["Cache-Control"] = "private, no-cache"
+    patch_vary_headers(response, ("Authorization",))
+    return response
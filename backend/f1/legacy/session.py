@@ -1,144 +1,21 @@
 from datetime import date
-import random
 
 # ----------------------
-# HELPERS
-# ----------------------
-
-def clamp(v, lo=0, hi=100):
-    try:
-        v = int(v)
-    except Exception:
-        v = lo
-    return max(lo, min(hi, v))
-
-# ----------------------
-# CLASSES DE SESSIONS
+# SESSIONS
 # ----------------------
 
 class Session:
+    """
+    Session du calendrier (données seulement). Les règles de simulation
+    vivent dans f1.services (season.step / engine) : une seule source.
+    """
+
     def __init__(self, gp_name, circuit_name, session_date, session_type, circuit_type):
         self.gp_name = gp_name
         self.circuit_name = circuit_name
         self.date = session_date
         self.session_type = session_type  # "FP", "QS", "S", "QC", "GP"
         self.circuit_type = circuit_type  # "street", "high_speed", "wet"
-        self.results = []
-
-    def simulate(self, drivers):
-        raise NotImplementedError("Cette méthode doit être surchargée dans les sous-classes")
-
-    def _affinity_bonus(self, driver):
-        bonus = 0
-        if self.circuit_type == "street":
-            bonus += int(getattr(driver, "street_circuit_affinity", 0) or 0)
-        elif self.circuit_type == "high_speed":
-            bonus += int(getattr(driver, "high_speed_circuit_affinity", 0) or 0)
-        elif self.circuit_type == "wet":
-            bonus += int(getattr(driver, "wet_circuit_affinity", 0) or 0)
-        return bonus
-
-# --- Free Practice ---
-class FreePractice(Session):
-    def simulate(self, drivers):
-        results = []
-        for driver in drivers:
-            stats_boost = random.randint(1, 5) + self._affinity_bonus(driver)
-
-            # ✅ clamp pour éviter explosion
-            driver.speed = clamp(driver.speed + stats_boost)
-            driver.racing = clamp(driver.racing + stats_boost)
-            driver.reaction = clamp(driver.reaction + stats_boost)
-            driver.experience = clamp(driver.experience + (stats_boost // 2))
-
-            results.append({
-                "driver": driver,
-                "points_gained": 0,
-                "stats_gained": stats_boost
-            })
-
-        self.results = results
-        return results
-
-# --- Qualifying ---
-class Qualifying(Session):
-    def simulate(self, drivers):
-        results = []
-        for driver in drivers:
-            stats_boost = random.randint(3, 10)
-
-            # pénalité d'erreur
-            err = int(getattr(driver, "error_rate", 0) or 0)
-            if random.randint(1, 100) < err:
-                stats_boost = max(0, stats_boost - 5)
-
-            driver.speed = clamp(driver.speed + stats_boost)
-            driver.reaction = clamp(driver.reaction + stats_boost)
-
-            results.append({
-                "driver": driver,
-                "points_gained": 0,
-                "stats_gained": stats_boost
-            })
-
-        # Qualif : on ordonne par perf simulée (stats_gained)
-        results.sort(key=lambda r: r["stats_gained"], reverse=True)
-        self.results = results
-        return results
-
-# --- Sprint ---
-class Sprint(Session):
-    def simulate(self, drivers):
-        results = []
-        points_distribution = [10, 9, 8, 7, 6, 5, 4, 3, 2, 1]
-
-        # NOTE: si tu veux plus réaliste: pondère par stats plutôt que random()
-        drivers_sorted = sorted(drivers, key=lambda d: random.random())
-
-        for i, driver in enumerate(drivers_sorted):
-            stats_boost = random.randint(5, 12)
-            points = points_distribution[i] if i < len(points_distribution) else 0
-
-            driver.points = int(getattr(driver, "points", 0) or 0) + points
-            driver.speed = clamp(driver.speed + stats_boost)
-            driver.racing = clamp(driver.racing + stats_boost)
-
-            results.append({
-                "driver": driver,
-                "points_gained": points,
-                "stats_gained": stats_boost,
-                "position": i + 1,   # ✅ utile si tu veux renvoyer direct
-            })
-
-        self.results = results
-        return results
-
-# --- Grand Prix ---
-class GrandPrix(Session):
-    def simulate(self, drivers):
-        results = []
-        points_distribution = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
-
-        drivers_sorted = sorted(drivers, key=lambda d: random.random())
-
-        for i, driver in enumerate(drivers_sorted):
-            stats_boost = random.randint(5, 20)
-            points = points_distribution[i] if i < len(points_distribution) else 0
-
-            driver.points = int(getattr(driver, "points", 0) or 0) + points
-            driver.speed = clamp(driver.speed + stats_boost)
-            driver.racing = clamp(driver.racing + stats_boost)
-            driver.reaction = clamp(driver.reaction + stats_boost)
-
-            results.append({
-                "driver": driver,
-                "points_gained": points,
-                "stats_gained": stats_boost,
-                "position": i + 1,   # ✅ utile si tu veux renvoyer direct
-            })
-
-        self.results = results
-        return results
 
 # ----------------------
 # CALENDRIER DES GP
@@ -177,15 +54,15 @@ for gp in gp_list:
     base_date = gp["date"]
     if gp["has_sprint"]:
         season_calendar.extend([
-            FreePractice(gp["name"], gp["circuit"], base_date, "FP", gp["circuit_type"]),
-            Qualifying(gp["name"], gp["circuit"], base_date, "QS", gp["circuit_type"]),
-            Sprint(gp["name"], gp["circuit"], base_date, "S", gp["circuit_type"]),
-            Qualifying(gp["name"], gp["circuit"], base_date, "QC", gp["circuit_type"]),
-            GrandPrix(gp["name"], gp["circuit"], base_date, "GP", gp["circuit_type"]),
+            Session(gp["name"], gp["circuit"], base_date, "FP", gp["circuit_type"]),
+            Session(gp["name"], gp["circuit"], base_date, "QS", gp["circuit_type"]),
+            Session(gp["name"], gp["circuit"], base_date, "S", gp["circuit_type"]),
+            Session(gp["name"], gp["circuit"], base_date, "QC", gp["circuit_type"]),
+            Session(gp["name"], gp["circuit"], base_date, "GP", gp["circuit_type"]),
         ])
     else:
         season_calendar.extend([
-            FreePractice(gp["name"], gp["circuit"], base_date, "FP", gp["circuit_type"]),
-            Qualifying(gp["name"], gp["circuit"], base_date, "QC", gp["circuit_type"]),
-            GrandPrix(gp["name"], gp["circuit"], base_date, "GP", gp["circuit_type"]),
+            Session(gp["name"], gp["circuit"], base_date, "FP", gp["circuit_type"]),
+            Session(gp["name"], gp["circuit"], base_date, "QC", gp["circuit_type"]),
+            Session(gp["name"], gp["circuit"], base_date, "GP", gp["circuit_type"]),
         ])
\ No newline at end of file
@@ -0,0 +1,230 @@
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from ...legacy import session as legacy_session
+from ...models import Career, Driver, SeasonSession
+from ...services import engine, simulation
+from ...services.careers import baseline_drivers, driver_from_baseline
+from ...services.season import SeasonState, SessionSpec, step
+
+
+# cache isolé : le bench ne doit jamais écrire dans le cache partagé
+BENCH_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                            "LOCATION": "f1-bench"}}
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark simulation services and read endpoints on a throwaway test "
+        "database (or the pure engine with --engine-only). Saves/compares JSON baselines."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--drivers", default="22,200,2000", help="Comma-separated grid sizes.")
+        parser.add_argument("--calendar", type=int, default=len(legacy_session.season_calendar),
+                            help="Sessions in the season calendar.")
+        parser.add_argument("--sessions", type=int, default=10, help="Sessions simulated per measure.")
+        parser.add_argument("--repeat", type=int, default=3, help="Best of N for read endpoints / reset.")
+        parser.add_argument("--engine-only", action="store_true", help="Pure NumPy engine, no database.")
+        parser.add_argument("--seed", type=int, default=2026)
+        parser.add_argument("--save", help="Write results to this JSON file (baseline).")
+        parser.add_argument("--compare", help="Diff results against this JSON baseline.")
+
+    def handle(self, *args, **options):
+        sizes = [int(n) for n in options["drivers"].split(",") if n.strip()]
+        if not sizes or min(sizes) < 1:
+            raise CommandError("--drivers: at least one positive grid size.")
+
+        if options["engine_only"]:
+            results = {}
+            for n in sizes:
+                results.update(self.bench_engine(n, options))
+        else:
+            results = self.bench_database(sizes, options)
+
+        report = {
+            "meta": {
+                "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "database": "none" if options["engine_only"] else connection.vendor,
+                "calendar": options["calendar"],
+                "sessions": options["sessions"],
+            },
+            "results": results,
+        }
+
+        if options["compare"]:
+            with open(options["compare"]) as f:
+                self.compare(json.load(f)["results"], results)
+
+        if options["save"]:
+            with open(options["save"], "w") as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+            self.stdout.write(self.style.SUCCESS(f"Baseline saved to {options['save']}"))
+
+    # ---- mesures ----
+
+    def bench_engine(self, n: int, options) -> dict:
+        rng = np.random.default_rng(options["seed"])
+        state = SeasonState(np.arange(n), {
+            f: np.zeros(n, dtype=np.int64) if f in engine.RESULT_FIELDS else rng.integers(0, 10, size=n)
+            for f in engine.GRID_FIELDS
+        })
+        calendar = [SessionSpec.from_session(s, index=i) for i, s in enumerate(_calendar(options["calendar"]))]
+
+        t0 = time.perf_counter()
+        for session in calendar:
+            step(state, session, rng)
+        elapsed = time.perf_counter() - t0
+        peak = self.peak(lambda: step(state, SessionSpec(0, "GP", "street"), rng))
+
+        # course tour par tour (F1_RACE_MODE=laps), GP de 60 tours
+        race = SessionSpec(0, "GP", "street", laps=engine.RACE_LAPS["GP"])
+        t0 = time.perf_counter()
+        for _ in range(len(calendar)):
+            step(state, race, rng)
+        race_elapsed = time.perf_counter() - t0
+        race_peak = self.peak(lambda: step(state, race, rng))
+
+        return {
+            f"engine:{n}:run_session": self.report(
+                f"engine step  n={n}", elapsed / len(calendar), 0, peak),
+            f"engine:{n}:race_laps": self.report(
+                f"engine GP {race.laps} laps  n={n}", race_elapsed / len(calendar), 0, race_peak),
+        }
+
+    def bench_database(self, sizes, options) -> dict:
+        results = {}
+        old_name = connection.settings_dict["NAME"]
+        # base de test jetable (mémoire sous SQLite) : aucune donnée réelle touchée
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            with override_settings(CACHES=BENCH_CACHES):
+                for n in sizes:
+                    results.update(self.bench_grid(n, options))
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+        return results
+
+    def bench_grid(self, n: int, options) -> dict:
+        career = _make_career(n, options["calendar"])
+        count = min(options["sessions"], options["calendar"])
+        results = {}
+
+        # simulate_next : sessions jouées dans l'ordre (la dernière sert au pic mémoire)
+        stats = [self.measure(lambda: simulation.simulate_next(career)) for _ in range(count)]
+        peak = self.peak(lambda: simulation.simulate_next(career))
+        results[f"db:{n}:simulate_next"] = self.report(f"simulate_next      n={n}", *_average(stats), peak)
+
+        # simulate_session(force=True) : re-run d'une session déjà jouée
+        stats = [self.measure(lambda i=i: simulation.simulate_session(career, i, force=True))
+                 for i in range(count)]
+        peak = self.peak(lambda: simulation.simulate_session(career, 0, force=True))
+        results[f"db:{n}:simulate_session"] = self.report(f"simulate_session   n={n}", *_average(stats), peak)
+
+        for name, url in (("drivers_list", "/api/drivers/"), ("calendar_list", "/api/season/calendar/")):
+            client = Client(HTTP_HOST="localhost")
+
+            def cold():
+                cache.clear()
+                return client.get(url)
+
+            def warm():
+                return client.get(url)
+
+            for label, fn in (("cold", cold), ("warm", warm)):
+                stats = [self.measure(fn) for _ in range(options["repeat"])]
+                results[f"db:{n}:{name}:{label}"] = self.report(
+                    f"{name} ({label})".ljust(18) + f" n={n}", *_best(stats), self.peak(fn))
+
+        reset = lambda: simulation.reset_season(career)  # noqa: E731
+        stats = [self.measure(reset) for _ in range(options["repeat"])]
+        results[f"db:{n}:reset_season"] = self.report(f"reset_season       n={n}", *_best(stats), self.peak(reset))
+
+        # les requêtes anonymes lisent la partie par défaut : une seule à la fois
+        career.delete()
+        return results
+
+    def measure(self, fn) -> tuple:
+        """(secondes, requêtes) d'un appel, sans tracemalloc (qui fausse le temps)."""
+        with CaptureQueriesContext(connection) as queries:
+            t0 = time.perf_counter()
+            response = fn()
+            elapsed = time.perf_counter() - t0
+
+        if getattr(response, "status_code", 200) != 200:
+            raise CommandError(f"Unexpected HTTP {response.status_code}")
+        return elapsed, len(queries)
+
+    def peak(self, fn) -> int:
+        """Pic d'allocations Python (octets) d'un appel supplémentaire, tracé à part."""
+        tracemalloc.start()
+        try:
+            fn()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def report(self, label: str, seconds: float, queries: float, peak: int) -> dict:
+        self.stdout.write(
+            f"{label:<28} {seconds * 1000:10.2f} ms  {queries:6.1f} queries  {peak / 1024:10.1f} KiB peak"
+        )
+        return {"ms": round(seconds * 1000, 3), "queries": queries, "peak_kib": round(peak / 1024, 1)}
+
+    def compare(self, baseline: dict, results: dict) -> None:
+        self.stdout.write("\nComparison with baseline (ms / queries):")
+        for key, current in results.items():
+            before = baseline.get(key)
+            if before is None:
+                self.stdout.write(f"{key:<36} new")
+                continue
+            delta = (current["ms"] - before["ms"]) / before["ms"] * 100 if before["ms"] else 0.0
+            line = (f"{key:<36} {before['ms']:10.2f} -> {current['ms']:10.2f} ms ({delta:+6.1f}%)  "
+                    f"{before['queries']:6.1f} -> {current['queries']:6.1f} queries")
+            style = self.style.ERROR if delta > 10 or current["queries"] > before["queries"] else str
+            self.stdout.write(style(line))
+
+
+def _calendar(length: int) -> list:
+    base = legacy_session.season_calendar
+    return [base[i % len(base)] for i in range(length)]
+
+
+def _make_career(n: int, calendar_length: int) -> Career:
+    """Partie de `n` drivers (baseline f1.legacy dupliquée) et `calendar_length` sessions."""
+    career = Career.objects.create(name=f"bench {n}")
+    base = baseline_drivers()
+
+    drivers = []
+    for i in range(n):
+        b = base[i % len(base)]
+        copy = i // len(base)
+        overrides = {"surname": f"{b.surname}{copy}", "number": b.number + 100 * copy} if copy else {}
+        drivers.append(driver_from_baseline(career, b, **overrides))
+    Driver.objects.bulk_create(drivers, batch_size=500)
+
+    SeasonSession.objects.bulk_create([
+        SeasonSession(career=career, index=index, gp_name=s.gp_name, circuit_name=s.circuit_name,
+                      date=s.date, session_type=s.session_type, circuit_type=s.circuit_type)
+        for index, s in enumerate(_calendar(calendar_length))
+    ])
+    return career
+
+
+def _average(stats) -> tuple:
+    return sum(s[0] for s in stats) / len(stats), sum(s[1] for s in stats) / len(stats)
+
+
+def _best(stats) -> tuple:
+    return min(s[0] for s in stats), min(s[1] for s in stats)
@@ -0,0 +1,165 @@
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+SERVERS = {
+    "wsgi": ["config.wsgi:application", "--worker-class", "gthread", "--threads", "8"],
+    "asgi": ["config.asgi:application", "--worker-class", "uvicorn_worker.UvicornWorker"],
+}
+DEFAULT_PATHS = "/api/health/,/api/teams/,/api/drivers/,/api/season/calendar/,/api/season/budget/"
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark concurrent read throughput of the same app served by gunicorn under WSGI "
+        "(gthread workers) and ASGI (uvicorn workers, as deployed). Uses the configured database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--servers", default="wsgi,asgi", help="Comma-separated: wsgi, asgi.")
+        parser.add_argument("--workers", type=int, default=2, help="gunicorn workers per server.")
+        parser.add_argument("--concurrency", default="1,16,64",
+                            help="Comma-separated concurrent client counts.")
+        parser.add_argument("--requests", type=int, default=2000, help="Requests per measure.")
+        parser.add_argument("--paths", default=DEFAULT_PATHS,
+                            help="Comma-separated GET paths, requested round-robin.")
+        parser.add_argument("--save", help="Write results to this JSON file.")
+
+    def handle(self, *args, **options):
+        servers = [s.strip() for s in options["servers"].split(",") if s.strip()]
+        unknown = set(servers) - set(SERVERS)
+        if unknown:
+            raise CommandError(f"Unknown server(s): {', '.join(sorted(unknown))}")
+        levels = [int(c) for c in options["concurrency"].split(",") if c.strip()]
+        paths = [p.strip() for p in options["paths"].split(",") if p.strip()]
+
+        results = {}
+        for name in servers:
+            port = _free_port()
+            proc = _start(name, port, options["workers"])
+            try:
+                _wait_ready(port, proc)
+                # chauffe : connexions DB, caches de réponse remplis
+                asyncio.run(_load(port, paths, 16, len(paths) * 16))
+
+                for concurrency in levels:
+                    stats = asyncio.run(_load(port, paths, concurrency, options["requests"]))
+                    results[f"{name}:c{concurrency}"] = stats
+                    self.stdout.write(
+                        f"{name:<5} c={concurrency:<4} {stats['rps']:>9.0f} req/s   "
+                        f"p50 {stats['p50_ms']:>7.2f} ms   p99 {stats['p99_ms']:>7.2f} ms   "
+                        f"errors {stats['errors']}"
+                    )
+            finally:
+                proc.terminate()
+                proc.wait(timeout=30)
+
+        if options["save"]:
+            report = {"workers": options["workers"], "paths": paths, "results": results}
+            with open(options["save"], "w") as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+            self.stdout.write(self.style.SUCCESS(f"Results saved to {options['save']}"))
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start(name: str, port: int, workers: int) -> subprocess.Popen:
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings")}
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", *SERVERS[name],
+         "--bind", f"127.0.0.1:{port}", "--workers", str(workers), "--log-level", "warning"],
+        cwd=Path(settings.BASE_DIR), env=env,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def _wait_ready(port: int, proc: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise CommandError(f"gunicorn exited with code {proc.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise CommandError(f"gunicorn not listening on port {port} after {timeout:.0f}s")
+
+
+async def _load(port: int, paths: list, concurrency: int, total: int) -> dict:
+    """`concurrency` clients (keep-alive si le serveur l'accepte), `total` GET round-robin sur `paths`."""
+    counter = iter(range(total))
+    latencies, errors = [], 0
+
+    async def client():
+        nonlocal errors
+        reader = writer = None
+        try:
+            for i in counter:
+                path = paths[i % len(paths)]
+                t0 = time.perf_counter()
+                if writer is None:
+                    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+                await writer.drain()
+                status, keep_alive = await _read_response(reader)
+                latencies.append(time.perf_counter() - t0)
+                if status != 200:
+                    errors += 1
+                if not keep_alive:
+                    # les workers sync de gunicorn ferment après chaque réponse
+                    writer.close()
+                    writer = None
+        finally:
+            if writer is not None:
+                writer.close()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - t0
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+async def _read_response(reader) -> tuple:
+    """Lit une réponse HTTP/1.1 (Content-Length ou chunked) -> (status, keep-alive)."""
+    status = int((await reader.readline()).split()[1])
+    length, chunked, keep_alive = 0, False, True
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        name = name.strip().lower()
+        if name == "content-length":
+            length = int(value)
+        elif name == "transfer-encoding" and "chunked" in value.lower():
+            chunked = True
+        elif name == "connection" and "close" in value.lower():
+            keep_alive = False
+
+    if not chunked:
+        await reader.readexactly(length)
+        return status, keep_alive
+
+    while size := int((await reader.readline()).split(b";")[0], 16):
+        await reader.readexactly(size + 2)
+    await reader.readline()
+    return status, keep_alive
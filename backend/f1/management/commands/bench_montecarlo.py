@@ -0,0 +1,79 @@
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from ...services import engine, montecarlo, parallel
+
+
+class Command(BaseCommand):
+    help = "Benchmark Monte Carlo (pure NumPy, no DB) across process-pool worker counts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=100_000, help="Simulated seasons per measure.")
+        parser.add_argument("--drivers", type=int, default=22)
+        parser.add_argument("--sessions", type=int, default=84, help="Remaining sessions to replay.")
+        parser.add_argument(
+            "--workers",
+            default="1,2,4,8",
+            help="Comma-separated worker counts to compare (0 = all cores).",
+        )
+        parser.add_argument("--seed", type=int, default=2026)
+        parser.add_argument("--laps", action="store_true", help="Lap-by-lap races (F1_RACE_MODE=laps).")
+        parser.add_argument("--repeat", type=int, default=3, help="Best of N per worker count.")
+
+    def handle(self, *args, **options):
+        runs = options["runs"]
+        seed = options["seed"]
+
+        n = options["drivers"]
+        rng = np.random.default_rng(seed)
+        grid = {
+            f: np.zeros(n, dtype=np.int64) if f in engine.RESULT_FIELDS else rng.integers(0, 10, size=n)
+            for f in engine.GRID_FIELDS
+        }
+
+        pattern = [("FP", "street"), ("QC", "street"), ("GP", "street"),
+                   ("FP", "high_speed"), ("QS", "high_speed"), ("S", "high_speed"),
+                   ("QC", "high_speed"), ("GP", "high_speed")]
+        schedule = [
+            (session_type, circuit_type, engine.RACE_LAPS.get(session_type) if options["laps"] else None)
+            for session_type, circuit_type in (pattern[i % len(pattern)] for i in range(options["sessions"]))
+        ]
+
+        counts = [parallel.worker_count(int(w)) for w in options["workers"].split(",") if w.strip()]
+
+        self.stdout.write(
+            f"Monte Carlo: {runs} runs x {n} drivers x {len(schedule)} sessions "
+            f"({len(montecarlo.chunk_sizes(runs))} chunks of {montecarlo.CHUNK_RUNS})"
+        )
+
+        # un seul pool, à la taille du plus grand nombre de workers mesuré
+        parallel.shutdown_pool()
+        parallel.get_pool(max(counts))
+
+        reference = None
+        baseline = None
+        for workers in counts:
+            # pool chaud : le coût de démarrage des process n'est pas mesuré
+            montecarlo.simulate_runs(grid, schedule, min(runs, montecarlo.CHUNK_RUNS * workers),
+                                     seed=seed, workers=workers)
+
+            best = float("inf")
+            for _ in range(options["repeat"]):
+                t0 = time.perf_counter()
+                totals = montecarlo.simulate_runs(grid, schedule, runs, seed=seed, workers=workers)
+                best = min(best, time.perf_counter() - t0)
+
+            if reference is None:
+                reference = totals
+                baseline = best
+            same = all(np.array_equal(reference[k], totals[k]) for k in reference)
+
+            self.stdout.write(
+                f"workers={workers:<3} {best:8.3f}s  "
+                f"{runs / best:10.0f} runs/s  speedup x{baseline / best:5.2f}  "
+                f"identical={'yes' if same else 'NO'}"
+            )
+
+        parallel.shutdown_pool()
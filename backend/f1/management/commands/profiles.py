@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...profiling import stored_profiles, summary
+
+
+class Command(BaseCommand):
+    help = "List, inspect or clear the cProfile ring written by profiled simulation requests."
+
+    def add_arguments(self, parser):
+        parser.add_argument("name", nargs="?", help="Profile to inspect (file name, prefix, or 'last').")
+        parser.add_argument("--sort", default="cumulative", help="pstats sort key (cumulative, tottime, calls...).")
+        parser.add_argument("--limit", type=int, default=40, help="Lines of stats to print.")
+        parser.add_argument("--clear", action="store_true", help="Delete every stored profile.")
+
+    def handle(self, *args, **options):
+        profiles = stored_profiles()
+
+        if options["clear"]:
+            for path in profiles:
+                path.unlink(missing_ok=True)
+            self.stdout.write(self.style.SUCCESS(f"{len(profiles)} profile(s) deleted."))
+            return
+
+        name = options["name"]
+        if not name:
+            if not profiles:
+                self.stdout.write("No stored profile.")
+            for path in profiles:
+                self.stdout.write(f"{path.name:<64} {path.stat().st_size / 1024:8.1f} KiB")
+            return
+
+        matches = profiles[-1:] if name == "last" else [p for p in profiles if p.name.startswith(name)]
+        if len(matches) != 1:
+            raise CommandError(f"{len(matches)} profile(s) match '{name}'.")
+
+        self.stdout.write(summary(matches[0], sort=options["sort"], limit=options["limit"]))
@@ -0,0 +1,63 @@
+import os
+import signal
+import socket
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ...services import jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Background job worker: claims pending jobs from the database queue and runs them. "
+        "No external broker; start as many workers as needed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drain the queue, then exit.")
+        parser.add_argument("--poll", type=float, default=1.0, help="Seconds between polls when idle.")
+        parser.add_argument("--max-jobs", type=int, default=0, help="Exit after N jobs (0 = no limit).")
+        parser.add_argument("--stale-after", type=int, default=600,
+                            help="Requeue jobs left running longer than this many seconds (dead worker).")
+
+    def handle(self, *args, **options):
+        worker = f"{socket.gethostname()}:{os.getpid()}"
+        stale_after = timedelta(seconds=options["stale_after"])
+
+        # SIGTERM/SIGINT : on termine la tâche en cours, puis on sort
+        self.stopping = False
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, self.stop)
+
+        self.stdout.write(f"Worker {worker} started.")
+        done = 0
+        while not self.stopping:
+            close_old_connections()
+            jobs.requeue_stale(stale_after)
+
+            job = jobs.claim(worker)
+            if job is None:
+                if options["once"]:
+                    break
+                time.sleep(options["poll"])
+                continue
+
+            t0 = time.perf_counter()
+            job = jobs.run(job)
+            style = self.style.SUCCESS if job.status == job.DONE else self.style.ERROR
+            self.stdout.write(style(
+                f"Job {job.id} {job.kind} (career {job.career_id}): {job.status} "
+                f"in {time.perf_counter() - t0:.2f}s"
+            ))
+
+            done += 1
+            if options["max_jobs"] and done >= options["max_jobs"]:
+                break
+
+        self.stdout.write(f"Worker {worker} stopped after {done} job(s).")
+
+    def stop(self, signum, frame):
+        self.stopping = True
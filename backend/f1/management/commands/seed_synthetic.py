@@ -0,0 +1,147 @@
+import time
+from datetime import timedelta
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max, Min
+
+from ...cache import CATALOG, bump_version
+from ...legacy import session as legacy_session
+from ...models import Career, Driver, DriverBaseline, Profile, SeasonSession, Team
+from ...services import simulation
+from ...services.careers import BASELINE_FIELDS
+
+
+TEAM_PREFIX = "Synthetic Team"
+CAREER_PREFIX = "Synthetic"
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate large synthetic careers (thousands of drivers, many teams, multi-season "
+        "calendars, optional pre-simulated results) for load tests and benchmarks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--careers", type=int, default=1)
+        parser.add_argument("--drivers", type=int, default=2000, help="Drivers per career.")
+        parser.add_argument("--teams", type=int, default=100)
+        parser.add_argument("--seasons", type=int, default=1, help="Calendar length, in 2026 seasons.")
+        parser.add_argument("--simulate", type=int, default=0,
+                            help="Sessions simulated up front in each career (0 = none, -1 = all).")
+        parser.add_argument("--owner", default="synthetic",
+                            help="Username owning the careers (created if needed, no password).")
+        parser.add_argument("--seed", type=int, default=2026)
+        parser.add_argument("--wipe", action="store_true", help="Delete previous synthetic careers first.")
+
+    def handle(self, *args, **options):
+        if options["drivers"] < 1 or options["teams"] < 1 or options["seasons"] < 1:
+            raise CommandError("--drivers, --teams and --seasons must be positive.")
+
+        rng = np.random.default_rng(options["seed"])
+        t0 = time.perf_counter()
+
+        with transaction.atomic():
+            if options["wipe"]:
+                deleted, _ = Career.objects.filter(name__startswith=CAREER_PREFIX).delete()
+                self.stdout.write(self.style.WARNING(f"Deleted {deleted} synthetic rows."))
+
+            profile = _owner_profile(options["owner"])
+            teams = _teams(options["teams"])
+            calendar = _calendar(options["seasons"])
+
+            careers = []
+            for _ in range(options["careers"]):
+                career = Career.objects.create(
+                    profile=profile,
+                    name=f"{CAREER_PREFIX} {options['drivers']}x{len(calendar)}",
+                )
+                _drivers(career, options["drivers"], teams, rng)
+                SeasonSession.objects.bulk_create(
+                    [SeasonSession(career=career, index=i, **fields) for i, fields in enumerate(calendar)],
+                    batch_size=BATCH_SIZE,
+                )
+                careers.append(career)
+
+        bump_version(CATALOG)
+
+        # chaque partie simulée dans sa propre transaction (lock de partie)
+        simulate = options["simulate"]
+        simulated = len(calendar) if simulate < 0 else min(simulate, len(calendar))
+        if simulated:
+            for career in careers:
+                simulation.simulate_until(career, target_index=simulated - 1)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {len(careers)} career(s) owned by '{options['owner']}' "
+            f"(ids: {', '.join(str(c.id) for c in careers)}): "
+            f"{options['drivers']} drivers, {len(teams)} teams, {len(calendar)} sessions, "
+            f"{simulated} simulated "
+            f"in {time.perf_counter() - t0:.1f}s"
+        ))
+
+
+def _owner_profile(username: str) -> Profile:
+    user, created = get_user_model().objects.get_or_create(username=username)
+    if created:
+        user.set_unusable_password()
+        user.save(update_fields=["password"])
+    profile, _ = Profile.objects.get_or_create(user=user)
+    return profile
+
+
+def _teams(count: int) -> list:
+    names = [f"{TEAM_PREFIX} {i:03d}" for i in range(1, count + 1)]
+    Team.objects.bulk_create([Team(name=n) for n in names], ignore_conflicts=True, batch_size=BATCH_SIZE)
+    return list(Team.objects.filter(name__in=names).order_by("name"))
+
+
+def _calendar(seasons: int) -> list:
+    """Calendrier 2026 répété `seasons` fois (dates décalées de 52 semaines par saison)."""
+    calendar = []
+    for season in range(seasons):
+        shift = timedelta(weeks=52 * season)
+        for s in legacy_session.season_calendar:
+            calendar.append({
+                "gp_name": s.gp_name if season == 0 else f"{s.gp_name} {2026 + season}",
+                "circuit_name": s.circuit_name,
+                "date": s.date + shift,
+                "session_type": s.session_type,
+                "circuit_type": s.circuit_type,
+            })
+    return calendar
+
+
+def _drivers(career: Career, count: int, teams: list, rng) -> None:
+    """Stats tirées uniformément dans les bornes observées dans la baseline."""
+    agg = DriverBaseline.objects.aggregate(
+        **{f"{f}_min": Min(f) for f in BASELINE_FIELDS},
+        **{f"{f}_max": Max(f) for f in BASELINE_FIELDS},
+    )
+    bounds = {
+        f: (agg[f"{f}_min"], agg[f"{f}_max"]) if agg[f"{f}_min"] is not None else (0, 10)
+        for f in BASELINE_FIELDS
+    }
+
+    stats = {f: rng.integers(lo, hi + 1, size=count).tolist() for f, (lo, hi) in bounds.items()}
+    team_index = rng.integers(0, len(teams), size=count).tolist()
+
+    Driver.objects.bulk_create(
+        [
+            Driver(
+                career=career,
+                surname=f"Driver{i:05d}",
+                name="Synthetic",
+                team=teams[team_index[i]],
+                country="XX",
+                number=i + 1,
+                image_key=None,
+                **{f: stats[f][i] for f in BASELINE_FIELDS},
+            )
+            for i in range(count)
+        ],
+        batch_size=BATCH_SIZE,
+    )
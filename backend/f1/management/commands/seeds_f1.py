@@ -1,19 +1,29 @@
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
-from ...models import Team, Driver, SeasonSession, SessionResult
+from ...cache import CATALOG, bump_version, season_scope
+from ...models import Career, Team, Driver, DriverBaseline, SeasonSession, SessionResult
 from ...legacy import driver as legacy_drivers
 from ...legacy import session as legacy_session
+from ...services.careers import BASELINE_FIELDS, driver_from_baseline, sync_baselines
+from ...services.engine import RESULT_FIELDS
+
+
+# colonnes réécrites quand un driver existe déjà (stats baseline, résultats à 0)
+DRIVER_SEED_FIELDS = [
+    "baseline", "team", "country", "number", "image_url", "image_key",
+    *BASELINE_FIELDS, *RESULT_FIELDS,
+]
 
 
 class Command(BaseCommand):
-    help = "Seed drivers and season calendar into database (from f1.legacy.*)."
+    help = "Seed drivers and season calendar of the default career (from f1.legacy.*)."
 
     def add_arguments(self, parser):
         parser.add_argument(
             "--wipe",
             action="store_true",
-            help="Wipe existing F1 data (drivers/teams/sessions/results) before seeding.",
+            help="Wipe existing F1 data (careers/drivers/baselines/teams/sessions/results) before seeding.",
         )
 
     @transaction.atomic
@@ -25,85 +35,68 @@ class Command(BaseCommand):
             SessionResult.objects.all().delete()
             SeasonSession.objects.all().delete()
             Driver.objects.all().delete()
+            Career.objects.all().delete()
+            DriverBaseline.objects.all().delete()
             Team.objects.all().delete()
 
+        # les parties des joueurs sont créées à la demande (services.careers) ;
+        # le seed ne remplit que la partie par défaut
+        career = Career.default()
+
+        self.stdout.write("Seeding driver baselines…")
+        baselines = {(b.surname, b.name, b.number): b for b in sync_baselines()}
+
         self.stdout.write("Seeding drivers…")
-        drivers_count = self.seed_drivers()
+        drivers_count = self.seed_drivers(career, baselines)
 
         self.stdout.write("Seeding season calendar…")
-        sessions_count = self.seed_calendar()
+        sessions_count = self.seed_calendar(career)
+
+        bump_version(CATALOG)
+        bump_version(season_scope(career.id))
 
         self.stdout.write(self.style.SUCCESS(
             f"Seed completed ✅ Drivers: {drivers_count} | Sessions: {sessions_count}"
         ))
 
-    def seed_drivers(self) -> int:
+    def seed_drivers(self, career: Career, baselines: dict) -> int:
         if not hasattr(legacy_drivers, "drivers"):
             raise RuntimeError("f1/legacy/drivers.py must expose a variable named `drivers`")
 
-        created = 0
-
-        for d in legacy_drivers.drivers:
-            team_obj, _ = Team.objects.get_or_create(
-                name=d.team,
-                defaults={"logo_url": None}
-            )
-
-            image_key = f"{d.surname.lower()}_{d.number}"
-
-            Driver.objects.update_or_create(
-                surname=d.surname,
-                name=d.name,
-                defaults={
-                    "team": team_obj,
-                    "country": d.country,
-                    "number": d.number,
-
-                    "image_url": None,   # tu gères les vraies images côté front
-                    "image_key": image_key,
-
-                    "speed": d.speed,
-                    "racing": d.racing,
-                    "reaction": d.reaction,
-                    "experience": d.experience,
-
-                    "consistency": d.consistency,
-                    "error_rate": d.error_rate,
-
-                    "street_affinity": getattr(d, "street_circuit_affinity", 0),
-                    "high_speed_affinity": getattr(d, "high_speed_circuit_affinity", 0),
-                    "wet_affinity": getattr(d, "wet_circuit_affinity", 0),
-
-                    "points": d.points,
-                    "wins": d.wins,
-                    "podiums": d.podiums,
-                    "pole_positions": d.pole_positions,
-                    "fastest_laps": d.fastest_laps,
-                }
-            )
-
-            created += 1
-
-        return created
+        # upsert groupé : 1 requête, relançable sans doublon
+        drivers = [
+            driver_from_baseline(career, baselines[(d.surname, d.name, d.number)])
+            for d in legacy_drivers.drivers
+        ]
+        Driver.objects.bulk_create(
+            drivers,
+            update_conflicts=True,
+            unique_fields=["career", "surname", "name"],
+            update_fields=DRIVER_SEED_FIELDS,
+        )
+        return len(drivers)
 
-    def seed_calendar(self) -> int:
+    def seed_calendar(self, career: Career) -> int:
         if not hasattr(legacy_session, "season_calendar"):
             raise RuntimeError("f1/legacy/session.py must expose a variable named `season_calendar`")
 
-        created = 0
-
-        for index, s in enumerate(legacy_session.season_calendar):
-            SeasonSession.objects.update_or_create(
+        sessions = [
+            SeasonSession(
+                career=career,
                 index=index,
-                defaults={
-                    "gp_name": s.gp_name,
-                    "circuit_name": s.circuit_name,
-                    "date": s.date,
-                    "session_type": s.session_type,
-                    "circuit_type": s.circuit_type,
-                    "is_simulated": False,
-                }
+                gp_name=s.gp_name,
+                circuit_name=s.circuit_name,
+                date=s.date,
+                session_type=s.session_type,
+                circuit_type=s.circuit_type,
+                is_simulated=False,
             )
-            created += 1
-
-        return created
\ No newline at end of file
+            for index, s in enumerate(legacy_session.season_calendar)
+        ]
+        SeasonSession.objects.bulk_create(
+            sessions,
+            update_conflicts=True,
+            unique_fields=["career", "index"],
+            update_fields=["gp_name", "circuit_name", "date", "session_type", "circuit_type", "is_simulated"],
+        )
+        return len(sessions)
@@ -0,0 +1,108 @@
+"""
+Métriques Prometheus (format texte, endpoint /metrics).
+
+Les métriques vivent dans le processus (prometheus_client). Avec plusieurs
+workers gunicorn, PROMETHEUS_MULTIPROC_DIR (créé vide au démarrage, voir
+entrypoint.sh) fait écrire chaque worker dans ses propres fichiers, et
+/metrics agrège tous les workers de l'instance. Chaque instance derrière
+le load balancer est scrapée séparément.
+"""
+import os
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+    multiprocess,
+)
+
+
+REQUESTS = Counter(
+    "f1_http_requests_total", "Requêtes HTTP par route.",
+    ["route", "method", "status"],
+)
+REQUEST_LATENCY = Histogram(
+    "f1_http_request_duration_seconds", "Latence des requêtes HTTP par route.",
+    ["route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+SIMULATED_SESSIONS = Counter(
+    "f1_simulated_sessions_total", "Sessions simulées (commitées) par type.",
+    ["session_type"],
+)
+LOCK_WAIT = Histogram(
+    "f1_career_lock_wait_seconds", "Attente du verrou de partie (select_for_update).",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+CACHE_REQUESTS = Counter(
+    "f1_cache_requests_total", "Lectures de cache par cache et résultat.",
+    ["cache", "result"],
+)
+BUDGET_AWARDED = Counter(
+    "f1_budget_awarded_total", "Budget attribué (somme des gains).",
+)
+JOBS = Counter(
+    "f1_jobs_total", "Tâches de fond soumises (pending) et terminées (done/failed) par type.",
+    ["kind", "status"],
+)
+
+
+def metrics_view(request):
+    """
+    Exposition Prometheus. Si settings.F1_METRICS_TOKEN est défini, exige
+    `Authorization: Bearer <token>`.
+    """
+    token = getattr(settings, "F1_METRICS_TOKEN", "")
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        return HttpResponse(status=401)
+
+    registry = REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
+
+
+class MetricsMiddleware:
+    """Compteur + histogramme de latence par nom de route (f1/urls.py)."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "F1_METRICS", True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        t0 = time.perf_counter()
+        response = self.get_response(request)
+        return self._record(request, response, time.perf_counter() - t0)
+
+    async def __acall__(self, request):
+        t0 = time.perf_counter()
+        response = await self.get_response(request)
+        return self._record(request, response, time.perf_counter() - t0)
+
+    def _record(self, request, response, elapsed: float):
+        match = getattr(request, "resolver_match", None)
+        # nom de route (cardinalité bornée), jamais le chemin brut
+        route = (match.url_name or match.view_name) if match else "unmatched"
+
+        REQUESTS.labels(route, request.method, str(response.status_code)).inc()
+        REQUEST_LATENCY.labels(route).observe(elapsed)
+        return response
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('f1', '0004_gamestate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamestate',
+            name='season_seed',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='seasonsession',
+            name='seed',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,33 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('f1', '0005_season_seed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Career',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(default='Saison 2026', max_length=120)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('budget', models.BigIntegerField(default=0)),
+                ('season_seed', models.BigIntegerField(blank=True, null=True)),
+                ('profile', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='careers', to='f1.profile')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='driver',
+            name='career',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='drivers', to='f1.career'),
+        ),
+        migrations.AddField(
+            model_name='seasonsession',
+            name='career',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='sessions', to='f1.career'),
+        ),
+    ]
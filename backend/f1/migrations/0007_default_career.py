@@ -0,0 +1,43 @@
+from django.db import migrations
+
+
+def forwards(apps, schema_editor):
+    """La saison globale existante devient la partie par défaut (profile=None)."""
+    Career = apps.get_model('f1', 'Career')
+    Driver = apps.get_model('f1', 'Driver')
+    GameState = apps.get_model('f1', 'GameState')
+    SeasonSession = apps.get_model('f1', 'SeasonSession')
+
+    state = GameState.objects.filter(pk=1).first()
+    if state is None and not Driver.objects.exists() and not SeasonSession.objects.exists():
+        return
+
+    career = Career.objects.create(
+        name='Partie par défaut',
+        budget=state.budget if state else 0,
+        season_seed=state.season_seed if state else None,
+    )
+    Driver.objects.filter(career__isnull=True).update(career=career)
+    SeasonSession.objects.filter(career__isnull=True).update(career=career)
+
+
+def backwards(apps, schema_editor):
+    Career = apps.get_model('f1', 'Career')
+    GameState = apps.get_model('f1', 'GameState')
+
+    career = Career.objects.filter(profile__isnull=True).order_by('id').first()
+    if career is not None:
+        GameState.objects.update_or_create(
+            pk=1, defaults={'budget': career.budget, 'season_seed': career.season_seed},
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('f1', '0006_career'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
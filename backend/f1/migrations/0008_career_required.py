@@ -0,0 +1,34 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('f1', '0007_default_career'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='driver',
+            name='career',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='drivers', to='f1.career'),
+        ),
+        migrations.AlterField(
+            model_name='seasonsession',
+            name='career',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sessions', to='f1.career'),
+        ),
+        migrations.AlterField(
+            model_name='seasonsession',
+            name='index',
+            field=models.IntegerField(),
+        ),
+        migrations.AddConstraint(
+            model_name='seasonsession',
+            constraint=models.UniqueConstraint(fields=('career', 'index'), name='unique_session_index_per_career'),
+        ),
+        migrations.DeleteModel(
+            name='GameState',
+        ),
+    ]
@@ -0,0 +1,24 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('f1', '0008_career_required'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StandingsSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('session_index', models.IntegerField()),
+                ('standings', models.JSONField(default=list)),
+                ('career', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='f1.career')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('career', 'session_index'), name='unique_snapshot_per_session')],
+            },
+        ),
+    ]
@@ -0,0 +1,63 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def forwards(apps, schema_editor):
+    """Baseline remplie depuis f1.legacy, drivers existants rattachés."""
+    from f1.legacy import driver as legacy_drivers
+
+    Driver = apps.get_model('f1', 'Driver')
+    DriverBaseline = apps.get_model('f1', 'DriverBaseline')
+    Team = apps.get_model('f1', 'Team')
+
+    for d in legacy_drivers.drivers:
+        team, _ = Team.objects.get_or_create(name=d.team)
+        baseline = DriverBaseline.objects.create(
+            surname=d.surname, name=d.name, team=team, country=d.country, number=d.number,
+            speed=d.speed, racing=d.racing, reaction=d.reaction, experience=d.experience,
+            consistency=d.consistency, error_rate=d.error_rate,
+            street_affinity=getattr(d, 'street_circuit_affinity', 0),
+            high_speed_affinity=getattr(d, 'high_speed_circuit_affinity', 0),
+            wet_affinity=getattr(d, 'wet_circuit_affinity', 0),
+        )
+        Driver.objects.filter(surname=d.surname, name=d.name, number=d.number).update(baseline=baseline)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('f1', '0009_standings_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DriverBaseline',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('surname', models.CharField(max_length=50)),
+                ('name', models.CharField(max_length=50)),
+                ('country', models.CharField(max_length=50)),
+                ('number', models.IntegerField()),
+                ('speed', models.IntegerField(default=0)),
+                ('racing', models.IntegerField(default=0)),
+                ('reaction', models.IntegerField(default=0)),
+                ('experience', models.IntegerField(default=0)),
+                ('consistency', models.IntegerField(default=0)),
+                ('error_rate', models.IntegerField(default=0)),
+                ('street_affinity', models.IntegerField(default=0)),
+                ('high_speed_affinity', models.IntegerField(default=0)),
+                ('wet_affinity', models.IntegerField(default=0)),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='baselines', to='f1.team')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='driver',
+            name='baseline',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='drivers', to='f1.driverbaseline'),
+        ),
+        migrations.AddConstraint(
+            model_name='driverbaseline',
+            constraint=models.UniqueConstraint(fields=('surname', 'name', 'number'), name='unique_driver_baseline'),
+        ),
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('f1', '0010_driver_baseline'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='driver',
+            constraint=models.UniqueConstraint(fields=('career', 'surname', 'name'), name='unique_driver_per_career'),
+        ),
+    ]
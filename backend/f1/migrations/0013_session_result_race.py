@@ -0,0 +1,41 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('f1', '0012_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sessionresult',
+            name='best_lap_ms',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='sessionresult',
+            name='dnf',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='sessionresult',
+            name='fastest_lap',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='sessionresult',
+            name='gap_ms',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='sessionresult',
+            name='laps_completed',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='sessionresult',
+            name='start_position',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,32 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('f1', '0013_session_result_race'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='career',
+            name='budget_compacted_id',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='BudgetEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.BigIntegerField()),
+                ('reason', models.CharField(default='award', max_length=32)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('career', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='budget_entries', to='f1.career')),
+                ('session', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='budget_entries', to='f1.seasonsession')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['career', 'id'], name='budget_entry_career_id')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('session__isnull', False)), fields=('career', 'session', 'reason'), name='unique_budget_entry_per_session')],
+            },
+        ),
+    ]
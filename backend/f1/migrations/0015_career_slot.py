@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+def forwards(apps, schema_editor):
+    """La partie par défaut existante (la plus ancienne sans profil) prend le slot "default"."""
+    Career = apps.get_model('f1', 'Career')
+
+    career = Career.objects.filter(profile__isnull=True).order_by('id').first()
+    if career is not None:
+        career.slot = 'default'
+        career.save(update_fields=['slot'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('f1', '0014_budget_ledger'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='career',
+            name='slot',
+            field=models.CharField(blank=True, max_length=32, null=True, unique=True),
+        ),
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def forwards(apps, schema_editor):
+    """
+    Drivers encore sans baseline (créés hors create_career / seeds_f1) :
+    rattachés à la ligne DriverBaseline de même (surname, name, number).
+    Ceux qui n'en ont pas restent non liés (reset des stats refusé).
+    """
+    Driver = apps.get_model('f1', 'Driver')
+    DriverBaseline = apps.get_model('f1', 'DriverBaseline')
+
+    match = DriverBaseline.objects.filter(
+        surname=OuterRef('surname'), name=OuterRef('name'), number=OuterRef('number'),
+    ).values('id')[:1]
+    Driver.objects.filter(baseline__isnull=True).update(baseline=Subquery(match))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('f1', '0016_career_player'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+    ]
@@ -10,7 +10,46 @@ class Team(models.Model):
         return self.name
 
 
+class DriverBaseline(models.Model):
+    """
+    Stats de départ d'un driver (copie de f1.legacy, écrite par seeds_f1).
+    Partagée en lecture seule par toutes les parties : une nouvelle partie
+    et un reset de saison repartent de cette table.
+    """
+    surname = models.CharField(max_length=50)
+    name = models.CharField(max_length=50)
+    team = models.ForeignKey(Team, on_delete=models.PROTECT, related_name="baselines")
+
+    country = models.CharField(max_length=50)
+    number = models.IntegerField()
+
+    speed = models.IntegerField(default=0)
+    racing = models.IntegerField(default=0)
+    reaction = models.IntegerField(default=0)
+    experience = models.IntegerField(default=0)
+
+    consistency = models.IntegerField(default=0)
+    error_rate = models.IntegerField(default=0)
+
+    street_affinity = models.IntegerField(default=0)
+    high_speed_affinity = models.IntegerField(default=0)
+    wet_affinity = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["surname", "name", "number"], name="unique_driver_baseline"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} {self.surname} (baseline)"
+
+
 class Driver(models.Model):
+    # état de saison propre à une partie (copie de la baseline f1.legacy)
+    career = models.ForeignKey("Career", on_delete=models.CASCADE, related_name="drivers")
+    baseline = models.ForeignKey(DriverBaseline, on_delete=models.SET_NULL, related_name="drivers",
+                                 blank=True, null=True)
+
     surname = models.CharField(max_length=50)
     name = models.CharField(max_length=50)
     team = models.ForeignKey(Team, on_delete=models.PROTECT, related_name="drivers")
@@ -44,12 +83,20 @@ class Driver(models.Model):
     pole_positions = models.IntegerField(default=0)
     fastest_laps = models.IntegerField(default=0)
 
+    class Meta:
+        constraints = [
+            # clé des upserts de seeds_f1
+            models.UniqueConstraint(fields=["career", "surname", "name"], name="unique_driver_per_career"),
+        ]
+
     def __str__(self):
         return f"{self.name} {self.surname}"
 
 
 class SeasonSession(models.Model):
-    index = models.IntegerField(unique=True)
+    career = models.ForeignKey("Career", on_delete=models.CASCADE, related_name="sessions")
+
+    index = models.IntegerField()
     gp_name = models.CharField(max_length=120)
     circuit_name = models.CharField(max_length=120)
     date = models.DateField()
@@ -57,6 +104,14 @@ class SeasonSession(models.Model):
     circuit_type = models.CharField(max_length=20)  # street high_speed wet
     is_simulated = models.BooleanField(default=False)
 
+    # seed du np.random.Generator de la session (dérivé du seed de saison)
+    seed = models.BigIntegerField(blank=True, null=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["career", "index"], name="unique_session_index_per_career"),
+        ]
+
     def __str__(self):
         return f"{self.index} {self.gp_name} {self.session_type}"
 
@@ -68,19 +123,38 @@ class SessionResult(models.Model):
     points_gained = models.IntegerField(default=0)
     stats_gained = models.IntegerField(default=0)
 
+    # course tour par tour (settings.F1_RACE_MODE = "laps") ; vides sinon
+    start_position = models.IntegerField(blank=True, null=True)
+    laps_completed = models.IntegerField(blank=True, null=True)
+    gap_ms = models.IntegerField(blank=True, null=True)        # écart au vainqueur, None si abandon
+    best_lap_ms = models.IntegerField(blank=True, null=True)
+    dnf = models.BooleanField(default=False)
+    fastest_lap = models.BooleanField(default=False)
+
     class Meta:
         unique_together = ("session", "driver")
 
-class GameState(models.Model):
-    budget = models.BigIntegerField(default=0)
 
-    @classmethod
-    def get(cls):
-        obj, _ = cls.objects.get_or_create(pk=1, defaults={"budget": 0})
-        return obj
+class StandingsSnapshot(models.Model):
+    """
+    Classement cumulé d'une partie après la session `session_index`, écrit
+    dans la même transaction que la simulation : l'historique se lit en une
+    requête indexée, sans réagréger SessionResult.
+    """
+    career = models.ForeignKey("Career", on_delete=models.CASCADE, related_name="snapshots")
+    # -1 (simulation.SEASON_START) : état de début de saison, avant toute session
+    session_index = models.IntegerField()
+
+    # [{id, name, surname, team, position, points, wins, ..., speed, ...}, ...]
+    standings = models.JSONField(default=list)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["career", "session_index"], name="unique_snapshot_per_session"),
+        ]
 
     def __str__(self):
-        return f"GameState(budget={self.budget})"
+        return f"Snapshot({self.career_id}, {self.session_index})"
 
 
 class Profile(models.Model):
@@ -92,4 +166,119 @@ class Profile(models.Model):
         return f"/avatars/{self.avatar_key}.jpg"  # mets .png si tes fichiers sont en png
 
     def __str__(self):
-        return f"Profile({self.user.username})"
\ No newline at end of file
+        return f"Profile({self.user.username})"
+
+
+class Career(models.Model):
+    """
+    Partie (sauvegarde) d'un joueur : drivers, sessions, résultats et budget
+    lui sont propres, et les simulations ne verrouillent que cette ligne.
+    profile=None -> partie par défaut (joueurs anonymes).
+    """
+    profile = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name="careers",
+                                blank=True, null=True)
+    name = models.CharField(max_length=120, default="Saison 2026")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    # solde compacté du journal de budget (BudgetEntry) jusqu'à l'entrée
+    # budget_compacted_id incluse ; le solde réel y ajoute les entrées suivantes
+    budget = models.BigIntegerField(default=0)
+    budget_compacted_id = models.BigIntegerField(default=0)
+
+    # seed de saison : toutes les sessions en dérivent (rejouable à l'identique)
+    season_seed = models.BigIntegerField(blank=True, null=True)
+
+    # partie créée automatiquement : DEFAULT_SLOT (joueurs anonymes) ou
+    # "user:<id>" (première partie d'un joueur). Unique : deux premières
+    # requêtes concurrentes n'en créent qu'une
+    slot = models.CharField(max_length=32, unique=True, blank=True, null=True)
+
+    # pilote incarné par le joueur : ses résultats en course (S/GP) sont
+    # payés en budget par le serveur, dans la transaction de la simulation
+    player = models.ForeignKey("Driver", on_delete=models.SET_NULL, related_name="+", blank=True, null=True)
+
+    DEFAULT_SLOT = "default"
+
+    @classmethod
+    def default(cls):
+        """Partie par défaut (joueurs anonymes), créée une seule fois."""
+        obj, _ = cls.objects.get_or_create(slot=cls.DEFAULT_SLOT, defaults={"name": "Partie par défaut"})
+        return obj
+
+    def __str__(self):
+        owner = self.profile.user.username if self.profile_id else "default"
+        return f"Career({self.pk}, {owner})"
+
+
+class BudgetEntry(models.Model):
+    """
+    Mouvement de budget d'une partie. Journal en ajout seul : un gain est
+    un INSERT, jamais une mise à jour de la ligne Career (pas de ligne
+    chaude, pas de gain perdu entre deux clics concurrents). Les entrées
+    sont régulièrement repliées dans Career.budget (services/budget.py).
+    """
+    career = models.ForeignKey("Career", on_delete=models.CASCADE, related_name="budget_entries")
+    amount = models.BigIntegerField()
+    reason = models.CharField(max_length=32, default="award")
+    session = models.ForeignKey(SeasonSession, on_delete=models.SET_NULL, related_name="budget_entries",
+                                blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # solde : WHERE career_id = ? AND id > budget_compacted_id
+            models.Index(fields=["career", "id"], name="budget_entry_career_id"),
+        ]
+        constraints = [
+            # un seul gain d'un même motif par session : un double clic ne paie pas deux fois
+            models.UniqueConstraint(fields=["career", "session", "reason"], condition=models.Q(session__isnull=False),
+                                    name="unique_budget_entry_per_session"),
+        ]
+
+    def __str__(self):
+        return f"BudgetEntry({self.career_id}, {self.amount:+d}, {self.reason})"
+
+
+class Job(models.Model):
+    """
+    Tâche longue (avance rapide, reset, Monte Carlo) exécutée hors requête
+    HTTP par `manage.py run_jobs`. La table sert de file : les workers
+    réclament les tâches PENDING une par une (voir services/jobs.py).
+    """
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [(PENDING, "Pending"), (RUNNING, "Running"), (DONE, "Done"), (FAILED, "Failed")]
+    ACTIVE = (PENDING, RUNNING)
+
+    career = models.ForeignKey("Career", on_delete=models.CASCADE, related_name="jobs")
+    kind = models.CharField(max_length=32)
+    params = models.JSONField(default=dict)
+
+    # clé d'idempotence : Idempotency-Key du client, sinon dérivée de (kind, params)
+    key = models.CharField(max_length=128)
+
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=PENDING)
+    result = models.JSONField(blank=True, null=True)
+    error = models.TextField(blank=True, default="")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    worker = models.CharField(max_length=128, blank=True, default="")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            # réclamation : WHERE status = 'pending' ORDER BY id
+            models.Index(fields=["status", "id"], name="job_status_id"),
+        ]
+        constraints = [
+            # une seule tâche active par (partie, clé) : deux soumissions identiques n'en font qu'une
+            models.UniqueConstraint(fields=["career", "key"], condition=models.Q(status__in=["pending", "running"]),
+                                    name="unique_active_job"),
+        ]
+
+    def __str__(self):
+        return f"Job({self.pk}, {self.kind}, {self.status})"
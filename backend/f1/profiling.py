@@ -0,0 +1,86 @@
+"""
+Profilage à la demande des endpoints de simulation (cProfile).
+
+Un superuser ajoute `X-F1-Profile: <mode>` ou `?profile=<mode>` :
+- "1" / "disk" -> profil écrit dans settings.F1_PROFILE_DIR (anneau borné à
+  F1_PROFILE_KEEP fichiers .prof), nom renvoyé dans `X-F1-Profile-File`
+- "inline"     -> réponse {"profile": <top des appels>, "response": ...}
+
+Tout autre appelant : la vue s'exécute normalement, sans surcoût.
+Les fichiers se lisent avec `manage.py profiles` (ou snakeviz, pstats…).
+"""
+import cProfile
+import io
+import pstats
+import sys
+import time
+from functools import wraps
+from pathlib import Path
+
+from django.conf import settings
+from rest_framework.response import Response
+
+from .permissions import IsSuperUser
+
+
+HEADER = "X-F1-Profile"
+SUMMARY_LINES = 40
+
+
+def profiled(view):
+    """À placer sous @api_view / @permission_classes (reçoit la Request DRF)."""
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        mode = request.headers.get(HEADER) or request.query_params.get("profile")
+        if not mode or not IsSuperUser().has_permission(request, None):
+            return view(request, *args, **kwargs)
+
+        if sys.getprofile() is not None:
+            # un autre profileur est déjà actif : la vue s'exécute une seule fois, sans profil
+            return view(request, *args, **kwargs)
+
+        profiler = cProfile.Profile()
+        t0 = time.perf_counter()
+        response = profiler.runcall(view, request, *args, **kwargs)
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+
+        if mode == "inline":
+            return Response({"profile": summary(profiler), "response": response.data},
+                            status=response.status_code)
+
+        response[f"{HEADER}-File"] = save(profiler, view.__name__, elapsed_ms).name
+        return response
+
+    return wrapper
+
+
+def profile_dir() -> Path:
+    path = Path(settings.F1_PROFILE_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def stored_profiles() -> list:
+    """Profils de l'anneau, du plus ancien au plus récent."""
+    return sorted(profile_dir().glob("*.prof"))
+
+
+def save(profiler: cProfile.Profile, name: str, elapsed_ms: float) -> Path:
+    now = time.time()
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f"-{int(now * 1e6) % 1_000_000:06d}"
+    path = profile_dir() / f"{stamp}_{name}_{elapsed_ms:.0f}ms.prof"
+    profiler.dump_stats(path)
+
+    # anneau : on ne garde que les F1_PROFILE_KEEP plus récents
+    for old in stored_profiles()[:-settings.F1_PROFILE_KEEP]:
+        old.unlink(missing_ok=True)
+    return path
+
+
+def summary(source, sort: str = "cumulative", limit: int = SUMMARY_LINES) -> str:
+    """Top des appels (pstats) d'un profileur ou d'un fichier .prof."""
+    out = io.StringIO()
+    stats = pstats.Stats(str(source) if isinstance(source, Path) else source, stream=out)
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+    return out.getvalue()
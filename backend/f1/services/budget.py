@@ -0,0 +1,166 @@
+"""
+Budget d'une partie : journal BudgetEntry en ajout seul + solde compacté.
+
+- award   : un INSERT, aucune écriture sur la ligne Career. Lié à une
+  session, le gain est idempotent (un motif par session : contrainte unique)
+- award_results : gains de course du pilote du joueur (Career.player),
+  écrits par la simulation dans sa propre transaction ; jamais par le client
+- balance : Career.budget + somme des entrées après budget_compacted_id,
+  en une requête ; la queue reste courte car compactée régulièrement
+- compact : replie la queue dans Career.budget (verrou sur la seule ligne
+  Career, une fois toutes les COMPACT_EVERY entrées). Seules les entrées
+  plus anciennes que COMPACT_GRACE sont repliées, et jamais au-delà de la
+  première plus récente : un INSERT encore en vol (id attribué, pas encore
+  committé) ne peut pas passer sous le filigrane sans être compté.
+- reset   : nouvelle saison, solde ramené à zéro par une entrée inverse ;
+  le journal n'est jamais réécrit (le filigrane de compaction reste valide)
+"""
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import BigIntegerField, Count, F, Max, Min, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from ..cache import budget_scope, bump_version
+from ..metrics import BUDGET_AWARDED
+from ..models import BudgetEntry, Career, SeasonSession
+
+
+COMPACT_EVERY = 100
+COMPACT_GRACE = timedelta(seconds=30)
+
+# gains de course (en millions) par position, au-delà : 1M
+RESULT_REASON = "result"
+RESULT_BUDGET = {
+    "GP": [20, 15, 15, 10, 10, 10, 8, 8, 5, 5, 3, 3, 3, 3, 3, 2, 2, 2, 2, 2, 2, 2],
+    "S": [8, 5, 5, 3, 3, 2, 2, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+}
+
+
+def with_balance(careers):
+    """Annote `balance` (solde réel) sur un queryset de Career, sans requête de plus."""
+    tail = (
+        BudgetEntry.objects.filter(career_id=OuterRef("pk"), id__gt=OuterRef("budget_compacted_id"))
+        .values("career_id").annotate(total=Sum("amount")).values("total")
+    )
+    return careers.annotate(
+        balance=F("budget") + Coalesce(Subquery(tail), Value(0), output_field=BigIntegerField())
+    )
+
+
+def balance(career_id: int) -> int:
+    return with_balance(Career.objects.filter(pk=career_id)).values_list("balance", flat=True).get()
+
+
+async def abalance(career_id: int) -> int:
+    return await with_balance(Career.objects.filter(pk=career_id)).values_list("balance", flat=True).aget()
+
+
+def award(career: Career, amount: int, reason: str = "award", session: SeasonSession | None = None) -> tuple:
+    """
+    (solde, created). Gain déjà enregistré pour (session, reason) : rien
+    n'est écrit et created=False.
+    """
+    try:
+        with transaction.atomic():
+            BudgetEntry.objects.create(career=career, amount=amount, reason=reason, session=session)
+    except IntegrityError:
+        return balance(career.pk), False
+
+    _awarded(career, amount)
+    return balance(career.pk), True
+
+
+def result_amount(session_type: str, position: int) -> int | None:
+    """Gain d'une position en course (S/GP) ; None pour les autres sessions."""
+    table = RESULT_BUDGET.get(session_type)
+    if table is None or not position:
+        return None
+    return (table[position - 1] if position <= len(table) else 1) * 1_000_000
+
+
+def award_results(career: Career, rows) -> list:
+    """
+    Gains de course du pilote du joueur pour les SessionResult `rows`, à
+    appeler dans la transaction (et sous le verrou de partie) qui les
+    écrit : résultat et gain sont committés ensemble ou pas du tout. Une
+    session déjà payée (re-run force=True) ne l'est pas deux fois.
+    Retourne les entrées créées.
+    """
+    if career.player_id is None:
+        return []
+    entries = []
+    for r in rows:
+        if r.driver_id != career.player_id:
+            continue
+        amount = result_amount(r.session.session_type, r.position)
+        if amount is not None:
+            entries.append(BudgetEntry(career=career, amount=amount, reason=RESULT_REASON, session=r.session))
+    if not entries:
+        return []
+
+    paid = set(BudgetEntry.objects.filter(career=career, reason=RESULT_REASON,
+                                          session__in=[e.session for e in entries])
+               .values_list("session_id", flat=True))
+    entries = [e for e in entries if e.session.pk not in paid]
+    BudgetEntry.objects.bulk_create(entries)
+
+    total = sum(e.amount for e in entries)
+    if entries:
+        transaction.on_commit(lambda: _awarded(career, total))
+    return entries
+
+
+def session_award(career: Career, session_index: int) -> int | None:
+    """Gain de course enregistré pour une session de la partie, s'il y en a un."""
+    return (BudgetEntry.objects
+            .filter(career=career, reason=RESULT_REASON, session__index=session_index)
+            .values_list("amount", flat=True).first())
+
+
+def _awarded(career: Career, amount: int) -> None:
+    bump_version(budget_scope(career.id))
+    if amount > 0:
+        BUDGET_AWARDED.inc(amount)
+
+    watermark = Career.objects.values_list("budget_compacted_id", flat=True).get(pk=career.pk)
+    pending = BudgetEntry.objects.filter(career=career, id__gt=watermark).count()
+    if pending >= COMPACT_EVERY:
+        compact(career)
+
+
+def compact(career: Career) -> int:
+    """Replie les entrées assez anciennes dans Career.budget ; nombre d'entrées repliées."""
+    cutoff = timezone.now() - COMPACT_GRACE
+    with transaction.atomic():
+        watermark = (Career.objects.select_for_update().values_list("budget_compacted_id", flat=True)
+                     .get(pk=career.pk))
+        tail = BudgetEntry.objects.filter(career_id=career.pk, id__gt=watermark)
+        recent = tail.filter(created_at__gte=cutoff).aggregate(first=Min("id"))["first"]
+        if recent is not None:
+            tail = tail.filter(id__lt=recent)
+
+        folded = tail.aggregate(last=Max("id"), total=Sum("amount"), count=Count("id"))
+        if not folded["count"]:
+            return 0
+        Career.objects.filter(pk=career.pk).update(
+            budget=F("budget") + folded["total"], budget_compacted_id=folded["last"],
+        )
+    return folded["count"]
+
+
+def reset(career: Career) -> None:
+    """
+    Nouvelle saison : budget à zéro. Rien n'est supprimé ni réécrit dans
+    le solde compacté : une entrée "reset" annule le solde courant, et les
+    gains passés sont détachés de leur session (rejouée à la saison
+    suivante, elle sera payée à nouveau).
+    """
+    with transaction.atomic():
+        Career.objects.select_for_update().values_list("pk", flat=True).get(pk=career.pk)
+        BudgetEntry.objects.filter(career=career, session__isnull=False).update(session=None)
+        current = balance(career.pk)
+        if current:
+            BudgetEntry.objects.create(career=career, amount=-current, reason="reset")
+    bump_version(budget_scope(career.id))
@@ -0,0 +1,246 @@
+"""
+Parties (Career) : création depuis la baseline et résolution de la partie
+d'une requête.
+
+La baseline (table DriverBaseline, synchronisée depuis f1.legacy, + le
+calendrier f1.legacy) est partagée en lecture seule : chaque partie en
+reçoit sa propre copie, qu'elle fait évoluer sans jamais toucher aux autres.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.http import Http404
+
+from ..models import Career, Driver, DriverBaseline, Profile, SeasonSession, Team
+from ..legacy import driver as legacy_drivers
+from ..legacy import session as legacy_session
+
+
+# stats remises à la baseline par un reset de saison
+BASELINE_FIELDS = [
+    "speed", "racing", "reaction", "experience",
+    "consistency", "error_rate",
+    "street_affinity", "high_speed_affinity", "wet_affinity",
+]
+
+
+def baseline_stats(d) -> dict:
+    """Stats baseline d'un driver f1.legacy, aux noms des champs du modèle."""
+    return {
+        "speed": d.speed,
+        "racing": d.racing,
+        "reaction": d.reaction,
+        "experience": d.experience,
+        "consistency": d.consistency,
+        "error_rate": d.error_rate,
+        "street_affinity": getattr(d, "street_circuit_affinity", 0),
+        "high_speed_affinity": getattr(d, "high_speed_circuit_affinity", 0),
+        "wet_affinity": getattr(d, "wet_circuit_affinity", 0),
+        "points": 0,
+        "wins": 0,
+        "podiums": 0,
+        "pole_positions": 0,
+        "fastest_laps": 0,
+    }
+
+
+def baseline_teams() -> dict:
+    """Teams de la baseline (créées si besoin), par nom."""
+    names = {d.team for d in legacy_drivers.drivers}
+    teams = {t.name: t for t in Team.objects.filter(name__in=names)}
+
+    missing = names - teams.keys()
+    if missing:
+        Team.objects.bulk_create([Team(name=n) for n in sorted(missing)], ignore_conflicts=True)
+        teams = {t.name: t for t in Team.objects.filter(name__in=names)}
+    return teams
+
+
+def sync_baselines() -> list:
+    """Écrit (upsert) la table DriverBaseline depuis f1.legacy."""
+    teams = baseline_teams()
+    rows = []
+    for d in legacy_drivers.drivers:
+        stats = baseline_stats(d)
+        rows.append(DriverBaseline(
+            surname=d.surname,
+            name=d.name,
+            team=teams[d.team],
+            country=d.country,
+            number=d.number,
+            **{f: stats[f] for f in BASELINE_FIELDS},
+        ))
+
+    DriverBaseline.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["surname", "name", "number"],
+        update_fields=["team", "country", *BASELINE_FIELDS],
+    )
+    return list(DriverBaseline.objects.order_by("id"))
+
+
+def baseline_drivers() -> list:
+    """Lignes de la baseline (synchronisées depuis f1.legacy si la table est vide)."""
+    rows = list(DriverBaseline.objects.order_by("id"))
+    return rows or sync_baselines()
+
+
+def driver_from_baseline(career: Career, b: DriverBaseline, **overrides) -> Driver:
+    """Driver d'une partie, aux stats de la baseline, résultats à 0."""
+    fields = {
+        "career": career,
+        "baseline": b,
+        "surname": b.surname,
+        "name": b.name,
+        "team_id": b.team_id,
+        "country": b.country,
+        "number": b.number,
+        "image_url": None,
+        "image_key": f"{b.surname.lower()}_{b.number}",
+        **{f: getattr(b, f) for f in BASELINE_FIELDS},
+    }
+    fields.update(overrides)
+    return Driver(**fields)
+
+
+@transaction.atomic
+def create_career(profile=None, name: str = "Saison 2026", slot: str | None = None) -> Career:
+    """Nouvelle partie : copie des drivers et du calendrier de la baseline."""
+    career = Career.objects.create(profile=profile, name=name, slot=slot)
+    if profile is not None:
+        # la partie courante du joueur change : id mémorisé périmé
+        transaction.on_commit(lambda: cache.delete(_hint_key(profile.user_id)))
+
+    Driver.objects.bulk_create([driver_from_baseline(career, b) for b in baseline_drivers()])
+
+    SeasonSession.objects.bulk_create([
+        SeasonSession(
+            career=career,
+            index=index,
+            gp_name=s.gp_name,
+            circuit_name=s.circuit_name,
+            date=s.date,
+            session_type=s.session_type,
+            circuit_type=s.circuit_type,
+        )
+        for index, s in enumerate(legacy_session.season_calendar)
+    ])
+
+    return career
+
+
+def ensure_career(user) -> Career:
+    """
+    Partie courante d'un joueur, créée s'il n'en a aucune. La première
+    partie porte le slot unique "user:<id>" : sous requêtes concurrentes,
+    une seule création passe, les autres relisent la partie du gagnant.
+    """
+    career = Career.objects.filter(profile__user_id=user.pk).order_by("-id").first()
+    if career is not None:
+        return career
+
+    slot = f"user:{user.pk}"
+    profile, _ = Profile.objects.get_or_create(user=user)
+    try:
+        return create_career(profile, slot=slot)
+    except IntegrityError:
+        return Career.objects.get(slot=slot)
+
+
+def resolve_career(user, career_id=None, create: bool = False) -> Career:
+    """
+    Partie d'une requête :
+    - anonyme -> partie par défaut
+    - authentifié -> `career_id` s'il lui appartient, sinon sa partie la
+      plus récente
+
+    Une lecture ne crée rien (404 si la partie n'existe pas encore) ; les
+    vues d'écriture passent `create=True` pour créer la partie manquante.
+    """
+    if not (user and user.is_authenticated):
+        if create:
+            return Career.default()
+        career = Career.objects.filter(slot=Career.DEFAULT_SLOT).first()
+        if career is None:
+            raise Http404("Partie introuvable.")
+        return career
+
+    careers = Career.objects.filter(profile__user_id=user.pk)
+    if career_id is not None:
+        career = careers.filter(pk=_career_pk(career_id)).first()
+        if career is None:
+            raise Http404("Partie introuvable.")
+        return career
+
+    if create:
+        return ensure_career(user)
+    career = careers.order_by("-id").first()
+    if career is None:
+        raise Http404("Aucune partie : elle est créée à la connexion ou à la première simulation.")
+    return career
+
+
+async def aresolve_career(user, career_id=None) -> Career:
+    """resolve_career (lecture, sans création) pour les vues async : ORM async."""
+    if not (user and user.is_authenticated):
+        career = await Career.objects.filter(slot=Career.DEFAULT_SLOT).afirst()
+        if career is None:
+            raise Http404("Partie introuvable.")
+        return career
+
+    careers = Career.objects.filter(profile__user_id=user.pk)
+    if career_id is not None:
+        career = await careers.filter(pk=_career_pk(career_id)).afirst()
+        if career is None:
+            raise Http404("Partie introuvable.")
+        return career
+
+    career = await careers.order_by("-id").afirst()
+    if career is None:
+        raise Http404("Aucune partie : elle est créée à la connexion ou à la première simulation.")
+    return career
+
+
+def _hint_key(user_id, career_id=None) -> str | None:
+    """Clé de l'id mémorisé ; None si `career_id` n'est pas un id valide."""
+    if user_id is None:
+        return "f1:career:anonymous"
+    if career_id is None:
+        return f"f1:career:{user_id}:current"
+    return f"f1:career:{user_id}:{int(career_id)}" if str(career_id).isdigit() else None
+
+
+def _user_id(user):
+    return user.pk if user and user.is_authenticated else None
+
+
+def career_hint(user, career_id=None) -> int | None:
+    """
+    Id de la partie que resolve_career a renvoyée pour (user, career_id),
+    lu dans le cache seul : un client à jour reçoit un 304 sans requête DB.
+    None si inconnu (cache vidé, première lecture).
+    """
+    key = _hint_key(_user_id(user), career_id)
+    return cache.get(key) if key else None
+
+
+def remember_career(user, career_id, career: Career) -> None:
+    """Mémorise l'id résolu pour career_hint (après vérification en base)."""
+    cache.set(_hint_key(_user_id(user), career_id), career.pk, settings.F1_READ_CACHE_TIMEOUT)
+
+
+async def acareer_hint(user, career_id=None) -> int | None:
+    key = _hint_key(_user_id(user), career_id)
+    return await cache.aget(key) if key else None
+
+
+async def aremember_career(user, career_id, career: Career) -> None:
+    await cache.aset(_hint_key(_user_id(user), career_id), career.pk, settings.F1_READ_CACHE_TIMEOUT)
+
+
+def _career_pk(career_id) -> int:
+    try:
+        return int(career_id)
+    except (TypeError, ValueError):
+        raise Http404("Partie introuvable.")
@@ -0,0 +1,319 @@
+"""
+Moteur de simulation vectorisé (NumPy).
+
+Toute la grille est chargée en colonnes NumPy (un tableau par champ) et une
+session est calculée en un seul passage : score, affinité circuit, bruit,
+classement, points, gains de stats et clamp.
+
+Les tableaux peuvent avoir des dimensions en tête (ex: runs x drivers) :
+tous les calculs se font sur le dernier axe, ce qui sert de base aux modes
+batch / Monte Carlo.
+
+Courses (S / GP) : mode simple (score + bruit, un tirage par pilote) ou,
+avec `laps`, mode tour par tour (matrice laps x drivers) qui utilise la
+régularité (consistency) et les erreurs / abandons (error_rate).
+"""
+import hashlib
+
+import numpy as np
+
+
+POINTS_GP = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+POINTS_SPRINT = [10, 9, 8, 7, 6, 5, 4, 3, 2, 1]
+
+STAT_FIELDS = ("speed", "racing", "reaction", "experience", "consistency", "error_rate")
+AFFINITY_FIELDS = ("street_affinity", "high_speed_affinity", "wet_affinity")
+RESULT_FIELDS = ("points", "wins", "podiums", "pole_positions", "fastest_laps")
+GRID_FIELDS = STAT_FIELDS + AFFINITY_FIELDS + RESULT_FIELDS
+
+CIRCUIT_AFFINITY = {
+    "street": "street_affinity",
+    "high_speed": "high_speed_affinity",
+    "wet": "wet_affinity",
+}
+
+QUALI_SESSIONS = ("QS", "QC")
+RACE_SESSIONS = ("S", "GP")
+RANKED_SESSIONS = QUALI_SESSIONS + RACE_SESSIONS
+SIMULATED_SESSIONS = ("FP",) + RANKED_SESSIONS
+
+# stats modifiées par une session (les seules à re-clamper)
+GAIN_FIELDS = ("speed", "racing", "reaction", "experience")
+
+STAT_MIN = 0
+STAT_MAX = 100
+
+SEED_BITS = 63  # tient dans un BigIntegerField signé
+
+# ---- mode tour par tour ----
+RACE_LAPS = {"GP": 60, "S": 20}
+
+LAP_TIME_MS = 90_000        # tour de référence
+PACE_MS_PER_POINT = 4       # 1 point de score de base = 4 ms au tour
+NOISE_MS_MIN = 100          # écart-type au tour d'un pilote parfaitement régulier (consistency 100)
+NOISE_MS_MAX = 900          # ... et d'un pilote sans aucune régularité (consistency 0)
+INCIDENT_PER_LAP = 1 / 1000  # probabilité d'incident au tour par point d'error_rate
+MISTAKE_MS = (2_000, 8_000)  # temps perdu sur une erreur
+DNF_SHARE = 0.2             # part des incidents qui mènent à l'abandon
+
+
+def new_seed() -> int:
+    """Seed aléatoire (entropie OS) pour une nouvelle saison."""
+    return int(np.random.SeedSequence().generate_state(1, np.uint64)[0] >> (64 - SEED_BITS))
+
+
+def derive_seed(season_seed: int, session_index: int) -> int:
+    """Seed d'une session, dérivé de façon déterministe du seed de saison."""
+    state = np.random.SeedSequence([season_seed, session_index]).generate_state(1, np.uint64)
+    return int(state[0] >> (64 - SEED_BITS))
+
+
+def session_rng(seed: int) -> np.random.Generator:
+    return np.random.default_rng(seed)
+
+
+def grid_digest(grid: dict, ids=()) -> str:
+    """Empreinte stable de l'état d'une grille (clé de cache)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.asarray(ids, dtype=np.int64).tobytes())
+    for f in GRID_FIELDS:
+        h.update(np.ascontiguousarray(grid[f], dtype=np.int64).tobytes())
+    return h.hexdigest()
+
+
+def load_grid(drivers) -> dict:
+    """
+    Charge les drivers (modèles ou objets équivalents) en colonnes NumPy.
+    L'ordre des tableaux suit l'ordre de `drivers`.
+    """
+    n = len(drivers)
+    grid = {
+        f: np.fromiter((int(getattr(d, f) or 0) for d in drivers), dtype=np.int64, count=n)
+        for f in GRID_FIELDS
+    }
+    clamp_stats(grid)
+    return grid
+
+
+def store_grid(grid: dict, drivers) -> None:
+    """Recopie les colonnes NumPy sur les objets drivers (même ordre)."""
+    columns = {f: grid[f].tolist() for f in GRID_FIELDS}
+    for i, d in enumerate(drivers):
+        for f in GRID_FIELDS:
+            setattr(d, f, columns[f][i])
+
+
+def points_table(session_type: str, n: int, dtype=np.int64) -> np.ndarray:
+    """Barème de points de la session, complété par des 0 jusqu'à `n` places."""
+    if session_type == "GP":
+        table = POINTS_GP
+    elif session_type == "S":
+        table = POINTS_SPRINT
+    else:
+        table = []  # qualifs = 0 points
+
+    out = np.zeros(n + 1, dtype=dtype)  # index 0 = pas de position
+    m = min(n, len(table))
+    out[1:m + 1] = table[:m]
+    return out
+
+
+def base_score(grid: dict, circuit_type: str) -> np.ndarray:
+    base = grid["speed"] * 2 + grid["racing"] * 2 + grid["reaction"] + grid["experience"]
+
+    affinity = CIRCUIT_AFFINITY.get(circuit_type)
+    if affinity:
+        base = base + grid[affinity]
+    return base
+
+
+def rank(score: np.ndarray) -> np.ndarray:
+    """
+    Positions (1..n) sur le dernier axe, meilleur score = P1.
+    À score égal, l'ordre de la grille est conservé : l'index sert de
+    départage dans la clé, ce qui permet un tri non stable (plus rapide).
+    """
+    n = score.shape[-1]
+    key = score * np.int64(n) + np.arange(n - 1, -1, -1)
+    order = np.argsort(-key, axis=-1)
+
+    # inversion de la permutation par un seul scatter à plat
+    # (nettement plus rapide que put_along_axis sur des lignes courtes)
+    rows = order.size // n
+    offsets = (np.arange(rows) * n).reshape(order.shape[:-1] + (1,))
+    positions = np.empty(order.size, dtype=np.int64)
+    positions[(order + offsets).ravel()] = np.tile(np.arange(1, n + 1), rows)
+    return positions.reshape(order.shape)
+
+
+def clamp_stats(grid: dict, fields=STAT_FIELDS) -> None:
+    for f in fields:
+        np.clip(grid[f], STAT_MIN, STAT_MAX, out=grid[f])
+
+
+def session_gain(score: np.ndarray) -> np.ndarray:
+    """
+    Gain de stats d'une session classée (qualifs, S, GP), dans les deux
+    modes : score // 20, au moins 1. Le score est celui qui a décidé de la
+    session : score bruité (base + [-5, 5]) en mode simple ; en mode tour
+    par tour, le classement vient des temps au tour et non d'un score,
+    donc score de base. Le bruit étant centré, l'espérance est la même
+    (écart d'au plus 1 point de gain, au seuil d'un multiple de 20), et
+    aucun tirage n'est ajouté : une saison tour par tour se rejoue à
+    l'identique.
+    """
+    # score < 20 -> gain 1 : floor ou troncature donnent le même résultat
+    return np.maximum(1, score // 20)
+
+
+def _apply_gain(grid: dict, gain: np.ndarray) -> None:
+    grid["speed"] += gain
+    grid["racing"] += gain
+    grid["reaction"] += gain
+    grid["experience"] += gain // 2
+    clamp_stats(grid, GAIN_FIELDS)
+
+
+def run_session(grid: dict, session_type: str, circuit_type: str, rng=None, laps: int | None = None) -> dict:
+    """
+    Simule une session sur toute la grille et met `grid` à jour en place.
+    `laps` : course (S/GP) simulée tour par tour (voir run_race).
+
+    Retourne des tableaux de même forme que la grille :
+    - position      : 1..n (0 = pas de classement, ex: FP)
+    - points_gained
+    - stats_gained
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    if laps and session_type in RACE_SESSIONS:
+        return run_race(grid, session_type, circuit_type, rng, laps)
+
+    shape = grid["speed"].shape
+    base = base_score(grid, circuit_type)
+
+    position = np.zeros(shape, dtype=np.int64)
+    points = np.zeros(shape, dtype=base.dtype)
+
+    # FP : boost stats seulement
+    if session_type == "FP":
+        gain = rng.integers(1, 5, size=shape, dtype=base.dtype) + base // 50
+        _apply_gain(grid, gain)
+        return {"position": position, "points_gained": points, "stats_gained": gain}
+
+    if session_type not in SIMULATED_SESSIONS:
+        return {"position": position, "points_gained": points, "stats_gained": points.copy()}
+
+    # Autres sessions : score pondéré + bruit
+    score = base + rng.integers(-5, 6, size=shape, dtype=base.dtype)
+    position = rank(score)
+    points = points_table(session_type, shape[-1], base.dtype)[position]
+    gain = session_gain(score)
+
+    _apply_gain(grid, gain)
+    grid["points"] += points
+
+    p1 = position == 1
+    if session_type in QUALI_SESSIONS:
+        grid["pole_positions"] += p1
+    else:
+        # sprint/gp: fastest lap simplifié sur P1
+        grid["fastest_laps"] += p1
+        grid["podiums"] += position <= 3
+        if session_type == "GP":
+            grid["wins"] += p1
+
+    return {"position": position, "points_gained": points, "stats_gained": gain}
+
+
+def run_race(grid: dict, session_type: str, circuit_type: str, rng, laps: int) -> dict:
+    """
+    Course tour par tour : une matrice (..., laps, n) de temps au tour.
+
+    - rythme      : LAP_TIME_MS - score de base * PACE_MS_PER_POINT
+    - bruit       : écart-type décroissant avec `consistency`
+    - incidents   : probabilité au tour error_rate * INCIDENT_PER_LAP ;
+                    erreur (temps perdu) ou, pour DNF_SHARE d'entre eux, abandon
+    - classement  : arrivés au temps total, puis abandons au nombre de tours
+    - grille de départ : ordre du score de base (la grille ne garde pas les
+      qualifs), d'où positions_gained
+
+    En plus de position / points_gained / stats_gained, retourne dnf,
+    laps_completed, gap_ms (-1 si abandon), best_lap_ms (-1 sans tour
+    bouclé), fastest_lap et start_position. Points et podiums ne vont
+    qu'aux arrivés.
+    """
+    shape = grid["speed"].shape
+    n = shape[-1]
+    lap_shape = shape[:-1] + (laps, n)
+    base = base_score(grid, circuit_type)
+
+    pace = (LAP_TIME_MS - base * PACE_MS_PER_POINT).astype(np.float32)
+    consistency = np.clip(grid["consistency"], 0, 100).astype(np.float32)
+    sigma = NOISE_MS_MIN + (NOISE_MS_MAX - NOISE_MS_MIN) * (100 - consistency) / 100
+    p_incident = np.clip(grid["error_rate"], 0, 100).astype(np.float32) * INCIDENT_PER_LAP
+
+    # bruit au tour : uniforme centré d'écart-type sigma (moins cher à tirer
+    # qu'une gaussienne ; sur une course, la somme est de toute façon quasi gaussienne)
+    times = rng.random(lap_shape, dtype=np.float32)
+    times -= np.float32(0.5)
+    times *= (sigma * np.float32(12 ** 0.5))[..., None, :]
+    times += pace[..., None, :]
+
+    # un seul tirage uniforme par (tour, pilote) : u < p -> incident, dont
+    # u < p * DNF_SHARE -> abandon ; u rapporté à [0, 1) donne le temps perdu
+    u = rng.random(lap_shape, dtype=np.float32)
+    p = p_incident[..., None, :]
+    fatal = u < p * np.float32(DNF_SHARE)
+    mistakes = np.flatnonzero((u < p) & ~fatal)  # rares : traités en creux (indices à plat)
+    if mistakes.size:
+        p_at = p_incident.reshape(-1)[mistakes // (laps * n) * n + mistakes % n]
+        share = (u.reshape(-1)[mistakes] - p_at * DNF_SHARE) / (p_at * (1 - DNF_SHARE))
+        times.reshape(-1)[mistakes] += MISTAKE_MS[0] + share * (MISTAKE_MS[1] - MISTAKE_MS[0])
+
+    # abandon au premier incident fatal : ce tour et les suivants ne comptent pas
+    retiring = fatal.any(axis=-2)
+    laps_completed = np.where(retiring, fatal.argmax(axis=-2), laps)
+    dnf = laps_completed < laps
+
+    elapsed = times.sum(axis=-2, dtype=np.float64)
+    best_lap = times.min(axis=-2).astype(np.float64)
+    if dnf.any():
+        # abandons (rares) : temps et meilleur tour sur les seuls tours bouclés
+        per_driver = np.moveaxis(times, -2, -1)[dnf]            # (k, laps)
+        done = np.arange(laps) < laps_completed[dnf][:, None]
+        elapsed[dnf] = np.where(done, per_driver, 0).sum(axis=-1, dtype=np.float64)
+        best_lap[dnf] = np.where(done, per_driver, np.inf).min(axis=-1)
+
+    # plus de tours d'abord, puis moins de temps (ms entières, départage : ordre de grille)
+    position = rank(laps_completed.astype(np.int64) * 10**9 - np.rint(elapsed).astype(np.int64))
+    start_position = rank(base)
+
+    points = points_table(session_type, n, base.dtype)[position] * ~dnf
+    gain = session_gain(base)
+
+    fastest = (np.arange(n) == np.argmin(best_lap, axis=-1)[..., None]) & np.isfinite(best_lap)
+
+    leader_time = np.take_along_axis(elapsed, np.argmin(position, axis=-1)[..., None], axis=-1)
+    gap = np.where(dnf, -1, np.rint(elapsed - leader_time)).astype(np.int64)
+
+    _apply_gain(grid, gain)
+    grid["points"] += points
+    grid["fastest_laps"] += fastest
+    finished = ~dnf
+    grid["podiums"] += (position <= 3) & finished
+    if session_type == "GP":
+        grid["wins"] += (position == 1) & finished
+
+    return {
+        "position": position,
+        "points_gained": points,
+        "stats_gained": gain,
+        "start_position": start_position,
+        "dnf": dnf,
+        "laps_completed": laps_completed,
+        "gap_ms": gap,
+        "best_lap_ms": np.where(np.isfinite(best_lap), np.rint(best_lap), -1).astype(np.int64),
+        "fastest_lap": fastest,
+    }
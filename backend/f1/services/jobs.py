@@ -0,0 +1,175 @@
+"""
+File de tâches locale, stockée en base (table Job), sans broker externe.
+
+- submit : enregistre une tâche PENDING, ou renvoie la tâche existante de
+  même clé (Idempotency-Key du client, sinon dérivée de kind + params)
+- claim  : un worker réclame la plus ancienne tâche PENDING.
+  PostgreSQL : SELECT ... FOR UPDATE SKIP LOCKED (les workers ne s'attendent
+  pas entre eux). SQLite (pas de verrou de ligne) : UPDATE conditionnel
+  status=pending -> running, que SQLite sérialise ; 0 ligne = déjà prise.
+- run    : exécute le handler et enregistre résultat ou erreur
+
+Les handlers sont rejouables : une avance rapide saute les sessions déjà
+simulées, un reset repart de la baseline, le Monte Carlo est en lecture
+seule. Une tâche RUNNING orpheline (worker tué) peut donc être remise en
+file sans risque (requeue_stale).
+"""
+import hashlib
+import json
+import logging
+from datetime import timedelta
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from ..metrics import JOBS
+from ..models import Career, Job
+from . import budget, simulation
+
+
+logger = logging.getLogger("f1.jobs")
+
+MAX_ATTEMPTS = 3
+
+# candidats examinés par réclamation (fallback sans SKIP LOCKED)
+CLAIM_BATCH = 10
+
+
+def _simulate_until(career: Career, index=None, gp=None) -> dict:
+    return simulation.simulate_until(career, index, gp_name=gp)
+
+
+def _reset(career: Career, reset_skills: bool = True) -> dict:
+    # comme POST /season/reset/ : le budget repart aussi de zéro (une fois
+    # la saison remise à zéro : un reset refusé ne touche pas au budget)
+    result = simulation.reset_season(career, reset_skills=reset_skills)
+    budget.reset(career)
+    return result
+
+
+def _odds(career: Career, runs: int | None = None, seed=None) -> dict:
+    if seed is None:
+        seed = simulation.season_seed(career)
+    return simulation.championship_odds(career, runs=runs, seed=seed)
+
+
+HANDLERS = {
+    "simulate_until": _simulate_until,
+    "reset": _reset,
+    "odds": _odds,
+}
+
+
+def validate(career: Career, kind: str, params: dict) -> dict:
+    """Paramètres normalisés (JSON) pour `kind` ; ValueError si invalides."""
+    if kind not in HANDLERS:
+        raise ValueError(f"Type de tâche inconnu : {kind}. Types : {', '.join(sorted(HANDLERS))}.")
+
+    try:
+        if kind == "simulate_until":
+            index = params.get("index")
+            clean = {"index": int(index) if index not in (None, "") else None, "gp": params.get("gp") or None}
+        elif kind == "reset":
+            clean = {"reset_skills": str(params.get("reset_skills", True)) in ("1", "true", "True", "yes")}
+        else:
+            seed = params.get("seed")
+            runs = params.get("runs")
+            clean = {"runs": int(runs) if runs not in (None, "") else simulation.odds_runs(),
+                     "seed": int(seed) if seed not in (None, "") else None}
+    except (TypeError, ValueError):
+        raise ValueError("Paramètres invalides.")
+
+    if kind == "simulate_until":
+        simulation.pending_sessions(career, clean["index"], clean["gp"])  # GP inconnu -> ValueError
+    return clean
+
+
+def submit(career: Career, kind: str, params: dict, key: str | None = None) -> tuple:
+    """
+    (job, created). `params` doit déjà être validé.
+    Clé explicite : toujours la même tâche, même terminée. Clé dérivée :
+    la tâche identique encore active, sinon une nouvelle.
+    """
+    jobs = Job.objects.filter(career=career)
+    if key:
+        existing = jobs.filter(key=key).order_by("-id").first()
+    else:
+        key = _derived_key(kind, params)
+        existing = jobs.filter(key=key, status__in=Job.ACTIVE).first()
+    if existing is not None:
+        return existing, False
+
+    for attempt in range(2):
+        try:
+            with transaction.atomic():
+                job = Job.objects.create(career=career, kind=kind, params=params, key=key)
+            break
+        except IntegrityError:
+            # soumission concurrente de la même tâche : on renvoie celle qui
+            # a gagné, sans filtre sur le statut (elle a pu se terminer
+            # entre-temps). Introuvable : on retente une fois la création.
+            existing = jobs.filter(key=key).order_by("-id").first()
+            if existing is not None:
+                return existing, False
+            if attempt:
+                raise
+
+    JOBS.labels(kind, Job.PENDING).inc()
+    return job, True
+
+
+def _derived_key(kind: str, params: dict) -> str:
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:32]
+    return f"{kind}:{digest}"
+
+
+def claim(worker: str) -> Job | None:
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            pk = (Job.objects.select_for_update(skip_locked=True)
+                  .filter(status=Job.PENDING).order_by("id").values_list("pk", flat=True).first())
+            if pk is None:
+                return None
+            _mark_running(Job.objects.filter(pk=pk), worker)
+        return Job.objects.select_related("career").get(pk=pk)
+
+    for pk in Job.objects.filter(status=Job.PENDING).order_by("id").values_list("pk", flat=True)[:CLAIM_BATCH]:
+        if _mark_running(Job.objects.filter(pk=pk, status=Job.PENDING), worker):
+            return Job.objects.select_related("career").get(pk=pk)
+    return None
+
+
+def _mark_running(jobs, worker: str) -> int:
+    return jobs.update(status=Job.RUNNING, worker=worker, attempts=F("attempts") + 1, started_at=timezone.now())
+
+
+def run(job: Job) -> Job:
+    handler = HANDLERS[job.kind]
+    try:
+        job.result = handler(job.career, **job.params)
+        job.status = Job.DONE
+    except Exception as e:
+        logger.exception("job %s (%s) failed", job.pk, job.kind)
+        job.error = str(e) or e.__class__.__name__
+        job.status = Job.FAILED
+
+    job.finished_at = timezone.now()
+    job.save(update_fields=["result", "status", "error", "finished_at"])
+    JOBS.labels(job.kind, job.status).inc()
+    return job
+
+
+def requeue_stale(older_than: timedelta) -> int:
+    """
+    Tâches RUNNING depuis plus de `older_than` (worker tué en cours) :
+    remises en file, ou FAILED après MAX_ATTEMPTS essais.
+    """
+    stale = Job.objects.filter(status=Job.RUNNING, started_at__lt=timezone.now() - older_than)
+    failed = stale.filter(attempts__gte=MAX_ATTEMPTS).update(
+        status=Job.FAILED, error="Abandonnée : worker perdu.", finished_at=timezone.now(),
+    )
+    requeued = stale.filter(attempts__lt=MAX_ATTEMPTS).update(status=Job.PENDING, worker="")
+    if failed or requeued:
+        logger.warning("stale jobs: %s requeued, %s failed", requeued, failed)
+    return requeued
@@ -0,0 +1,97 @@
+"""
+Probabilités de championnat par Monte Carlo.
+
+À partir d'une grille (stats + points des drivers) et des sessions restantes,
+on rejoue la fin de saison N fois en mémoire, avec les mêmes règles que
+`simulate_session` (`services.season.step`). Les runs sont vectorisés en tableaux
+(runs x drivers) et découpés en chunks de taille fixe pour borner la mémoire.
+
+Module sans ORM ni lecture de settings : les chunks peuvent être exécutés
+dans les processus du pool (`services.parallel`, qui n'importe que
+django.conf).
+"""
+import numpy as np
+
+from . import engine, parallel
+from .season import SeasonState, SessionSpec, step
+
+
+CHUNK_RUNS = 1_250
+MAX_RUNS = 100_000
+
+MUTABLE_FIELDS = engine.GAIN_FIELDS + engine.RESULT_FIELDS
+
+
+def standings_rank(grid: dict) -> np.ndarray:
+    """Classement championnat (1..n) : points, puis victoires."""
+    key = grid["points"] * 1024 + np.minimum(grid["wins"], 1023)
+    return engine.rank(key)
+
+
+def simulate_chunk(grid: dict, schedule, runs: int, rng) -> dict:
+    """
+    Rejoue `schedule` [(session_type, circuit_type, laps), ...] `runs` fois
+    à partir de `grid` (1 dimension : drivers).
+
+    Retourne des agrégats (sommables d'un chunk à l'autre) :
+    - titles           : (n,) nombre de titres
+    - points_sum       : (n,) somme des points finaux
+    - position_counts  : (n, n) [driver, position-1]
+    """
+    n = grid["speed"].shape[-1]
+    # int32 : moitié moins de mémoire à parcourir que la grille int64.
+    # Les champs jamais modifiés par le moteur restent des vues broadcast.
+    batch = {}
+    for f in engine.GRID_FIELDS:
+        column = np.broadcast_to(grid[f].astype(np.int32), (runs, n))
+        batch[f] = column.copy() if f in MUTABLE_FIELDS else column
+
+    state = SeasonState(np.arange(n), batch)
+    for i, (session_type, circuit_type, laps) in enumerate(schedule):
+        step(state, SessionSpec(i, session_type, circuit_type, laps=laps), rng)
+
+    final = standings_rank(batch)
+    flat = np.arange(n) * n + (final - 1)
+
+    return {
+        "titles": (final == 1).sum(axis=0),
+        "points_sum": batch["points"].sum(axis=0),
+        "position_counts": np.bincount(flat.ravel(), minlength=n * n).reshape(n, n),
+    }
+
+
+def chunk_sizes(runs: int, chunk_runs: int = CHUNK_RUNS) -> list:
+    full, rest = divmod(runs, chunk_runs)
+    return [chunk_runs] * full + ([rest] if rest else [])
+
+
+def _chunk_task(task) -> dict:
+    grid, schedule, runs, seed_seq = task
+    return simulate_chunk(grid, schedule, runs, np.random.default_rng(seed_seq))
+
+
+def simulate_runs(grid: dict, schedule, runs: int, seed=None, workers: int | None = None) -> dict:
+    """
+    Agrège `runs` saisons simulées. Chaque chunk a son propre générateur,
+    dérivé de `seed` par SeedSequence.spawn, et la taille des chunks est
+    fixe : le résultat ne dépend que de (seed, runs), pas du nombre de
+    workers. Les chunks ne renvoient que leurs agrégats (quelques Ko), jamais
+    les tableaux (runs x drivers).
+    """
+    n = grid["speed"].shape[-1]
+    sizes = chunk_sizes(runs)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    schedule = list(schedule)
+
+    tasks = [(grid, schedule, size, ss) for size, ss in zip(sizes, seeds)]
+    parts = parallel.map_tasks(_chunk_task, tasks, workers)
+
+    totals = {
+        "titles": np.zeros(n, dtype=np.int64),
+        "points_sum": np.zeros(n, dtype=np.int64),
+        "position_counts": np.zeros((n, n), dtype=np.int64),
+    }
+    for part in parts:
+        for k in totals:
+            totals[k] += part[k]
+    return totals
@@ -0,0 +1,91 @@
+"""
+Exécution des gros batchs NumPy (Monte Carlo, replays, calibration) sur un
+pool de processus `concurrent.futures`.
+
+- le nombre de workers vient de `settings.F1_SIM_WORKERS` (0 = tous les cœurs)
+- le pool est créé une seule fois par processus, à cette taille (donc après
+  le fork des workers gunicorn), sous verrou, et réutilisé par toutes les
+  requêtes ; `map_tasks(workers=…)` ne fait que limiter le nombre de tâches
+  en vol, il ne reconstruit jamais le pool
+- contexte "forkserver" : les enfants ne dupliquent ni les connexions DB ni
+  les threads du process Django. Les fonctions exécutées vivent dans des
+  modules qui ne touchent ni à l'ORM ni aux settings à l'import (engine,
+  montecarlo) ; ce module-ci n'importe que `django.conf`, paresseux, et ne
+  lit les settings que dans le processus parent
+"""
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from django.conf import settings
+
+
+_pool = None
+_lock = threading.Lock()
+
+
+def worker_count(workers: int | None = None) -> int:
+    if workers is None:
+        workers = getattr(settings, "F1_SIM_WORKERS", 1)
+    workers = int(workers)
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def get_pool(workers: int | None = None) -> ProcessPoolExecutor:
+    """Pool du processus, créé au premier appel à `worker_count(workers)` processus."""
+    global _pool
+
+    with _lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=worker_count(workers),
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+atexit.register(shutdown_pool)
+
+
+def map_tasks(fn, tasks: list, workers: int | None = None) -> list:
+    """
+    Applique `fn` à chaque tâche et renvoie les résultats dans l'ordre des
+    tâches, avec au plus `workers` tâches en vol sur le pool partagé. En
+    dessous de 2 workers (ou de 2 tâches) tout reste dans le processus
+    courant, sans pickling.
+    """
+    workers = worker_count(workers)
+    if workers <= 1 or len(tasks) <= 1:
+        return [fn(t) for t in tasks]
+
+    pool = get_pool()
+    results = [None] * len(tasks)
+    queue = iter(enumerate(tasks))
+    pending = {}
+
+    def submit_next():
+        item = next(queue, None)
+        if item is not None:
+            pending[pool.submit(fn, item[1])] = item[0]
+
+    for _ in range(workers):
+        submit_next()
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            results[pending.pop(future)] = future.result()
+            submit_next()
+    return results
@@ -0,0 +1,108 @@
+"""
+État de saison en mémoire, indépendant de l'ORM.
+
+`SeasonState` porte la grille (une colonne NumPy par champ de
+engine.GRID_FIELDS, éventuellement avec des dimensions en tête pour le
+Monte Carlo) et les ids des drivers ; `SessionSpec` décrit une session
+(index, type, circuit, seed, tours si la course est simulée tour par tour). `step(state, session, rng)` est la seule
+façon de faire avancer une saison : simulate_session / simulate_until,
+replay_season, le Monte Carlo et les outils hors ligne (bench_f1) passent
+tous par elle, donc par les mêmes règles (services.engine).
+
+Module volontairement sans Django : utilisable (et testable) sans base,
+et transmissible aux processus du pool.
+"""
+import numpy as np
+
+from . import engine
+
+
+class SessionSpec:
+    """Ce dont le moteur a besoin d'une session (modèle SeasonSession ou calendrier legacy)."""
+
+    __slots__ = ("index", "session_type", "circuit_type", "seed", "laps")
+
+    def __init__(self, index: int, session_type: str, circuit_type: str, seed: int | None = None,
+                 laps: int | None = None):
+        self.index = index
+        self.session_type = session_type
+        self.circuit_type = circuit_type
+        self.seed = seed
+        self.laps = laps  # None : mode course simple
+
+    @classmethod
+    def from_session(cls, session, index: int | None = None, laps: int | None = None) -> "SessionSpec":
+        return cls(
+            session.index if index is None else index,
+            session.session_type,
+            session.circuit_type,
+            getattr(session, "seed", None),
+            laps,
+        )
+
+    def rng(self) -> np.random.Generator:
+        """Generator de la session : seedé si elle a un seed, sinon entropie OS."""
+        return engine.session_rng(self.seed) if self.seed is not None else np.random.default_rng()
+
+    def __repr__(self):
+        return (f"SessionSpec({self.index}, {self.session_type}, {self.circuit_type}, "
+                f"seed={self.seed}, laps={self.laps})")
+
+
+class SeasonState:
+    """
+    Grille d'une saison : `grid[champ]` est un tableau (..., n) et `ids[i]`
+    l'id du driver de la colonne i. L'ordre des colonnes est celui des
+    drivers fournis au chargement.
+    """
+
+    __slots__ = ("ids", "grid")
+
+    def __init__(self, ids, grid: dict):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.grid = grid
+
+    @classmethod
+    def from_drivers(cls, drivers, ids=None) -> "SeasonState":
+        """Drivers (modèles ou objets portant les champs de GRID_FIELDS), stats clampées."""
+        if ids is None:
+            ids = [d.id for d in drivers]
+        return cls(ids, engine.load_grid(drivers))
+
+    def __len__(self):
+        return self.ids.shape[0]
+
+    def copy(self) -> "SeasonState":
+        return SeasonState(self.ids.copy(), {f: column.copy() for f, column in self.grid.items()})
+
+    def digest(self) -> str:
+        """Empreinte stable de l'état (clé de cache)."""
+        return engine.grid_digest(self.grid, self.ids)
+
+    def store(self, drivers) -> None:
+        """Recopie la grille sur les objets drivers (même ordre qu'au chargement)."""
+        engine.store_grid(self.grid, drivers)
+
+    def standings_order(self) -> list:
+        """Colonnes triées par points puis victoires (à égalité : ordre de la grille)."""
+        points, wins = self.grid["points"], self.grid["wins"]
+        return np.lexsort((np.arange(len(self)), -wins, -points)).tolist()
+
+
+def step(state: SeasonState, session: SessionSpec, rng=None) -> dict:
+    """
+    Simule `session` sur `state` (mis à jour en place) et renvoie les
+    tableaux position / points_gained / stats_gained (+ détail de course
+    si `session.laps`, voir engine.run_race). Sans `rng` : le
+    Generator de la session (seedé si elle a un seed). Aucune E/S.
+    """
+    if rng is None:
+        rng = session.rng()
+    return engine.run_session(state.grid, session.session_type, session.circuit_type, rng, laps=session.laps)
+
+
+def play(state: SeasonState, sessions) -> SeasonState:
+    """Enchaîne `step` sur `sessions` (dans l'ordre), chacune avec son propre seed."""
+    for session in sessions:
+        step(state, session)
+    return state
@@ -1,177 +1,132 @@
-import numpy as np
-from django.db import transaction
+from types import SimpleNamespace
 
-from ..models import Team, Driver, SeasonSession, SessionResult
-from ..legacy import driver as legacy_drivers
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction
 
+from ..cache import bump_version, season_scope
+from ..models import Career, Driver, DriverBaseline, SeasonSession, SessionResult, StandingsSnapshot
+from ..metrics import CACHE_REQUESTS, LOCK_WAIT, SIMULATED_SESSIONS
+from ..timing import span
+from . import budget, engine, montecarlo
+from .season import SeasonState, SessionSpec, play, step
+from .careers import BASELINE_FIELDS
 
-POINTS_GP = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
-POINTS_SPRINT = [10, 9, 8, 7, 6, 5, 4, 3, 2, 1]
 
+DRIVER_UPDATE_FIELDS = list(engine.GRID_FIELDS)
 
-def clamp(v, lo=0, hi=100):
-    try:
-        v = int(v)
-    except Exception:
-        v = lo
-    return max(lo, min(hi, v))
+# champs cumulés conservés dans les snapshots de classement
+SNAPSHOT_FIELDS = engine.RESULT_FIELDS + engine.GAIN_FIELDS
 
+# snapshot de l'état de début de saison (avant la première session) : point
+# de départ d'un re-run de la première session ; exclu des classements
+SEASON_START = -1
 
-def clamp_driver_stats(d: Driver):
-    """
-    Patch sécurité: empêche les stats de partir en orbite.
-    Ajuste les bornes si tu veux (0-100).
-    """
-    d.speed = clamp(d.speed)
-    d.racing = clamp(d.racing)
-    d.reaction = clamp(d.reaction)
-    d.experience = clamp(d.experience)
+# détail d'une course tour par tour (engine.run_race), stocké dans SessionResult
+RACE_RESULT_FIELDS = ("start_position", "laps_completed", "gap_ms", "best_lap_ms", "dnf", "fastest_lap")
+# le moteur marque "sans valeur" par -1 (tableaux entiers) ; en base : NULL
+RACE_NULLABLE_FIELDS = ("gap_ms", "best_lap_ms")
 
-    # consistency/error_rate -> tu peux garder 0-100
-    if hasattr(d, "consistency"):
-        d.consistency = clamp(getattr(d, "consistency", 0))
-    if hasattr(d, "error_rate"):
-        d.error_rate = clamp(getattr(d, "error_rate", 0))
+# runs Monte Carlo par défaut de /season/odds/ : le mode tour par tour est
+# ~8x plus lent (~1300 runs/s), on garde la requête autour de 1,5 s
+ODDS_RUNS = 10_000
+ODDS_RUNS_LAPS = 2_000
 
 
 @transaction.atomic
-def simulate_session(session_index: int, force: bool = False):
+def simulate_session(career: Career, session_index: int, force: bool = False):
     """
-    Simule une session (FP/QS/QC/S/GP), met à jour :
+    Simule une session (FP/QS/QC/S/GP) d'une partie, met à jour :
     - drivers (stats + points + wins/podiums/etc)
     - SessionResult (position + points_gained + stats_gained)
+    - StandingsSnapshot (classement cumulé après la session)
     - SeasonSession.is_simulated = True
+    - BudgetEntry (gain de course du pilote du joueur, budget.award_results)
+
+    Le calcul est fait en mémoire (`services.season.step`, moteur vectorisé) :
+    l'ORM ne sert qu'à charger l'état et à persister le résultat.
+    L'aléatoire vient d'un Generator seedé par `SeasonSession.seed` (dérivé
+    du seed de saison + index) : même seed + même grille = même résultat.
 
     Si la session est déjà simulée :
     - force=False -> renvoie les résultats existants
-    - force=True  -> supprime les résultats existants et resimule
-    """
-    session = SeasonSession.objects.select_for_update().get(index=session_index)
-
-    # ✅ si déjà simulée et pas force : renvoyer l'existant
-    if session.is_simulated and not force:
-        existing = (SessionResult.objects
-                    .select_related("driver", "driver__team")
-                    .filter(session=session)
-                    .order_by("position"))
-        if existing.exists():
-            return [
-                _format(r.driver, r.points_gained, r.stats_gained, r.position)
-                for r in existing
-            ]
-
-    # ✅ si force (ou si pas encore simulée mais résultats fantômes) : nettoyer
-    SessionResult.objects.filter(session=session).delete()
-
-    # ✅ lock drivers pour éviter les doubles clics / incohérences
-    drivers = list(Driver.objects.select_for_update().select_related("team").all())
-
-    results_payload = []
-    driver_scores = []
-
-    # -----------------------
-    # Calcul des performances
-    # -----------------------
-    for d in drivers:
-        base = d.speed * 2 + d.racing * 2 + d.reaction + d.experience
-
-        # Affinité circuit
-        if session.circuit_type == "street":
-            base += d.street_affinity
-        elif session.circuit_type == "high_speed":
-            base += d.high_speed_affinity
-        elif session.circuit_type == "wet":
-            base += d.wet_affinity
-
-        # FP : boost stats seulement
-        if session.session_type == "FP":
-            stat_boost = int(np.random.randint(1, 5) + base // 50)
-
-            d.speed += stat_boost
-            d.racing += stat_boost
-            d.reaction += stat_boost
-            d.experience += stat_boost // 2
-
-            # ✅ PATCH: clamp stats
-            clamp_driver_stats(d)
-            d.save()
-
-            # pas de position / pas de points, juste payload
-            results_payload.append(_format(d, 0, stat_boost, None))
-            continue
-
-        # Autres sessions : score pondéré
-        score = int(base + np.random.randint(-5, 6))
-        driver_scores.append((d, score))
-
-    # -----------------------
-    # Classement et points
-    # -----------------------
-    if session.session_type in ["QS", "QC", "S", "GP"]:
-        driver_scores.sort(key=lambda x: x[1], reverse=True)
-
-        if session.session_type == "S":
-            points_table = POINTS_SPRINT
-        elif session.session_type == "GP":
-            points_table = POINTS_GP
-        else:
-            points_table = [0] * len(driver_scores)  # qualifs = 0 points
-
-        for pos, (d, score) in enumerate(driver_scores, start=1):
-            points = points_table[pos - 1] if (pos - 1) < len(points_table) else 0
-            stats_gain = max(1, int(score / 20))
-
-            # gain stats
-            d.speed += stats_gain
-            d.racing += stats_gain
-            d.reaction += stats_gain
-            d.experience += stats_gain // 2
-
-            # points
-            d.points += points
-
-            # pole (qualifs)
-            if session.session_type in ["QS", "QC"] and pos == 1:
-                d.pole_positions += 1
-
-            # sprint/gp: fastest lap simplifié sur P1
-            if session.session_type in ["GP", "S"] and pos == 1:
-                d.fastest_laps += 1
-                if session.session_type == "GP":
-                    d.wins += 1
-
-            # podium (sprint + gp)
-            if session.session_type in ["GP", "S"] and pos <= 3:
-                d.podiums += 1
-
-            # ✅ PATCH: clamp stats
-            clamp_driver_stats(d)
-            d.save()
-
-            # persist result
-            SessionResult.objects.create(
-                session=session,
-                driver=d,
-                position=pos,
-                points_gained=points,
-                stats_gained=stats_gain,
-            )
-
-            results_payload.append(_format(d, points, stats_gain, pos))
-
-    # Marquer session jouée
-    session.is_simulated = True
-    session.save()
+    - force=True  -> supprime les résultats existants et resimule depuis
+                     l'état d'avant la session (snapshot précédent), pas
+                     depuis l'état des drivers, qui l'inclut déjà. Le
+                     résultat est servi par le cache si les entrées
+                     (session, seed, état d'avant) sont identiques. Les
+                     sessions suivantes déjà simulées sont rejouées dans
+                     l'ordre, avec leur seed : résultats, snapshots et état
+                     final des drivers réécrits, comme si la saison avait
+                     été jouée d'une traite.
+    """
+    # ✅ lock de la partie (et d'elle seule) : évite les doubles clics /
+    # incohérences sans bloquer les autres joueurs
+    career = _lock(career)
+
+    with span("load"):
+        session = SeasonSession.objects.get(career=career, index=session_index)
+
+        # ✅ si déjà simulée et pas force : renvoyer l'existant
+        if session.is_simulated and not force:
+            existing = (SessionResult.objects
+                        .select_related("driver", "driver__team")
+                        .filter(session=session)
+                        .order_by("position"))
+            if existing.exists():
+                return [result_payload(r) for r in existing]
+
+        rerun = session.is_simulated
+        later = (list(career.sessions.filter(is_simulated=True, index__gt=session.index).order_by("index"))
+                 if rerun else [])
+
+        # ✅ si force (ou si pas encore simulée mais résultats fantômes) : nettoyer
+        SessionResult.objects.filter(session__in=[session, *later]).delete()
+
+        drivers = list(career.drivers.select_related("team").order_by("id"))
+        state = SeasonState.from_drivers(drivers)
+        snapshots = []
+        if rerun:
+            _rewind(career, state, session.index)
+        elif not career.snapshots.exists():
+            snapshots.append(_snapshot(career, SEASON_START, state, drivers))
+
+    with span("score"):
+        _session_seed(career, session)
+        outcome = _run_cached(career, state, _spec(session))
+
+    with span("format"):
+        state.store(drivers)
+        rows, results_payload = _session_rows(session, drivers, outcome)
+        snapshots.append(_snapshot(career, session.index, state, drivers))
+
+    if later:
+        later_rows, later_snapshots, _ = _play(career, state, drivers, later)
+        rows.extend(later_rows)
+        snapshots.extend(later_snapshots)
+        state.store(drivers)
+
+    # ✅ écriture groupée : 1 upsert pour les drivers, 1 INSERT pour les résultats
+    with span("persist"):
+        if later or session.session_type in engine.SIMULATED_SESSIONS:
+            _save_drivers(drivers)
+        SessionResult.objects.bulk_create(rows)
+        _save_snapshots(snapshots)
+        budget.award_results(career, rows)
+
+        # Marquer session jouée
+        session.is_simulated = True
+        session.save(update_fields=["is_simulated", "seed"])
+    bump_version(season_scope(career.id))
+    _count_sessions([session, *later])
 
-    # Tri : positions d'abord, puis FP (None) à la fin
-    results_payload.sort(key=lambda r: (r["position"] is None, r["position"] or 999))
     return results_payload
 
 
 @transaction.atomic
-def simulate_next(force: bool = False) -> dict:
+def simulate_next(career: Career, force: bool = False) -> dict:
     """
-    Simule la prochaine session non jouée.
+    Simule la prochaine session non jouée de la partie.
     Retourne:
     {
       done: bool,
@@ -179,8 +134,8 @@ def simulate_next(force: bool = False) -> dict:
       results: [...]
     }
     """
-    next_session = (SeasonSession.objects
-                    .select_for_update()
+    career = _lock(career)
+    next_session = (career.sessions
                     .filter(is_simulated=False)
                     .order_by("index")
                     .first())
@@ -193,37 +148,375 @@ def simulate_next(force: bool = False) -> dict:
             "results": []
         }
 
-    results = simulate_session(next_session.index, force=force)
+    results = simulate_session(career, next_session.index, force=force)
 
     return {
         "done": False,
-        "session": {
-            "index": next_session.index,
-            "gp_name": next_session.gp_name,
-            "circuit_name": next_session.circuit_name,
-            "date": next_session.date.isoformat(),
-            "session_type": next_session.session_type,
-            "circuit_type": next_session.circuit_type,
-            "is_simulated": True,
-        },
+        "session": session_meta(next_session, is_simulated=True),
         "results": results
     }
 
 
 @transaction.atomic
-def reset_season(reset_skills: bool = True) -> dict:
+def simulate_until(career: Career, target_index: int | None = None, gp_name: str | None = None,
+                   include_results: bool = False) -> dict:
+    """
+    Avance rapide : simule toutes les sessions non jouées jusqu'à une cible
+    (index de session, fin d'un GP, ou fin de saison si rien n'est donné).
+
+    - 1 transaction, 1 lock (la partie)
+    - l'état des drivers reste en mémoire (SeasonState) entre les sessions
+    - écritures groupées à la fin (1 UPDATE drivers, 1 INSERT résultats,
+      1 INSERT snapshots, 1 INSERT gains de course, 1 UPDATE sessions)
+
+    Retourne un résumé compact ; les résultats par session ne sont inclus
+    que si `include_results=True`.
+    """
+    career = _lock(career)
+    sessions = list(pending_sessions(career, target_index, gp_name))
+
+    if sessions:
+        with span("load"):
+            # ✅ résultats fantômes éventuels sur les sessions à jouer
+            SessionResult.objects.filter(session__in=sessions).delete()
+
+            drivers = list(career.drivers.select_related("team").order_by("id"))
+            state = SeasonState.from_drivers(drivers)
+
+        start = [] if career.snapshots.exists() else [_snapshot(career, SEASON_START, state, drivers)]
+        rows, snapshots, summary_sessions = _play(career, state, drivers, sessions, include_results)
+        snapshots[:0] = start
+
+        with span("persist"):
+            state.store(drivers)
+            _save_drivers(drivers)
+            SessionResult.objects.bulk_create(rows)
+            _save_snapshots(snapshots)
+            budget.award_results(career, rows)
+            for session in sessions:
+                session.is_simulated = True
+            SeasonSession.objects.bulk_update(sessions, ["is_simulated", "seed"])
+        bump_version(season_scope(career.id))
+        _count_sessions(sessions)
+    else:
+        drivers = list(career.drivers.select_related("team").order_by("id"))
+        summary_sessions = []
+
+    remaining = career.sessions.filter(is_simulated=False).count()
+
+    return {
+        "done": remaining == 0,
+        "simulated": len(sessions),
+        "remaining": remaining,
+        "sessions": summary_sessions,
+        "standings": _standings(drivers),
+    }
+
+
+def _play(career: Career, state: SeasonState, drivers, sessions, include_results: bool = False):
+    """
+    Enchaîne `sessions` (dans l'ordre) sur `state`, en mémoire : (lignes
+    SessionResult, snapshots, métas de session) à persister par l'appelant.
+    """
+    rows = []
+    snapshots = []
+    summary_sessions = []
+    for session in sessions:
+        with span("score"):
+            _session_seed(career, session)
+            outcome = step(state, _spec(session))
+
+        with span("format"):
+            # les payloads lisent l'état des objets : on ne recopie la grille
+            # à chaque session que si on doit les renvoyer
+            if include_results:
+                state.store(drivers)
+            session_rows, payload = _session_rows(session, drivers, outcome,
+                                                  with_payload=include_results)
+            rows.extend(session_rows)
+            snapshots.append(_snapshot(career, session.index, state, drivers))
+
+            meta = session_meta(session, is_simulated=True)
+            if include_results:
+                meta["results"] = payload
+            summary_sessions.append(meta)
+    return rows, snapshots, summary_sessions
+
+
+def pending_sessions(career: Career, target_index: int | None = None, gp_name: str | None = None):
+    """
+    Sessions non jouées jusqu'à la cible (index inclus, fin du GP `gp_name`,
+    ou fin de saison), dans l'ordre. ValueError si le GP est inconnu.
+    """
+    pending = career.sessions.filter(is_simulated=False).order_by("index")
+
+    if gp_name is not None:
+        last = (career.sessions
+                .filter(gp_name=gp_name)
+                .order_by("-index")
+                .values_list("index", flat=True)
+                .first())
+        if last is None:
+            raise ValueError(f"GP inconnu: {gp_name}")
+        target_index = last if target_index is None else min(target_index, last)
+
+    if target_index is not None:
+        pending = pending.filter(index__lte=target_index)
+    return pending
+
+
+def replay_season(career: Career, until_index: int | None = None) -> dict:
     """
-    Reset de saison :
-    - supprime SessionResult
-    - remet is_simulated=False sur toutes les sessions
+    Reconstruit l'état de la saison à partir du seul seed, sans snapshot :
+    grille baseline (DriverBaseline) puis sessions jouées rejouées dans l'ordre
+    des index avec leur seed. Lecture seule.
+
+    Suppose une saison partie de la baseline (reset_season avec skills). Un
+    re-run (force=True) rejoue aussi les sessions suivantes : la saison reste
+    reproductible ainsi.
+    """
+    drivers = list(career.drivers.select_related("team", "baseline").order_by("id"))
+
+    start = []
+    for d in drivers:
+        if d.baseline is None:
+            raise ValueError(f"Pas de baseline pour {d}")
+        stats = {f: getattr(d.baseline, f) for f in BASELINE_FIELDS}
+        start.append(SimpleNamespace(**stats, **{f: 0 for f in engine.RESULT_FIELDS}))
+
+    sessions = career.sessions.filter(is_simulated=True).order_by("index")
+    if until_index is not None:
+        sessions = sessions.filter(index__lte=until_index)
+    sessions = list(sessions)
+
+    if any(s.seed is None for s in sessions):
+        raise ValueError("Saison simulée sans seed : impossible de la rejouer.")
+
+    state = SeasonState.from_drivers(start, ids=[d.id for d in drivers])
+    with span("score"):
+        play(state, [_spec(s) for s in sessions])
+    state.store(drivers)
+
+    return {
+        "season_seed": season_seed(career),
+        "replayed": len(sessions),
+        "standings": _standings(drivers),
+    }
+
+
+def standings_at(career: Career, session_index: int | None = None) -> dict | None:
+    """
+    Classement tel qu'il était après la session `session_index` (la dernière
+    session jouée si None) : dernier snapshot d'index <= session_index, en
+    une requête sur l'index unique (career, session_index). Lecture seule.
+    """
+    snapshots = career.snapshots.filter(session_index__gt=SEASON_START).order_by("-session_index")
+    if session_index is not None:
+        snapshots = snapshots.filter(session_index__lte=session_index)
+
+    snapshot = snapshots.values("session_index", "standings").first()
+    if snapshot is None:
+        return None
+    return {"session_index": snapshot["session_index"], "standings": snapshot["standings"]}
+
+
+def championship_odds(career: Career, runs: int | None = None, seed=None) -> dict:
+    """
+    Probabilités de championnat (Monte Carlo) depuis l'état courant en base.
+    Lecture seule : aucune écriture, aucun lock.
+    Retourne pour chaque driver la probabilité de titre, les points finaux
+    attendus et la distribution des positions finales.
+    Sans `runs` : odds_runs() (selon le mode de course).
+    """
+    runs = max(1, min(int(runs or odds_runs()), montecarlo.MAX_RUNS))
+
+    drivers = list(career.drivers.select_related("team").order_by("id"))
+    schedule = [(session_type, circuit_type, race_laps(session_type))
+                for session_type, circuit_type in (career.sessions
+                                                   .filter(is_simulated=False)
+                                                   .order_by("index")
+                                                   .values_list("session_type", "circuit_type"))]
+
+    if not drivers:
+        return {"runs": runs, "remaining_sessions": len(schedule), "drivers": []}
+
+    state = SeasonState.from_drivers(drivers)
+    with span("score"):
+        totals = montecarlo.simulate_runs(state.grid, schedule, runs, seed=seed)
+
+    rows = []
+    for i, d in enumerate(drivers):
+        rows.append({
+            "id": d.id,
+            "name": d.name,
+            "surname": d.surname,
+            "team": d.team.name,
+            "points": d.points,
+            "title_probability": float(totals["titles"][i]) / runs,
+            "expected_points": float(totals["points_sum"][i]) / runs,
+            "position_distribution": (totals["position_counts"][i] / runs).round(6).tolist(),
+        })
+
+    rows.sort(key=lambda r: (-r["title_probability"], -r["expected_points"]))
+    return {"runs": runs, "remaining_sessions": len(schedule), "drivers": rows}
+
+
+PREVIEW_SCOPES = ("session", "gp", "season")
+
+# champs d'un driver modifiables dans une prévisualisation
+PREVIEW_DRIVER_FIELDS = engine.STAT_FIELDS + engine.AFFINITY_FIELDS
+
+
+def preview_season(career: Career, scope: str = "session", target_index: int | None = None,
+                   gp_name: str | None = None, drivers: dict | None = None,
+                   circuit_types: dict | None = None, skip=(), seed: int | None = None,
+                   include_results: bool = False) -> dict:
+    """
+    "Et si…" : simule en mémoire (SeasonState) depuis l'état courant, avec
+    des modifications, sans rien écrire ni verrouiller. Plusieurs
+    prévisualisations peuvent donc tourner en parallèle d'une simulation.
+
+    Cible : `target_index` / `gp_name` comme simulate_until, sinon `scope`
+    ("session" = prochaine session, "gp" = fin du GP en cours, "season").
+    Modifications :
+    - drivers       : {driver_id: {champ: valeur int}} (PREVIEW_DRIVER_FIELDS)
+    - circuit_types : {index: "street" | "high_speed" | "wet"}
+    - skip          : index de sessions non courues
+
+    Sans `seed`, chaque session utilise le seed qu'utiliserait la vraie
+    simulation : sans modification, la prévisualisation prédit exactement
+    le résultat. (Saison dont le seed n'est pas encore tiré : seed
+    temporaire, non enregistré.) ValueError si un paramètre est invalide.
+    """
+    if scope not in PREVIEW_SCOPES:
+        raise ValueError(f"scope invalide : {scope} ({', '.join(PREVIEW_SCOPES)}).")
+
+    pending = career.sessions.filter(is_simulated=False).order_by("index")
+    if target_index is None and gp_name is None and scope != "season":
+        upcoming = pending.first()
+        if upcoming is None:
+            target_index = -1  # saison terminée : rien à simuler
+        elif scope == "session":
+            target_index = upcoming.index
+        else:
+            gp_name = upcoming.gp_name
+
+    with span("load"):
+        sessions = list(pending_sessions(career, target_index, gp_name))
+        driver_rows = list(career.drivers.select_related("team").order_by("id"))
+        state = SeasonState.from_drivers(driver_rows)
+        points_before = state.grid["points"].tolist()
+
+    _apply_driver_overrides(state, drivers or {})
+    circuit_types = circuit_types or {}
+    for circuit_type in circuit_types.values():
+        if circuit_type not in engine.CIRCUIT_AFFINITY:
+            raise ValueError(f"circuit_type invalide : {circuit_type}.")
+    skip = set(skip)
+
+    if seed is None:
+        base_seed = career.season_seed if career.season_seed is not None else engine.new_seed()
+    else:
+        base_seed = seed
+
+    summary_sessions = []
+    with span("score"):
+        for s in sessions:
+            meta = session_meta(s)
+            if s.index in skip:
+                summary_sessions.append({**meta, "skipped": True})
+                continue
+
+            session_seed = s.seed if seed is None and s.seed is not None else engine.derive_seed(base_seed, s.index)
+            spec = SessionSpec(s.index, s.session_type, circuit_types.get(s.index, s.circuit_type), session_seed,
+                               race_laps(s.session_type))
+            outcome = step(state, spec)
+
+            meta.update(circuit_type=spec.circuit_type, skipped=False)
+            if include_results:
+                meta["results"] = _preview_results(driver_rows, outcome)
+            summary_sessions.append(meta)
+
+    return {
+        "preview": True,
+        "simulated": sum(not m["skipped"] for m in summary_sessions),
+        "sessions": summary_sessions,
+        "standings": _preview_standings(driver_rows, state, points_before),
+    }
+
+
+def _apply_driver_overrides(state: SeasonState, overrides: dict) -> None:
+    columns = {driver_id: i for i, driver_id in enumerate(state.ids.tolist())}
+    for driver_id, fields in overrides.items():
+        i = columns.get(driver_id)
+        if i is None:
+            raise ValueError(f"Driver inconnu dans cette partie : {driver_id}.")
+        for field, value in fields.items():
+            if field not in PREVIEW_DRIVER_FIELDS:
+                raise ValueError(f"Champ non modifiable : {field} ({', '.join(PREVIEW_DRIVER_FIELDS)}).")
+            state.grid[field][i] = value
+    engine.clamp_stats(state.grid)
+
+
+def _preview_results(drivers, outcome: dict) -> list:
+    positions = outcome["position"].tolist()
+    points = outcome["points_gained"].tolist()
+    gains = outcome["stats_gained"].tolist()
+    race = _race_columns(outcome)
+
+    rows = [
+        {"id": d.id, "name": d.name, "surname": d.surname, "team": d.team.name,
+         "position": positions[i] or None, "points_gained": points[i], "stats_gained": gains[i],
+         **_race_detail({f: column[i] for f, column in race.items()}, positions[i])}
+        for i, d in enumerate(drivers)
+    ]
+    rows.sort(key=lambda r: (r["position"] is None, r["position"] or 0))
+    return rows
+
+
+def _preview_standings(drivers, state: SeasonState, points_before: list) -> list:
+    columns = {f: state.grid[f].tolist() for f in engine.RESULT_FIELDS}
+    standings = []
+    for position, i in enumerate(state.standings_order(), start=1):
+        d = drivers[i]
+        standings.append({
+            "id": d.id, "name": d.name, "surname": d.surname, "team": d.team.name,
+            "position": position,
+            "points": columns["points"][i],
+            "points_gained": columns["points"][i] - points_before[i],
+            "wins": columns["wins"][i],
+            "podiums": columns["podiums"][i],
+        })
+    return standings
+
+
+@transaction.atomic
+def reset_season(career: Career, reset_skills: bool = True) -> dict:
+    """
+    Reset de saison d'une partie :
+    - supprime SessionResult + snapshots de classement
+    - remet is_simulated=False sur toutes les sessions + nouveau seed de saison
     - remet à 0 points/wins/podiums/poles/fastest_laps sur tous les drivers
     - OPTIONNEL: remet aussi les skills/affinités/consistency/error_rate à la baseline
+
+    Nombre constant de requêtes ensemblistes, quel que soit le nombre de
+    drivers (la baseline est jointe en SQL, pas bouclée en Python).
+    ValueError (rien n'est modifié) si des drivers n'ont pas de baseline
+    et que reset_skills est demandé.
     """
-    SessionResult.objects.all().delete()
-    SeasonSession.objects.all().update(is_simulated=False)
+    career = _lock(career)
+    bump_version(season_scope(career.id))
+
+    SessionResult.objects.filter(session__career=career).delete()
+    career.snapshots.all().delete()
+    career.sessions.update(is_simulated=False, seed=None)
+
+    # nouvelle saison = nouveau seed
+    career.season_seed = engine.new_seed()
+    career.save(update_fields=["season_seed"])
 
     # Reset progression (toujours)
-    Driver.objects.all().update(
+    career.drivers.update(
         points=0,
         wins=0,
         podiums=0,
@@ -231,42 +524,295 @@ def reset_season(reset_skills: bool = True) -> dict:
         fastest_laps=0,
     )
 
-    # ✅ Reset skills/affinités (si demandé)
+    # ✅ Reset skills/affinités (si demandé) : 1 UPDATE … FROM la baseline
     if reset_skills:
-        if not hasattr(legacy_drivers, "drivers"):
-            raise RuntimeError("f1/legacy/driver.py must expose `drivers`")
-
-        for d in legacy_drivers.drivers:
-            team_obj, _ = Team.objects.get_or_create(
-                name=d.team,
-                defaults={"logo_url": None}
-            )
-
-            Driver.objects.filter(
-                surname=d.surname,
-                name=d.name,
-                number=d.number,
-            ).update(
-                team=team_obj,
-                country=d.country,
-
-                speed=d.speed,
-                racing=d.racing,
-                reaction=d.reaction,
-                experience=d.experience,
-
-                consistency=d.consistency,
-                error_rate=d.error_rate,
-
-                street_affinity=getattr(d, "street_circuit_affinity", 0),
-                high_speed_affinity=getattr(d, "high_speed_circuit_affinity", 0),
-                wet_affinity=getattr(d, "wet_circuit_affinity", 0),
-            )
+        _reset_from_baseline(career)
 
     return {"ok": True, "reset_skills": reset_skills}
 
 
-def _format(d: Driver, points_gained: int, stats_gained: int, position):
+def _save_drivers(drivers) -> None:
+    """
+    Recopie la grille en base en une requête d'upsert (INSERT … ON CONFLICT
+    (id) DO UPDATE) : coût linéaire en lignes, là où bulk_update construit
+    un CASE WHEN par champ et par ligne (quadratique en pratique, sous le
+    verrou de la partie).
+    """
+    Driver.objects.bulk_create(drivers, update_conflicts=True, unique_fields=["id"],
+                               update_fields=DRIVER_UPDATE_FIELDS)
+
+
+def _reset_from_baseline(career: Career) -> None:
+    """
+    UPDATE … FROM (PostgreSQL, SQLite >= 3.33) : les drivers de la partie
+    reprennent team/country/stats de leur ligne DriverBaseline.
+    Un driver sans baseline garderait ses stats de fin de saison : ValueError
+    plutôt qu'un reset partiel (la transaction de reset_season est annulée).
+    """
+    unlinked = career.drivers.filter(baseline__isnull=True).count()
+    if unlinked:
+        raise ValueError(f"{unlinked} pilote(s) sans baseline : reset des stats impossible "
+                         f"(reset_skills=false pour ne remettre que la progression).")
+
+    driver = Driver._meta.db_table
+    baseline = DriverBaseline._meta.db_table
+    columns = ["team_id", "country", *BASELINE_FIELDS]
+
+    q = connection.ops.quote_name
+    assignments = ", ".join(f"{q(c)} = b.{q(c)}" for c in columns)
+    sql = (
+        f"UPDATE {q(driver)} SET {assignments} "
+        f"FROM {q(baseline)} AS b "
+        f"WHERE {q(driver)}.{q('baseline_id')} = b.{q('id')} "
+        f"AND {q(driver)}.{q('career_id')} = %s"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [career.pk])
+
+
+def season_seed(career: Career) -> int:
+    """Seed de la saison en cours de la partie (tiré au premier besoin)."""
+    if career.season_seed is None:
+        Career.objects.filter(pk=career.pk, season_seed__isnull=True).update(season_seed=engine.new_seed())
+        career.season_seed = Career.objects.values_list("season_seed", flat=True).get(pk=career.pk)
+    return career.season_seed
+
+
+def _lock(career: Career) -> Career:
+    # le span "lock" mesure l'attente du verrou (autre simulation en cours)
+    with span("lock"), LOCK_WAIT.time():
+        return Career.objects.select_for_update().get(pk=career.pk)
+
+
+def _count_sessions(sessions) -> None:
+    types = [s.session_type for s in sessions]
+
+    def count():
+        for session_type in types:
+            SIMULATED_SESSIONS.labels(session_type).inc()
+
+    # compté au commit seulement (un rollback ne simule rien)
+    transaction.on_commit(count)
+
+
+def race_laps(session_type: str) -> int | None:
+    """Tours à simuler pour une course en mode "laps" (settings.F1_RACE_MODE), sinon None."""
+    if settings.F1_RACE_MODE == "laps":
+        return engine.RACE_LAPS.get(session_type)
+    return None
+
+
+def odds_runs() -> int:
+    """Runs Monte Carlo par défaut, selon settings.F1_RACE_MODE."""
+    return ODDS_RUNS_LAPS if settings.F1_RACE_MODE == "laps" else ODDS_RUNS
+
+
+def _spec(session: SeasonSession) -> SessionSpec:
+    return SessionSpec.from_session(session, laps=race_laps(session.session_type))
+
+
+def _session_seed(career: Career, session: SeasonSession) -> int:
+    if session.seed is None:
+        session.seed = engine.derive_seed(season_seed(career), session.index)
+    return session.seed
+
+
+def _rewind(career: Career, state: SeasonState, session_index: int) -> None:
+    """
+    Ramène `state` (chargé depuis les drivers) à l'état d'avant la session
+    `session_index` : champs cumulés (SNAPSHOT_FIELDS) du dernier snapshot
+    antérieur, ou de celui du début de saison. Les autres champs ne
+    changent pas d'une session à l'autre. ValueError si aucun snapshot ne
+    couvre cet état (saison commencée avant SEASON_START).
+    """
+    standings = (career.snapshots.filter(session_index__lt=session_index)
+                 .order_by("-session_index").values_list("standings", flat=True).first())
+    rows = {row["id"]: row for row in standings or ()}
+    ids = state.ids.tolist()
+    if any(driver_id not in rows for driver_id in ids):
+        raise ValueError("État d'avant la session inconnu : impossible de la rejouer (reset de saison).")
+    for f in SNAPSHOT_FIELDS:
+        state.grid[f][...] = [rows[driver_id][f] for driver_id in ids]
+
+
+def _run_cached(career: Career, state: SeasonState, session: SessionSpec) -> dict:
+    """
+    `step` de `session` (seedée) sur `state`. Le résultat ne dépend que de
+    la session, de son seed et de l'état d'entrée : il est mis en cache sous
+    (partie, index, seed, empreinte de l'état), et un re-run (force=True)
+    sur des entrées identiques est servi sans recalcul.
+    """
+    outcomes = caches["outcomes"]
+    key = "f1:outcome:{}:{}:{}:{}:{}:{}:{}".format(
+        career.id, session.index, session.seed, session.session_type, session.circuit_type,
+        session.laps, state.digest(),
+    )
+
+    hit = outcomes.get(key)
+    if hit is not None:
+        CACHE_REQUESTS.labels("outcome", "hit").inc()
+        for f in engine.GRID_FIELDS:
+            state.grid[f][...] = hit["grid"][f]
+        return hit["outcome"]
+    CACHE_REQUESTS.labels("outcome", "miss").inc()
+
+    outcome = step(state, session)
+    outcomes.set(key, {"grid": state.grid, "outcome": outcome}, settings.F1_SIM_CACHE_TIMEOUT)
+    return outcome
+
+
+def _snapshot(career: Career, session_index: int, state: SeasonState, drivers) -> StandingsSnapshot:
+    """
+    Snapshot du classement lu directement dans l'état (pas besoin de le
+    recopier dans les objets Driver à chaque session).
+    """
+    columns = {f: state.grid[f].tolist() for f in SNAPSHOT_FIELDS}
+
+    standings = []
+    for position, i in enumerate(state.standings_order(), start=1):
+        d = drivers[i]
+        row = {"id": d.id, "name": d.name, "surname": d.surname, "team": d.team.name,
+               "position": position}
+        row.update({f: columns[f][i] for f in SNAPSHOT_FIELDS})
+        standings.append(row)
+
+    return StandingsSnapshot(career=career, session_index=session_index, standings=standings)
+
+
+def _save_snapshots(snapshots) -> None:
+    # upsert : un re-run (force=True) remplace le snapshot de la session
+    StandingsSnapshot.objects.bulk_create(
+        snapshots,
+        update_conflicts=True,
+        unique_fields=["career", "session_index"],
+        update_fields=["standings"],
+    )
+
+
+def _standings(drivers) -> list:
+    return [
+        {
+            "id": d.id,
+            "name": d.name,
+            "surname": d.surname,
+            "team": d.team.name,
+            "points": d.points,
+            "wins": d.wins,
+            "podiums": d.podiums,
+        }
+        for d in sorted(drivers, key=lambda d: (-d.points, -d.wins))
+    ]
+
+
+def _session_rows(session: SeasonSession, drivers, outcome: dict, with_payload: bool = True):
+    """
+    Construit (sans requête) les SessionResult à insérer et le payload JSON
+    d'une session, à partir de l'état courant des drivers.
+    """
+    positions = outcome["position"].tolist()
+    points = outcome["points_gained"].tolist()
+    gains = outcome["stats_gained"].tolist()
+    race = _race_columns(outcome)
+
+    rows = []
+    payload = []
+    for i, d in enumerate(drivers):
+        pos = positions[i] or None
+        if pos is None and session.session_type != "FP":
+            continue
+
+        extra = {f: column[i] for f, column in race.items()} if race else None
+        if pos is not None:
+            rows.append(SessionResult(
+                session=session,
+                driver=d,
+                position=pos,
+                points_gained=points[i],
+                stats_gained=gains[i],
+                **(extra or {}),
+            ))
+
+        if with_payload:
+            payload.append(_format(d, points[i], gains[i], pos, extra))
+
+    # Tri : positions d'abord, puis FP (None) à la fin
+    payload.sort(key=lambda r: (r["position"] is None, r["position"] or 999))
+    return rows, payload
+
+
+def session_meta(s: SeasonSession, is_simulated: bool | None = None) -> dict:
+    return {
+        "index": s.index,
+        "gp_name": s.gp_name,
+        "circuit_name": s.circuit_name,
+        "date": s.date.isoformat(),
+        "session_type": s.session_type,
+        "circuit_type": s.circuit_type,
+        "is_simulated": s.is_simulated if is_simulated is None else is_simulated,
+    }
+
+
+def result_payload(r: SessionResult) -> dict:
+    """Résultat enregistré (driver et team chargés) au format des simulations."""
+    race = {f: getattr(r, f) for f in RACE_RESULT_FIELDS} if r.start_position is not None else None
+    return _format(r.driver, r.points_gained, r.stats_gained, r.position, race)
+
+
+# colonnes lues par stored_results_query (voir session_meta et _format)
+SESSION_META_FIELDS = ("index", "gp_name", "circuit_name", "date", "session_type", "circuit_type", "is_simulated")
+STORED_RESULT_FIELDS = ("position", "points_gained", "stats_gained", *RACE_RESULT_FIELDS)
+STORED_DRIVER_FIELDS = ("id", "name", "surname", "image_url", "image_key", *engine.GRID_FIELDS)
+
+
+def stored_results_query(sessions):
+    """
+    Sessions et résultats enregistrés en une seule requête : LEFT JOIN
+    résultats / driver / team (une ligne par résultat, une ligne vide pour
+    une session sans résultat), trié par session puis position.
+    """
+    return sessions.order_by("index", "results__position").values(
+        *SESSION_META_FIELDS,
+        *(f"results__{f}" for f in STORED_RESULT_FIELDS),
+        *(f"results__driver__{f}" for f in STORED_DRIVER_FIELDS),
+        "results__driver__team__name",
+        "results__driver__team__logo_url",
+    )
+
+
+def stored_results(rows) -> list:
+    """[{meta, "results": [...]}] pour chaque session, jouée ou non, depuis stored_results_query."""
+    sessions = []
+    for row in rows:
+        if not sessions or sessions[-1]["index"] != row["index"]:
+            meta = SimpleNamespace(**{f: row[f] for f in SESSION_META_FIELDS})
+            sessions.append({**session_meta(meta), "results": []})
+        if row["results__position"] is None:
+            continue
+        team = SimpleNamespace(name=row["results__driver__team__name"],
+                               logo_url=row["results__driver__team__logo_url"])
+        driver = SimpleNamespace(team=team, **{f: row[f"results__driver__{f}"] for f in STORED_DRIVER_FIELDS})
+        result = SimpleNamespace(driver=driver, **{f: row[f"results__{f}"] for f in STORED_RESULT_FIELDS})
+        sessions[-1]["results"].append(result_payload(result))
+    return sessions
+
+
+def _race_columns(outcome: dict) -> dict:
+    """Colonnes de détail de course (listes Python) si la session a été courue tour par tour."""
+    if "start_position" not in outcome:
+        return {}
+    columns = {f: outcome[f].tolist() for f in RACE_RESULT_FIELDS}
+    for f in RACE_NULLABLE_FIELDS:
+        columns[f] = [None if v < 0 else v for v in columns[f]]
+    return columns
+
+
+def _race_detail(race: dict | None, position) -> dict:
+    if not race:
+        return {}
+    return {**race, "positions_gained": race["start_position"] - position}
+
+
+def _format(d: Driver, points_gained: int, stats_gained: int, position, race: dict | None = None):
     return {
         "id": d.id,
         "name": d.name,
@@ -298,4 +844,5 @@ def _format(d: Driver, points_gained: int, stats_gained: int, position):
         "points_gained": points_gained,
         "stats_gained": stats_gained,
         "position": position,
+        **_race_detail(race, position),
     }
\ No newline at end of file
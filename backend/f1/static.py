@@ -0,0 +1,36 @@
+"""
+Fichiers statiques (WhiteNoise) compatibles ASGI.
+
+Le middleware WhiteNoise est synchrone : sous ASGI, Django exécuterait
+alors toute la suite de la chaîne dans un thread et rappellerait chaque
+vue async via async_to_sync (deux sauts de thread par requête API). Ici,
+seule la réponse d'un fichier statique passe par un thread ; les autres
+requêtes continuent en async.
+"""
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, **kwargs):
+        super().__init__(get_response, **kwargs)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            # DEBUG : recherche sur le disque
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
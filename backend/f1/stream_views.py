@@ -0,0 +1,136 @@
+# f1/stream_views.py
+"""
+Avance rapide diffusée en Server-Sent Events.
+
+Chaque session est simulée dans sa propre transaction (simulate_session)
+puis envoyée tout de suite : le premier résultat arrive après une seule
+session, et rien n'est accumulé côté serveur quelle que soit la longueur
+de la saison.
+
+Le corps suit le serveur :
+- ASGI (config.asgi) : générateur async ; chaque session
+  passe par un thread (sync_to_async) le temps de son calcul, et le flux
+  n'occupe rien entre deux événements. Un générateur sync y serait
+  consommé d'un bloc (sync_to_async(list)) : tout arriverait à la fin.
+- WSGI : générateur sync, qui occupe un thread du worker pendant tout le
+  flux.
+Si le client coupe, le serveur ferme le générateur et la simulation
+s'arrête après la session en cours (déjà commitée).
+"""
+import json
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from .services.careers import resolve_career
+from .services.simulation import pending_sessions, simulate_session, standings_at
+
+
+def authenticate(request):
+    """Utilisateur du JWT (Authorization: Bearer …), sinon anonyme (None)."""
+    result = JWTAuthentication().authenticate(request)
+    return result[0] if result else None
+
+
+def json_errors(view):
+    """Erreurs d'auth / de partie -> {"detail": ...} comme les vues DRF."""
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        try:
+            return view(request, *args, **kwargs)
+        except AuthenticationFailed as e:
+            # même corps que le handler DRF (InvalidToken porte un dict)
+            data = e.detail if isinstance(e.detail, dict) else {"detail": e.detail}
+            return JsonResponse(data, status=e.status_code)
+        except Http404 as e:
+            return JsonResponse({"detail": str(e)}, status=404)
+
+    return wrapper
+
+
+def _sse(event: str, payload) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload, cls=DjangoJSONEncoder)}\n\n"
+
+
+@csrf_exempt
+@require_POST
+@json_errors
+def simulate_stream(request):
+    """
+    POST /simulate/stream/ -> text/event-stream
+    Params (query) : index, gp (comme /simulate/until/), career.
+    Événements : start {sessions}, session {session, results} (un par
+    session), done {remaining, standings}, error {detail}.
+    """
+    career = resolve_career(authenticate(request), request.GET.get("career"), create=True)
+
+    index = request.GET.get("index")
+    gp_name = request.GET.get("gp") or None
+    try:
+        target_index = int(index) if index not in (None, "") else None
+    except ValueError:
+        return JsonResponse({"detail": "index invalide."}, status=400)
+
+    try:
+        sessions = _pending(career, target_index, gp_name)
+    except ValueError as e:
+        return JsonResponse({"detail": str(e)}, status=400)
+
+    events = _aevents(career, sessions) if isinstance(request, ASGIRequest) else _events(career, sessions)
+    response = StreamingHttpResponse(events, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # pas de buffering côté proxy (nginx)
+    return response
+
+
+def _events(career, sessions):
+    yield _sse("start", {"sessions": len(sessions)})
+
+    for meta in sessions:
+        try:
+            results = simulate_session(career, meta["index"])
+        except Exception as e:  # le flux est déjà ouvert : l'erreur devient un événement
+            yield _sse("error", {"detail": str(e), "index": meta["index"]})
+            return
+        yield _sse("session", {"session": {**meta, "is_simulated": True}, "results": results})
+
+    yield _sse("done", _summary(career))
+
+
+async def _aevents(career, sessions):
+    """_events pour ASGI : un événement par session, calculée hors de la boucle."""
+    yield _sse("start", {"sessions": len(sessions)})
+
+    for meta in sessions:
+        try:
+            results = await sync_to_async(simulate_session)(career, meta["index"])
+        except Exception as e:
+            yield _sse("error", {"detail": str(e), "index": meta["index"]})
+            return
+        yield _sse("session", {"session": {**meta, "is_simulated": True}, "results": results})
+
+    yield _sse("done", await sync_to_async(_summary)(career))
+
+
+def _pending(career, target_index, gp_name) -> list:
+    # métadonnées seulement (quelques dizaines de petits dicts)
+    return list(
+        pending_sessions(career, target_index, gp_name)
+        .values("index", "gp_name", "circuit_name", "date", "session_type", "circuit_type")
+    )
+
+
+def _summary(career) -> dict:
+    latest = standings_at(career) or {"standings": []}
+    return {
+        "remaining": career.sessions.filter(is_simulated=False).count(),
+        "standings": latest["standings"],
+    }
@@ -1,3 +1,580 @@
-from django.test import TestCase
+import threading
+from datetime import timedelta
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.http import Http404
+from django.db import IntegrityError, connection
+from django.test import Client, SimpleTestCase, TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.utils import timezone
+
+from . import async_views
+from .auth_views import issue_tokens
+from django.db.models import Sum
+
+from .models import BudgetEntry, Career, Job, SessionResult
+from .services import budget, engine, jobs, montecarlo, parallel, simulation
+from .services.careers import ensure_career, resolve_career
+from .services.season import SeasonState, SessionSpec, play, step
+
+
+def make_state(n: int = 22, seed: int = 0) -> SeasonState:
+    """Grille synthétique : stats tirées au hasard, résultats à zéro."""
+    rng = np.random.default_rng(seed)
+    drivers = []
+    for i in range(n):
+        fields = {f: int(rng.integers(40, 101)) for f in engine.STAT_FIELDS}
+        fields["error_rate"] = int(rng.integers(0, 20))
+        fields.update({f: int(rng.integers(0, 11)) for f in engine.AFFINITY_FIELDS})
+        fields.update({f: 0 for f in engine.RESULT_FIELDS})
+        drivers.append(SimpleNamespace(id=i + 1, **fields))
+    return SeasonState.from_drivers(drivers)
+
+
+class StepTests(SimpleTestCase):
+    """services.season.step / services.engine, sans base de données."""
+
+    def assert_same_outcome(self, a: dict, b: dict):
+        self.assertEqual(a.keys(), b.keys())
+        for key in a:
+            np.testing.assert_array_equal(a[key], b[key], err_msg=key)
+
+    def test_same_seed_same_result(self):
+        for spec in (SessionSpec(0, "FP", "street", seed=11),
+                     SessionSpec(1, "QC", "wet", seed=12),
+                     SessionSpec(2, "GP", "high_speed", seed=13),
+                     SessionSpec(3, "GP", "street", seed=14, laps=engine.RACE_LAPS["GP"])):
+            with self.subTest(spec=spec):
+                first, second = make_state(), make_state()
+                self.assert_same_outcome(step(first, spec), step(second, spec))
+                for f in engine.GRID_FIELDS:
+                    np.testing.assert_array_equal(first.grid[f], second.grid[f], err_msg=f)
+
+    def test_different_seeds_differ(self):
+        a = step(make_state(), SessionSpec(0, "GP", "street", seed=1))
+        b = step(make_state(), SessionSpec(0, "GP", "street", seed=2))
+        self.assertFalse(np.array_equal(a["position"], b["position"]))
+
+    def test_fp_gains_within_bounds(self):
+        state = make_state()
+        before = {f: state.grid[f].copy() for f in engine.GRID_FIELDS}
+        base = engine.base_score(before, "street")
+
+        outcome = step(state, SessionSpec(0, "FP", "street", seed=5))
+
+        gain = outcome["stats_gained"]
+        self.assertTrue(np.all(gain >= 1 + base // 50))
+        self.assertTrue(np.all(gain <= 4 + base // 50))
+        self.assertFalse(outcome["position"].any())
+        self.assertFalse(outcome["points_gained"].any())
+        for f in ("speed", "racing", "reaction"):
+            np.testing.assert_array_equal(state.grid[f], np.minimum(before[f] + gain, engine.STAT_MAX))
+        np.testing.assert_array_equal(state.grid["experience"],
+                                      np.minimum(before["experience"] + gain // 2, engine.STAT_MAX))
+        for f in engine.RESULT_FIELDS:
+            np.testing.assert_array_equal(state.grid[f], before[f])
+
+    def test_race_gains_match_across_modes(self):
+        # même fonction de gain : score bruité (simple) ou score de base (tour par tour)
+        base = engine.base_score(make_state().grid, "street")
+        for laps in (None, engine.RACE_LAPS["GP"]):
+            with self.subTest(laps=laps):
+                gain = step(make_state(), SessionSpec(0, "GP", "street", seed=9, laps=laps))["stats_gained"]
+                self.assertTrue(np.all(gain >= engine.session_gain(base - 5)))
+                self.assertTrue(np.all(gain <= engine.session_gain(base + 5)))
+                if laps:
+                    np.testing.assert_array_equal(gain, engine.session_gain(base))
+
+    def test_race_points_and_podiums(self):
+        for session_type, table in (("GP", engine.POINTS_GP), ("S", engine.POINTS_SPRINT)):
+            with self.subTest(session_type=session_type):
+                state = make_state()
+                outcome = step(state, SessionSpec(0, session_type, "street", seed=7))
+                n = len(state)
+
+                np.testing.assert_array_equal(np.sort(outcome["position"]), np.arange(1, n + 1))
+                self.assertEqual(outcome["points_gained"].sum(), sum(table))
+                self.assertEqual(state.grid["points"].sum(), sum(table))
+                self.assertEqual(state.grid["podiums"].sum(), 3)
+                self.assertEqual(state.grid["fastest_laps"].sum(), 1)
+                self.assertEqual(state.grid["wins"].sum(), 1 if session_type == "GP" else 0)
+                self.assertEqual(outcome["points_gained"][outcome["position"] == 1][0], table[0])
+
+    def test_qualifying_scores_poles_only(self):
+        state = make_state()
+        outcome = step(state, SessionSpec(0, "QC", "wet", seed=3))
+        self.assertEqual(state.grid["pole_positions"].sum(), 1)
+        self.assertEqual(state.grid["pole_positions"][outcome["position"] == 1][0], 1)
+        self.assertFalse(state.grid["points"].any())
+
+    def test_race_laps_rules(self):
+        laps = engine.RACE_LAPS["GP"]
+        for seed in range(20):
+            with self.subTest(seed=seed):
+                state = make_state(seed=seed)
+                outcome = step(state, SessionSpec(0, "GP", "street", seed=seed, laps=laps))
+                position, dnf = outcome["position"], outcome["dnf"]
+                finished = ~dnf
+                n = len(state)
+
+                np.testing.assert_array_equal(np.sort(position), np.arange(1, n + 1))
+                np.testing.assert_array_equal(np.sort(outcome["start_position"]), np.arange(1, n + 1))
+                # abandons classés derrière tous les arrivés, sans points
+                if dnf.any() and finished.any():
+                    self.assertLess(position[finished].max(), position[dnf].min())
+                self.assertFalse(outcome["points_gained"][dnf].any())
+                table = engine.points_table("GP", n)
+                self.assertEqual(outcome["points_gained"].sum(), table[position[finished]].sum())
+
+                np.testing.assert_array_equal(outcome["laps_completed"][finished], laps)
+                self.assertTrue(np.all(outcome["laps_completed"][dnf] < laps))
+                self.assertTrue(np.all(outcome["gap_ms"][dnf] == -1))
+                self.assertTrue(np.all(outcome["gap_ms"][finished] >= 0))
+                self.assertEqual(outcome["gap_ms"][position == 1][0], 0)
+                self.assertEqual(outcome["fastest_lap"].sum(), 1)
+                self.assertEqual(state.grid["podiums"].sum(), min(3, finished.sum()))
+
+    def test_rank_keeps_grid_order_on_ties(self):
+        np.testing.assert_array_equal(engine.rank(np.array([5, 9, 5, 1])), [2, 1, 3, 4])
+        batch = np.array([[1, 2, 3], [3, 3, 3]])
+        np.testing.assert_array_equal(engine.rank(batch), [[3, 2, 1], [1, 2, 3]])
+
+    def test_play_chains_steps(self):
+        sessions = [SessionSpec(i, session_type, "street", seed=100 + i)
+                    for i, session_type in enumerate(("FP", "QS", "S", "QC", "GP"))]
+        played = play(make_state(), sessions)
+
+        stepped = make_state()
+        for session in sessions:
+            step(stepped, session)
+        for f in engine.GRID_FIELDS:
+            np.testing.assert_array_equal(played.grid[f], stepped.grid[f], err_msg=f)
+
+    def test_standings_order(self):
+        state = make_state(n=4)
+        state.grid["points"][:] = [10, 25, 10, 0]
+        state.grid["wins"][:] = [0, 1, 1, 0]
+        self.assertEqual(state.standings_order(), [1, 2, 0, 3])
+
+
+class MonteCarloTests(SimpleTestCase):
+    """montecarlo.simulate_runs : résultat fixé par (seed, runs), quel que soit le nombre de workers."""
+
+    SCHEDULE = [("QC", "street", None), ("GP", "street", None), ("S", "wet", None), ("GP", "high_speed", None)]
+
+    def run_with(self, workers: int, seed=42, runs=montecarlo.CHUNK_RUNS * 2 + 17):
+        parallel.shutdown_pool()
+        self.addCleanup(parallel.shutdown_pool)
+        with self.settings(F1_SIM_WORKERS=workers):
+            return montecarlo.simulate_runs(make_state().grid, self.SCHEDULE, runs, seed=seed)
+
+    def test_chunks_deterministic_across_workers(self):
+        single = self.run_with(1)
+        for workers in (2, 3):
+            with self.subTest(workers=workers):
+                multi = self.run_with(workers)
+                for key in single:
+                    np.testing.assert_array_equal(single[key], multi[key], err_msg=key)
+
+    def test_totals(self):
+        runs = montecarlo.CHUNK_RUNS + 3
+        totals = self.run_with(1, runs=runs)
+        self.assertEqual(totals["titles"].sum(), runs)
+        np.testing.assert_array_equal(totals["position_counts"].sum(axis=0), np.full(len(make_state()), runs))
+        self.assertEqual(montecarlo.chunk_sizes(runs), [montecarlo.CHUNK_RUNS, 3])
+        self.assertFalse(np.array_equal(totals["position_counts"],
+                                        self.run_with(1, seed=7, runs=runs)["position_counts"]))
+
+
+class ReplayTests(TestCase):
+    """replay_season reconstruit, depuis les seeds seuls, le classement écrit par simulate_until."""
+
+    def setUp(self):
+        call_command("seeds_f1", stdout=StringIO())
+        self.career = Career.default()
+
+    def test_replay_matches_simulation(self):
+        simulation.simulate_until(self.career, 20)
+        simulation.simulate_next(self.career)
+
+        written = simulation.standings_at(self.career)
+        replayed = simulation.replay_season(self.career)
+
+        self.assertEqual(written["session_index"], 21)
+        columns = ("id", "points", "wins", "podiums")
+        self.assertEqual([[s[c] for c in columns] for s in written["standings"]],
+                         [[s[c] for c in columns] for s in replayed["standings"]])
+
+    def test_snapshots_are_cumulative(self):
+        simulation.simulate_until(self.career, 12)
+        results = SessionResult.objects.filter(session__career=self.career)
+        for index in range(13):
+            with self.subTest(index=index):
+                standings = simulation.standings_at(self.career, index)
+                self.assertEqual(standings["session_index"], index)
+                earned = dict(results.filter(session__index__lte=index)
+                              .values_list("driver_id").annotate(total=Sum("points_gained")))
+                self.assertEqual({row["id"]: row["points"] for row in standings["standings"] if row["points"]},
+                                 {k: v for k, v in earned.items() if v})
+                replayed = simulation.replay_season(self.career, index)["standings"]
+                columns = ("id", "points", "wins", "podiums")
+                self.assertEqual([[row[c] for c in columns] for row in standings["standings"]],
+                                 [[row[c] for c in columns] for row in replayed])
+
+        latest = simulation.standings_at(self.career)
+        self.assertEqual(latest["session_index"], 12)
+        self.assertEqual({row["id"]: row["points"] for row in latest["standings"]},
+                         dict(self.career.drivers.values_list("id", "points")))
+
+    def test_replay_is_read_only(self):
+        simulation.simulate_until(self.career, 5)
+        before = list(self.career.drivers.order_by("id").values_list("points", "speed"))
+        simulation.replay_season(self.career)
+        self.assertEqual(list(self.career.drivers.order_by("id").values_list("points", "speed")), before)
+
+
+class RerunTests(TestCase):
+    """simulate_session(force=True) rejoue la session depuis l'état d'avant elle."""
+
+    def setUp(self):
+        caches["outcomes"].clear()
+        call_command("seeds_f1", stdout=StringIO())
+        self.career = Career.default()
+
+    def state(self):
+        return list(self.career.drivers.order_by("id").values_list("points", "wins", "speed", "experience"))
+
+    def test_rerun_does_not_stack(self):
+        for index in (0, 5):
+            with self.subTest(index=index):
+                simulation.reset_season(self.career)
+                if index:
+                    simulation.simulate_until(self.career, index - 1)
+                first = simulation.simulate_session(self.career, index)
+                after = self.state()
+                standings = simulation.standings_at(self.career)
+
+                self.assertEqual(simulation.simulate_session(self.career, index, force=True), first)
+                self.assertEqual(self.state(), after)
+                self.assertEqual(simulation.standings_at(self.career), standings)
+
+    def test_rerun_is_served_from_cache(self):
+        first = simulation.simulate_session(self.career, 0)
+        with mock.patch.object(simulation, "step", side_effect=AssertionError("recalcul")):
+            self.assertEqual(simulation.simulate_session(self.career, 0, force=True), first)
+
+    def test_rerun_replays_later_sessions(self):
+        simulation.simulate_until(self.career, 10)
+        first = simulation.simulate_session(self.career, 3)
+        after = self.state()
+        snapshots = list(self.career.snapshots.order_by("session_index").values_list("standings", flat=True))
+
+        results = SessionResult.objects.filter(session__career=self.career)
+        count = results.count()
+
+        self.assertEqual(simulation.simulate_session(self.career, 3, force=True), first)
+        self.assertEqual(self.state(), after)
+        self.assertEqual(list(self.career.snapshots.order_by("session_index")
+                              .values_list("standings", flat=True)), snapshots)
+        self.assertEqual(results.count(), count)
+
+        # snapshot k : cumul jusqu'à k seulement, pas l'état final
+        points = {row["id"]: row["points"] for row in simulation.standings_at(self.career, 3)["standings"]}
+        earned = dict(SessionResult.objects.filter(session__career=self.career, session__index__lte=3)
+                      .values_list("driver_id").annotate(total=Sum("points_gained")))
+        self.assertEqual({k: v for k, v in points.items() if v}, {k: v for k, v in earned.items() if v})
+
+    def test_rerun_uses_new_inputs_for_later_sessions(self):
+        simulation.simulate_until(self.career, 10)
+        before = {index: simulation.standings_at(self.career, index)["standings"] for index in (2, 10)}
+
+        # une entrée d'une session suivante change (seed) : recalculée au re-run
+        self.career.sessions.filter(index=9).update(seed=12345)
+        simulation.simulate_session(self.career, 3, force=True)
+
+        self.assertEqual(simulation.standings_at(self.career, 2)["standings"], before[2])
+        self.assertNotEqual(simulation.standings_at(self.career, 10)["standings"], before[10])
+        final = {d.id: d.points for d in self.career.drivers.all()}
+        self.assertEqual({row["id"]: row["points"] for row in simulation.standings_at(self.career)["standings"]},
+                         final)
+
+    def test_reset_refuses_unlinked_drivers(self):
+        simulation.simulate_until(self.career, 5)
+        self.career.drivers.filter(pk=self.career.drivers.order_by("id").values("pk")[:1]).update(baseline=None)
+        before = self.state()
+
+        with self.assertRaisesMessage(ValueError, "1 pilote(s) sans baseline"):
+            simulation.reset_season(self.career)
+        self.assertEqual(self.state(), before)
+        self.assertTrue(self.career.sessions.filter(index=5, is_simulated=True).exists())
+
+        # progression seule : pas besoin de baseline
+        simulation.reset_season(self.career, reset_skills=False)
+        self.assertFalse(self.career.drivers.exclude(points=0).exists())
+
+    def test_season_start_is_not_a_standing(self):
+        self.assertIsNone(simulation.standings_at(self.career))
+        simulation.simulate_session(self.career, 0)
+        self.assertEqual(list(self.career.snapshots.order_by("session_index")
+                              .values_list("session_index", flat=True)), [simulation.SEASON_START, 0])
+        self.assertEqual(simulation.standings_at(self.career)["session_index"], 0)
+        self.assertIsNone(simulation.standings_at(self.career, simulation.SEASON_START))
+
+
+class BudgetTests(TestCase):
+    """Journal de budget : gains idempotents, compaction, reset par entrée inverse."""
+
+    def setUp(self):
+        call_command("seeds_f1", stdout=StringIO())
+        self.career = Career.default()
+        self.gp = self.career.sessions.filter(session_type="GP").order_by("index").first()
+
+    def age(self, entries=None):
+        """Sort les entrées de la fenêtre de grâce : compactables."""
+        entries = BudgetEntry.objects.filter(career=self.career) if entries is None else entries
+        entries.update(created_at=timezone.now() - budget.COMPACT_GRACE * 2)
+
+    def test_award_is_idempotent_per_session(self):
+        self.assertEqual(budget.award(self.career, 5_000_000, session=self.gp), (5_000_000, True))
+        self.assertEqual(budget.award(self.career, 5_000_000, session=self.gp), (5_000_000, False))
+        self.assertEqual(budget.award(self.career, 1_000_000), (6_000_000, True))
+        self.assertEqual(budget.award(self.career, 1_000_000), (7_000_000, True))
+
+    def test_compact_keeps_balance(self):
+        for amount in (1, 2, 3):
+            budget.award(self.career, amount * 1_000_000)
+        self.age()
+        budget.award(self.career, 4_000_000)
+
+        # l'entrée récente reste dans la queue
+        self.assertEqual(budget.compact(self.career), 3)
+        self.career.refresh_from_db()
+        self.assertEqual(self.career.budget, 6_000_000)
+        self.assertEqual(budget.balance(self.career.pk), 10_000_000)
+        self.assertEqual(budget.compact(self.career), 0)
+
+    def test_reset_after_compact(self):
+        budget.award(self.career, 8_000_000, reason="result", session=self.gp)
+        budget.award(self.career, 2_000_000)
+        self.age()
+        budget.compact(self.career)
+
+        budget.reset(self.career)
+        self.assertEqual(budget.balance(self.career.pk), 0)
+        # rien de supprimé : une entrée inverse, le filigrane reste valide
+        self.assertEqual(BudgetEntry.objects.filter(career=self.career).count(), 3)
+        self.age()
+        budget.compact(self.career)
+        self.assertEqual(budget.balance(self.career.pk), 0)
+
+        # session rejouée à la saison suivante : payée à nouveau
+        self.assertEqual(budget.award(self.career, 8_000_000, reason="result", session=self.gp),
+                         (8_000_000, True))
+
+    def test_simulation_pays_player_results(self):
+        player = self.career.drivers.order_by("id").first()
+        client = Client(HTTP_HOST="localhost")
+        simulation.simulate_until(self.career, self.gp.index - 1)
+
+        response = client.post(f"/api/simulate/session/{self.gp.index}/", {"driver": player.pk},
+                               content_type="application/json").json()
+        position = SessionResult.objects.get(session=self.gp, driver=player).position
+        self.assertEqual(response["award"], budget.result_amount("GP", position))
+        self.assertEqual(response["budget"], response["award"])
+
+        # re-run : la session n'est pas payée deux fois
+        response = client.post(f"/api/simulate/session/{self.gp.index}/?force=1").json()
+        self.assertEqual(response["budget"], budget.result_amount("GP", position))
+        self.assertEqual(BudgetEntry.objects.filter(career=self.career, reason="result").count(), 1)
+
+        # gain de course refusé au client
+        response = client.post("/api/season/budget/award/", {"amount": 1, "reason": "result"},
+                               content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_result_amount(self):
+        self.assertEqual(budget.result_amount("GP", 1), 20_000_000)
+        self.assertEqual(budget.result_amount("S", 22), 1_000_000)
+        self.assertEqual(budget.result_amount("GP", 30), 1_000_000)
+        self.assertIsNone(budget.result_amount("QC", 1))
+
+
+class JobTests(TestCase):
+    """File de tâches : soumission idempotente, réclamation, tâches orphelines."""
+
+    def setUp(self):
+        self.career = Career.default()
+
+    def submit(self, key=None, kind="odds", params=None):
+        return jobs.submit(self.career, kind, params or {"runs": 10, "seed": 1}, key=key)
+
+    def test_submit_same_key_returns_same_job(self):
+        job, created = self.submit(key="abc")
+        self.assertTrue(created)
+        self.assertEqual(self.submit(key="abc"), (job, False))
+
+        # clé dérivée : même tâche tant qu'elle est active, une nouvelle ensuite
+        derived, created = self.submit()
+        self.assertTrue(created)
+        self.assertEqual(self.submit(), (derived, False))
+        Job.objects.filter(pk=derived.pk).update(status=Job.DONE)
+        self.assertTrue(self.submit()[1])
+
+        # la clé explicite reste attachée à sa tâche, même terminée
+        Job.objects.filter(pk=job.pk).update(status=Job.DONE)
+        self.assertEqual(self.submit(key="abc"), (job, False))
+
+    def test_submit_race_returns_winner(self):
+        # une soumission concurrente gagne l'INSERT puis se termine avant
+        # notre relecture : pas de 500, c'est elle qui est renvoyée
+        winner, _ = self.submit()
+        Job.objects.filter(pk=winner.pk).update(status=Job.DONE)
+
+        conflict = IntegrityError("unique_active_job")
+        with mock.patch.object(Job.objects, "create", side_effect=conflict):
+            self.assertEqual(self.submit(), (winner, False))
+
+    def test_claim_takes_oldest_once(self):
+        first, _ = self.submit(key="a")
+        second, _ = self.submit(key="b")
+
+        claimed = jobs.claim("w1")
+        self.assertEqual(claimed.pk, first.pk)
+        self.assertEqual((claimed.status, claimed.worker, claimed.attempts), (Job.RUNNING, "w1", 1))
+        self.assertEqual(jobs.claim("w2").pk, second.pk)
+        self.assertIsNone(jobs.claim("w3"))
+
+    def test_requeue_stale(self):
+        old = timezone.now() - timedelta(minutes=10)
+        retry, _ = self.submit(key="retry")
+        lost, _ = self.submit(key="lost")
+        fresh, _ = self.submit(key="fresh")
+        Job.objects.filter(pk=retry.pk).update(status=Job.RUNNING, started_at=old, attempts=1)
+        Job.objects.filter(pk=lost.pk).update(status=Job.RUNNING, started_at=old, attempts=jobs.MAX_ATTEMPTS)
+        Job.objects.filter(pk=fresh.pk).update(status=Job.RUNNING, started_at=timezone.now(), attempts=1)
+
+        self.assertEqual(jobs.requeue_stale(timedelta(minutes=5)), 1)
+        status = dict(Job.objects.values_list("key", "status"))
+        self.assertEqual(status, {"retry": Job.PENDING, "lost": Job.FAILED, "fresh": Job.RUNNING})
+
+
+class JobClaimConcurrencyTests(TransactionTestCase):
+    """Workers concurrents (une connexion chacun) : chaque tâche n'est réclamée qu'une fois."""
+
+    @skipUnlessDBFeature("has_select_for_update_skip_locked")
+    def test_concurrent_claims_are_distinct(self):
+        career = Career.default()
+        pending = {jobs.submit(career, "odds", {"runs": 10, "seed": i})[0].pk for i in range(4)}
+        claimed = []
+        barrier = threading.Barrier(6)
+
+        def worker(name):
+            try:
+                barrier.wait()
+                job = jobs.claim(name)
+                if job is not None:
+                    claimed.append(job.pk)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker, args=(f"w{i}",)) for i in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(sorted(claimed), sorted(pending))
+        self.assertEqual(Job.objects.filter(status=Job.RUNNING).count(), 4)
+
+
+class CareerTests(TestCase):
+    """Résolution de la partie d'une requête : seules les écritures créent."""
+
+    def test_read_does_not_create(self):
+        user = User.objects.create_user("reader")
+        with self.assertRaises(Http404):
+            resolve_career(user)
+        with self.assertRaises(Http404):
+            resolve_career(None)
+        self.assertFalse(Career.objects.exists())
+
+    def test_write_creates_once(self):
+        user = User.objects.create_user("writer")
+        career = resolve_career(user, create=True)
+
+        self.assertEqual(career.slot, f"user:{user.pk}")
+        self.assertEqual(resolve_career(user), career)
+        self.assertEqual(ensure_career(user), career)
+        self.assertEqual(Career.objects.filter(profile__user=user).count(), 1)
+
+    def test_default_career_is_unique(self):
+        career = Career.default()
+        self.assertEqual(Career.default(), career)
+        self.assertEqual(resolve_career(None), career)
+        self.assertEqual(Career.objects.count(), 1)
+
+
+class ConditionalReadTests(TestCase):
+    """ETag / 304 des lectures : un client à jour ne coûte aucune requête DB."""
+
+    def setUp(self):
+        cache.clear()
+        call_command("seeds_f1", stdout=StringIO())
+        self.career = Career.default()
+        self.client = Client(HTTP_HOST="localhost")
+
+    def test_not_modified_without_queries(self):
+        for path in ("/api/drivers/", "/api/season/calendar/", "/api/season/budget/",
+                     "/api/season/standings/", "/api/season/results/3/"):
+            with self.subTest(path=path):
+                etag = self.client.get(path)["ETag"]
+                with self.assertNumQueries(0):
+                    response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response["ETag"], etag)
+
+    def test_write_changes_etag(self):
+        etag = self.client.get("/api/drivers/")["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.client.post("/api/simulate/next/").status_code, 200)
+
+        response = self.client.get("/api/drivers/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(self.client.get("/api/drivers/", HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
+
+    def test_weekend_results_in_one_query(self):
+        simulation.simulate_until(self.career, 5)
+        gp_name = self.career.sessions.get(index=5).gp_name
+        weekend = list(self.career.sessions.filter(gp_name=gp_name).order_by("index"))
+
+        with self.assertNumQueries(1):
+            sessions = async_to_sync(async_views._stored_results)(self.career, gp_name=gp_name)
+
+        self.assertEqual([s["index"] for s in sessions], [s.index for s in weekend])
+        for session, stored in zip(weekend, sessions):
+            with self.subTest(index=session.index):
+                self.assertEqual(stored["is_simulated"], session.is_simulated)
+                expected = (simulation.simulate_session(self.career, session.index)
+                            if session.is_simulated and session.session_type != "FP" else [])
+                self.assertEqual(stored["results"], expected)
+
+    def test_new_career_is_not_served_from_hint(self):
+        user = User.objects.create_user("player")
+        ensure_career(user)
+        auth = {"HTTP_AUTHORIZATION": f"Bearer {issue_tokens(user)['access']}"}
+        etag = self.client.get("/api/drivers/", **auth)["ETag"]
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/api/drivers/", HTTP_IF_NONE_MATCH=etag, **auth).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            created = self.client.post("/api/careers/", {"name": "Saison 2"}, **auth).json()
+        response = self.client.get("/api/drivers/", HTTP_IF_NONE_MATCH=etag, **auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith(f'"drivers:{created["id"]}-'))
@@ -0,0 +1,153 @@
+"""
+Instrumentation par requête : temps total, temps DB, nombre de requêtes SQL
+et spans nommés posés par les services (`with span("score"): ...`).
+
+Le middleware publie le tout dans un header `Server-Timing` (lisible dans
+l'onglet réseau du navigateur) et dans une ligne de log JSON (logger
+"f1.timing").
+
+Désactivé (settings.F1_SERVER_TIMING = False) : le middleware se retire de
+la pile au démarrage (MiddlewareNotUsed) et `span` se réduit à la lecture
+d'une ContextVar vide.
+
+Sync et async : l'état de la requête vit dans des ContextVar, copiées par
+asgiref dans les threads de sync_to_async. Les requêtes SQL d'une vue async
+(exécutées dans un autre thread, donc sur une autre connexion) sont donc
+bien comptées.
+"""
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+
+logger = logging.getLogger("f1.timing")
+
+# spans de la requête courante {nom: secondes} ; None hors requête instrumentée
+_spans: ContextVar = ContextVar("f1_timing_spans", default=None)
+
+# compteur SQL de la requête courante ; None hors requête instrumentée
+_queries: ContextVar = ContextVar("f1_timing_queries", default=None)
+
+
+@contextmanager
+def span(name: str):
+    """
+    Chronomètre un bloc sous `name` (cumulé si le bloc est répété, ex: une
+    boucle de sessions). Sans requête instrumentée en cours : no-op.
+    """
+    spans = _spans.get()
+    if spans is None:
+        yield
+        return
+
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        spans[name] = spans.get(name, 0.0) + time.perf_counter() - t0
+
+
+class _QueryTimer:
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+def _record_query(execute, sql, params, many, context):
+    """execute_wrapper permanent : compte et chronomètre si une requête est instrumentée."""
+    timer = _queries.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+
+    t0 = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timer.seconds += time.perf_counter() - t0
+        timer.count += 1
+
+
+def _install(connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+class ServerTimingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "F1_SERVER_TIMING", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+        # toutes les connexions (une par thread) passent par _record_query
+        connection_created.connect(_install, dispatch_uid="f1.timing")
+        for conn in connections.all(initialized_only=True):
+            _install(conn)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        state = self._start()
+        try:
+            response = self.get_response(request)
+        finally:
+            self._stop(state)
+        return self._finish(request, response, state)
+
+    async def __acall__(self, request):
+        state = self._start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            self._stop(state)
+        return self._finish(request, response, state)
+
+    def _start(self) -> dict:
+        spans, queries = {}, _QueryTimer()
+        return {
+            "spans": spans,
+            "queries": queries,
+            "tokens": (_spans.set(spans), _queries.set(queries)),
+            "t0": time.perf_counter(),
+        }
+
+    def _stop(self, state: dict) -> None:
+        state["total"] = time.perf_counter() - state["t0"]
+        spans_token, queries_token = state["tokens"]
+        _spans.reset(spans_token)
+        _queries.reset(queries_token)
+
+    def _finish(self, request, response, state: dict):
+        spans, queries, total = state["spans"], state["queries"], state["total"]
+
+        metrics = [("total", total, None), ("db", queries.seconds, f"{queries.count} queries")]
+        metrics += [(name, seconds, None) for name, seconds in spans.items()]
+
+        response["Server-Timing"] = ", ".join(
+            f"{name};dur={seconds * 1000:.1f}" + (f';desc="{desc}"' if desc else "")
+            for name, seconds, desc in metrics
+        )
+
+        logger.info(json.dumps({
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "total_ms": round(total * 1000, 2),
+            "db_ms": round(queries.seconds * 1000, 2),
+            "queries": queries.count,
+            "spans": {name: round(seconds * 1000, 2) for name, seconds in spans.items()},
+        }))
+        return response
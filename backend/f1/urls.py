@@ -1,26 +1,41 @@
 from django.urls import path
-from . import views
-from .auth_views import login, me, set_avatar, register
+from . import async_views, stream_views, views
+from .auth_views import login, set_avatar, register
 
 urlpatterns = [
     # API
-    path("health/", views.health),
-    path("drivers/", views.drivers_list),
-    path("teams/", views.teams_list),
-    path("season/calendar/", views.calendar_list),
+    path("health/", async_views.health, name="health"),
+    path("drivers/", async_views.drivers_list, name="drivers"),
+    path("teams/", async_views.teams_list, name="teams"),
+    path("teams/standings/", async_views.team_standings, name="team-standings"),
+    path("season/calendar/", async_views.calendar_list, name="calendar"),
+    path("season/results/", async_views.weekend_results, name="weekend-results"),
+    path("season/results/<int:session_index>/", async_views.session_results, name="session-results"),
+    path("season/odds/", views.season_odds, name="season-odds"),
+    path("season/replay/", views.season_replay, name="season-replay"),
+    path("season/standings/", views.season_standings, name="season-standings"),
+    path("season/preview/", views.season_preview, name="season-preview"),
+    path("careers/", views.careers_view, name="careers"),
 
     # AUTH
-    path("auth/login/", login),
-    path("auth/me/", me),
-    path("auth/avatar/", set_avatar),
-    path("auth/register/", register),
+    path("auth/login/", login, name="login"),
+    path("auth/me/", async_views.me, name="me"),
+    path("auth/avatar/", set_avatar, name="avatar"),
+    path("auth/register/", register, name="register"),
 
     # BUDGET
-    path("season/budget/", views.budget_get),
-    path("season/budget/award/", views.budget_award),
+    path("season/budget/", async_views.budget_get, name="budget"),
+    path("season/budget/award/", views.budget_award, name="budget-award"),
 
     # SIMULATION
-    path("simulate/session/<int:session_index>/", views.simulate_one),
-    path("simulate/next/", views.simulate_next_view),
-    path("season/reset/", views.season_reset_view),
+    path("simulate/session/<int:session_index>/", views.simulate_one, name="simulate-session"),
+    path("simulate/next/", views.simulate_next_view, name="simulate-next"),
+    path("simulate/until/", views.simulate_until_view, name="simulate-until"),
+    path("simulate/stream/", stream_views.simulate_stream, name="simulate-stream"),
+    path("season/reset/", views.season_reset_view, name="season-reset"),
+
+    # JOBS (tâches de fond, voir manage.py run_jobs)
+    path("jobs/", views.jobs_submit, name="jobs"),
+    path("jobs/<int:job_id>/", views.job_status, name="job-status"),
+    path("jobs/<int:job_id>/result/", views.job_result, name="job-result"),
 ]
\ No newline at end of file
@@ -1,112 +1,404 @@
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework import status
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
 
-from .models import Driver, GameState, SeasonSession, Team
-from .services.simulation import simulate_session, simulate_next, reset_season
+from django.http import Http404
+from django.urls import reverse
+
+from .cache import cached_json, not_modified, season_scope
+from .models import Career, Job, Profile, SeasonSession
+from .profiling import profiled
+from .services import budget, jobs
+from .services.careers import career_hint, create_career, remember_career, resolve_career
+from .services.simulation import (
+    championship_odds,
+    odds_runs,
+    preview_season,
+    replay_season,
+    reset_season,
+    season_seed,
+    simulate_next,
+    simulate_session,
+    simulate_until,
+    standings_at,
+)
+
+
+def _flag(value) -> bool:
+    return str(value) in ("1", "true", "True", "yes")
+
+
+def _param(request, name: str):
+    """Paramètre lu dans la query string, sinon dans le body."""
+    if name in request.query_params:
+        return request.query_params.get(name)
+    data = request.data if isinstance(request.data, dict) else {}
+    return data.get(name)
+
+
+def _career(request, create: bool = False) -> Career:
+    """
+    Partie ciblée : `?career=<id>` pour un joueur connecté, sinon sa partie
+    courante. `create=True` (vues d'écriture) : créée si elle n'existe pas.
+    """
+    return resolve_career(request.user, request.query_params.get("career"), create=create)
+
+
+def _player(request, career: Career) -> Career:
+    """
+    `driver` (query ou body, optionnel) : pilote incarné par le joueur ; ses
+    résultats en course sont payés en budget pendant la simulation.
+    """
+    driver_id = _param(request, "driver")
+    if driver_id in (None, ""):
+        return career
+    try:
+        driver_id = int(driver_id)
+    except (TypeError, ValueError):
+        raise ValueError("driver invalide.")
+    if driver_id != career.player_id:
+        if not career.drivers.filter(pk=driver_id).exists():
+            raise ValueError("Pilote introuvable.")
+        Career.objects.filter(pk=career.pk).update(player_id=driver_id)
+        career.player_id = driver_id
+    return career
+
+
+def _read_career(request, name: str, scope):
+    """
+    (partie, None), ou (None, 304) pour un client à jour, décidé avant toute
+    requête DB : id de partie mémorisé pour ce client, `name` (avec
+    `{career}`) et `scope(id)` donnent l'ETag. Les vues de lecture
+    authentifient sans état (JWTStatelessUserAuthentication) : le token
+    suffit, l'utilisateur n'est pas relu en base.
+    """
+    user, career_id = request.user, request.query_params.get("career")
+    hint = career_hint(user, career_id)
+    if hint is not None:
+        response = not_modified(request, name.format(career=hint), scope(hint))
+        if response is not None:
+            return None, response
+
+    career = resolve_career(user, career_id)
+    if career.pk != hint:
+        remember_career(user, career_id, career)
+    return career, None
+
+
+@api_view(["GET", "POST"])
+@permission_classes([IsAuthenticated])
+def careers_view(request):
+    """
+    GET  : parties du joueur connecté
+    POST : nouvelle partie (drivers + calendrier repartent de la baseline)
+    """
+    profile, _ = Profile.objects.get_or_create(user=request.user)
+
+    if request.method == "POST":
+        name = (request.data.get("name") or "").strip() or "Saison 2026"
+        career = create_career(profile, name=name[:120])
+        return Response(_career_payload(career), status=status.HTTP_201_CREATED)
+
+    return Response([_career_payload(c) for c in budget.with_balance(profile.careers.order_by("-id"))])
+
+
+def _career_payload(c: Career) -> dict:
+    balance = c.balance if hasattr(c, "balance") else budget.balance(c.pk)
+    return {"id": c.id, "name": c.name, "created_at": c.created_at.isoformat(), "budget": balance}
 
 
 @api_view(["GET"])
+@authentication_classes([JWTStatelessUserAuthentication])
 @permission_classes([AllowAny])
-def health(request):
-    return Response({"ok": True})
+def season_odds(request):
+    """
+    Probabilités de titre (Monte Carlo) depuis l'état courant. Lecture seule.
+    Params : runs (défaut 10000, 2000 en mode tour par tour ; max 100000),
+    seed (défaut : seed de saison, donc un résultat stable, et cachable,
+    pour un même état). Plus de runs sans bloquer la requête : tâche "odds".
+    """
+    try:
+        runs = int(request.query_params.get("runs") or odds_runs())
+        seed = request.query_params.get("seed")
+        seed = int(seed) if seed not in (None, "") else None
+    except ValueError:
+        return Response({"detail": "runs/seed invalides."}, status=status.HTTP_400_BAD_REQUEST)
+
+    # seed de saison : nommé "season" (il change avec la version du scope)
+    name = f"odds:{{career}}:{runs}:{'season' if seed is None else seed}"
+    career, response = _read_career(request, name, season_scope)
+    if response is not None:
+        return response
+    return cached_json(request, name.format(career=career.id),
+                       lambda: championship_odds(career, runs=runs,
+                                                 seed=season_seed(career) if seed is None else seed),
+                       scope=season_scope(career.id))
 
 
 @api_view(["GET"])
+@authentication_classes([JWTStatelessUserAuthentication])
 @permission_classes([AllowAny])
-def teams_list(request):
-    qs = Team.objects.all().order_by("name")
-    return Response([
-        {"id": t.id, "name": t.name, "logo_url": getattr(t, "logo_url", None)}
-        for t in qs
-    ])
+def season_replay(request):
+    """
+    Classement reconstruit à partir du seed de saison (baseline + sessions
+    jouées rejouées). Lecture seule. Param : index (optionnel).
+    """
+    index = request.query_params.get("index")
+    try:
+        until_index = int(index) if index not in (None, "") else None
+    except ValueError:
+        return Response({"detail": "index invalide."}, status=status.HTTP_400_BAD_REQUEST)
+
+    career, response = _read_career(request, f"replay:{{career}}:{until_index}", season_scope)
+    if response is not None:
+        return response
+    try:
+        return cached_json(request, f"replay:{career.id}:{until_index}",
+                           lambda: replay_season(career, until_index),
+                           scope=season_scope(career.id))
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
 @api_view(["GET"])
+@authentication_classes([JWTStatelessUserAuthentication])
 @permission_classes([AllowAny])
-def drivers_list(request):
-    qs = Driver.objects.select_related("team").all().order_by("-points", "-wins")
-    return Response([
-        {
-            "id": d.id,
-            "name": d.name,
-            "surname": d.surname,
-            "team": d.team.name if d.team_id else None,
-            "team_id": d.team_id,
-            "team_logo_url": getattr(d.team, "logo_url", None) if d.team_id else None,
-            "image_url": getattr(d, "image_url", None),
-            "image_key": getattr(d, "image_key", None),
-            "country": getattr(d, "country", None),
-            "number": getattr(d, "number", None),
-            "points": getattr(d, "points", 0),
-            "wins": getattr(d, "wins", 0),
-            "podiums": getattr(d, "podiums", 0),
-            "pole_positions": getattr(d, "pole_positions", 0),
-            "fastest_laps": getattr(d, "fastest_laps", 0),
-            "speed": getattr(d, "speed", None),
-            "racing": getattr(d, "racing", None),
-            "reaction": getattr(d, "reaction", None),
-            "experience": getattr(d, "experience", None),
-            "consistency": getattr(d, "consistency", None),
-            "error_rate": getattr(d, "error_rate", None),
-            "street_circuit_affinity": getattr(d, "street_affinity", getattr(d, "street_circuit_affinity", 0)),
-            "high_speed_circuit_affinity": getattr(d, "high_speed_affinity", getattr(d, "high_speed_circuit_affinity", 0)),
-            "wet_circuit_affinity": getattr(d, "wet_affinity", getattr(d, "wet_circuit_affinity", 0)),
-        }
-        for d in qs
-    ])
+def season_standings(request):
+    """
+    Classement cumulé après une session (snapshot écrit à la simulation).
+    Param : index (optionnel, défaut : dernière session jouée).
+    """
+    index = request.query_params.get("index")
+    try:
+        session_index = int(index) if index not in (None, "") else None
+    except ValueError:
+        return Response({"detail": "index invalide."}, status=status.HTTP_400_BAD_REQUEST)
 
+    career, response = _read_career(request, f"standings:{{career}}:{session_index}", season_scope)
+    if response is not None:
+        return response
+    return cached_json(request, f"standings:{career.id}:{session_index}",
+                       lambda: standings_at(career, session_index)
+                       or {"session_index": None, "standings": []},
+                       scope=season_scope(career.id))
 
-@api_view(["GET"])
+
+@api_view(["POST"])
 @permission_classes([AllowAny])
-def calendar_list(request):
-    qs = SeasonSession.objects.all().order_by("index")
-    return Response([
-        {
-            "index": s.index,
-            "gp_name": s.gp_name,
-            "circuit_name": s.circuit_name,
-            "date": s.date.isoformat() if s.date else None,
-            "session_type": s.session_type,
-            "circuit_type": s.circuit_type,
-            "is_simulated": s.is_simulated,
+def season_preview(request):
+    """
+    "Et si…" simulé en mémoire depuis l'état courant : rien n'est écrit,
+    aucun verrou n'est pris. Body (JSON) :
+    - scope   : "session" (défaut) | "gp" | "season", ou index / gp (comme /simulate/until/)
+    - drivers : {"<driver_id>": {"speed": 95, "wet_affinity": 10, ...}}
+    - circuit_types : {"<index>": "wet"}
+    - skip    : [index, ...] sessions non courues
+    - seed    : optionnel (défaut : seeds de la vraie simulation)
+    - results : 1 pour le détail par session (défaut : oui si une seule session)
+    """
+    career = _career(request)
+    data = request.data if isinstance(request.data, dict) else {}
+    scope = data.get("scope") or "session"
+
+    try:
+        index, seed = data.get("index"), data.get("seed")
+        options = {
+            "target_index": int(index) if index not in (None, "") else None,
+            "gp_name": data.get("gp") or None,
+            "drivers": {int(k): {f: int(v) for f, v in fields.items()}
+                        for k, fields in (data.get("drivers") or {}).items()},
+            "circuit_types": {int(k): v for k, v in (data.get("circuit_types") or {}).items()},
+            "skip": [int(i) for i in data.get("skip") or []],
+            "seed": int(seed) if seed not in (None, "") else None,
         }
-        for s in qs
-    ])
+    except (AttributeError, TypeError, ValueError):
+        return Response({"detail": "Paramètres invalides."}, status=status.HTTP_400_BAD_REQUEST)
+
+    results = data.get("results")
+    options["include_results"] = (_flag(results) if results is not None
+                                  else scope == "session" and options["target_index"] is None
+                                  and options["gp_name"] is None)
+
+    try:
+        payload = preview_season(career, scope, **options)
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(payload)
 
 
 @api_view(["POST"])
 @permission_classes([AllowAny])
+@profiled
 def simulate_one(request, session_index: int):
+    """
+    Body optionnel : driver (pilote du joueur). Réponse : résultats, gain
+    de course de la session (None hors S/GP) et solde du budget.
+    """
     force = request.query_params.get("force") in ("1", "true", "True", "yes")
-    return Response({"results": simulate_session(session_index, force=force)})
+    try:
+        career = _player(request, _career(request, create=True))
+        results = simulate_session(career, session_index, force=force)
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({
+        "results": results,
+        "award": budget.session_award(career, session_index),
+        "budget": budget.balance(career.pk),
+    })
 
 
 @api_view(["POST"])
 @permission_classes([AllowAny])
+@profiled
 def simulate_next_view(request):
     force = request.query_params.get("force") in ("1", "true", "True", "yes")
-    return Response(simulate_next(force=force))
+    try:
+        career = _player(request, _career(request, create=True))
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(simulate_next(career, force=force))
 
 
 @api_view(["POST"])
 @permission_classes([AllowAny])
-def season_reset_view(request):
-    GameState.get().__class__.objects.filter(pk=1).update(budget=0)
-    return Response(reset_season())
+@profiled
+def simulate_until_view(request):
+    """
+    Avance rapide en un seul appel.
+    Params (query ou body) :
+    - index   : simule jusqu'à cette session incluse
+    - gp      : simule jusqu'à la fin de ce GP
+    - results : 1 pour renvoyer les résultats de chaque session
+    - driver  : pilote du joueur (gains de course)
+    Sans index ni gp : jusqu'à la fin de saison.
+    """
+    index = _param(request, "index")
+    gp_name = _param(request, "gp") or None
+    include_results = _flag(_param(request, "results"))
 
+    try:
+        target_index = int(index) if index not in (None, "") else None
+    except (TypeError, ValueError):
+        return Response({"detail": "index invalide."}, status=status.HTTP_400_BAD_REQUEST)
 
-@api_view(["GET"])
+    try:
+        payload = simulate_until(_player(request, _career(request, create=True)), target_index,
+                                 gp_name=gp_name, include_results=include_results)
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response(payload)
+
+
+@api_view(["POST"])
 @permission_classes([AllowAny])
-def budget_get(request):
-    return Response({"budget": GameState.get().budget})
+@profiled
+def season_reset_view(request):
+    career = _career(request, create=True)
+    try:
+        payload = reset_season(career)
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    budget.reset(career)
+    return Response(payload)
 
 
 @api_view(["POST"])
 @permission_classes([AllowAny])
 def budget_award(request):
-    amount = int(request.data.get("amount", 0))
-    state = GameState.get()
-    state.budget += amount
-    state.save()
-    return Response({"budget": state.budget})
\ No newline at end of file
+    """
+    Gain de budget : une entrée ajoutée au journal (BudgetEntry).
+    Body : amount, reason (optionnel), session (index, optionnel). Avec une
+    session, un seul gain par motif : rejouer la requête ne paie pas deux fois.
+    Les gains de course (reason "result") sont réservés au serveur : écrits
+    par la simulation elle-même (budget.award_results).
+    """
+    career = _career(request, create=True)
+    try:
+        amount = int(_param(request, "amount") or 0)
+        index = _param(request, "session")
+        session = career.sessions.get(index=int(index)) if index not in (None, "") else None
+    except (TypeError, ValueError):
+        return Response({"detail": "Paramètres invalides."}, status=status.HTTP_400_BAD_REQUEST)
+    except SeasonSession.DoesNotExist:
+        return Response({"detail": "Session introuvable."}, status=status.HTTP_404_NOT_FOUND)
+
+    reason = str(_param(request, "reason") or "award")[:32]
+    if reason == budget.RESULT_REASON:
+        return Response({"detail": "Les gains de course sont attribués par la simulation."},
+                        status=status.HTTP_400_BAD_REQUEST)
+    balance, created = budget.award(career, amount, reason=reason, session=session)
+    return Response({"budget": balance, "created": created})
+
+@api_view(["POST"])
+@permission_classes([AllowAny])
+def jobs_submit(request):
+    """
+    Tâche de fond (exécutée par `manage.py run_jobs`), hors requête HTTP.
+    Body : {"kind": "simulate_until" | "reset" | "odds", "params": {...}}
+    Header optionnel `Idempotency-Key` : rejouer la même clé renvoie la même
+    tâche. Sans clé, une tâche identique encore en file est réutilisée.
+    202 (nouvelle tâche) ou 200 (existante), + Location vers son statut.
+    """
+    career = _career(request, create=True)
+    data = request.data if isinstance(request.data, dict) else {}
+    params = data.get("params") if isinstance(data.get("params"), dict) else {}
+    key = (request.headers.get("Idempotency-Key") or "").strip()[:128] or None
+
+    try:
+        params = jobs.validate(career, str(data.get("kind") or ""), params)
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    job, created = jobs.submit(career, data["kind"], params, key=key)
+    response = Response(_job_payload(job), status=status.HTTP_202_ACCEPTED if created else status.HTTP_200_OK)
+    response["Location"] = reverse("job-status", args=[job.id])
+    return response
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def job_status(request, job_id: int):
+    return Response(_job_payload(_job(request, job_id)))
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def job_result(request, job_id: int):
+    """200 + résultat si terminée, 202 si en file / en cours, 409 si en échec."""
+    job = _job(request, job_id)
+    if job.status == Job.DONE:
+        return Response(job.result)
+    if job.status == Job.FAILED:
+        return Response({"detail": job.error, "status": job.status}, status=status.HTTP_409_CONFLICT)
+    return Response({"detail": "Tâche en cours.", "status": job.status}, status=status.HTTP_202_ACCEPTED)
+
+
+def _job(request, job_id: int) -> Job:
+    """Tâche d'une partie du joueur (ou des parties par défaut pour un anonyme)."""
+    jobs_qs = Job.objects.all()
+    if request.user and request.user.is_authenticated:
+        jobs_qs = jobs_qs.filter(career__profile__user=request.user)
+    else:
+        jobs_qs = jobs_qs.filter(career__profile__isnull=True)
+    job = jobs_qs.filter(pk=job_id).first()
+    if job is None:
+        raise Http404("Tâche introuvable.")
+    return job
+
+
+def _job_payload(job: Job) -> dict:
+    return {
+        "id": job.id,
+        "career": job.career_id,
+        "kind": job.kind,
+        "params": job.params,
+        "status": job.status,
+        "attempts": job.attempts,
+        "error": job.error or None,
+        "created_at": job.created_at.isoformat(),
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
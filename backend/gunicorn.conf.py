@@ -0,0 +1,10 @@
+# Chargé automatiquement par gunicorn (répertoire courant).
+
+
+def child_exit(server, worker):
+    # métriques multi-process : libère les fichiers du worker terminé
+    import os
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
@@ -10,17 +10,6 @@ import CalendarSection from "../components/season/CalendarSection";
 import PlayerCard from "../components/season/PlayerCard";
 import Button from "../components/ui/Button";
 
-// ─── Budget award tables ──────────────────────────────────────────────────────
-
-const GP_BUDGET     = [20,15,15,10,10,10,8,8,5,5,3,3,3,3,3,2,2,2,2,2,2,2];
-const SPRINT_BUDGET = [8,5,5,3,3,2,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1];
-
-function earnedBudget(position, sessionType) {
-    const table = sessionType === "GP" ? GP_BUDGET : SPRINT_BUDGET;
-    const idx = Math.max(0, (position || 22) - 1);
-    return (table[idx] ?? 1) * 1_000_000;
-}
-
 // ─── Team border styles ───────────────────────────────────────────────────────
 
 const TEAM_STYLE = {
@@ -221,8 +210,10 @@ export default function StartSeason() {
             const url = force
                 ? `/api/simulate/session/${sessionIndex}/?force=1`
                 : `/api/simulate/session/${sessionIndex}/`;
-            const res = await apiFetch(url, { method: "POST", body: JSON.stringify({}) });
+            const res = await apiFetch(url, { method: "POST", body: JSON.stringify({ driver: playerRow?.id }) });
             const results = Array.isArray(res?.results) ? res.results : [];
+            // Budget: race awards are paid by the server during the simulation
+            if (res?.budget != null) setBudget(res.budget);
 
             setLastResults(results);
             setResultsTick((t) => t + 1);
@@ -233,14 +224,11 @@ export default function StartSeason() {
             const isRace = sType === "GP" || sType === "S";
 
             if (isRace) {
-                // Award budget
+                // Award toast (a forced re-run is not paid again)
                 const playerResult = results.find((r) => sameDriver(r, driver));
-                if (playerResult?.position) {
-                    const earned = earnedBudget(playerResult.position, sType);
-                    await apiFetch("/api/season/budget/award/", { method: "POST", body: JSON.stringify({ amount: earned }) });
-                    setBudget((b) => b + earned);
+                if (playerResult?.position && res?.award != null && !force) {
                     addToast({
-                        message: `P${playerResult.position} · +${(earned / 1_000_000).toFixed(0)}M budget`,
+                        message: `P${playerResult.position} · +${(res.award / 1_000_000).toFixed(0)}M budget`,
                         type: playerResult.position <= 3 ? "success" : "info",
                         duration: 5000,
                     });
@@ -276,9 +264,10 @@ export default function StartSeason() {
         const url = force
             ? `/api/simulate/session/${sessionIndex}/?force=1`
             : `/api/simulate/session/${sessionIndex}/`;
-        const res = await apiFetch(url, { method: "POST", body: JSON.stringify({}) });
+        const res = await apiFetch(url, { method: "POST", body: JSON.stringify({ driver: playerRow?.id }) });
 
         setLastResults(Array.isArray(res?.results) ? res.results : []);
+        if (res?.budget != null) setBudget(res.budget);
         setResultsTick((t) => t + 1);
 
         await refreshAll();
@@ -220,7 +220,13 @@ export function mockCalendar() {
     return getState().sessions;
 }
 
-export function mockSimulate(index, force = false) {
+// Gains de course (en millions) par position, comme le serveur (services/budget.py)
+const RESULT_BUDGET = {
+    GP: [20,15,15,10,10,10,8,8,5,5,3,3,3,3,3,2,2,2,2,2,2,2],
+    S:  [8,5,5,3,3,2,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1],
+};
+
+export function mockSimulate(index, force = false, driverId = null) {
     const s = getState();
     const session = s.sessions.find((sess) => sess.index === index);
     if (!session) throw Object.assign(new Error(`Session ${index} introuvable`), { status: 404 });
@@ -228,8 +234,17 @@ export function mockSimulate(index, force = false) {
 
     const results = simulateSession(session, s.drivers);
     session.is_simulated = true;
+
+    // Gain de course du pilote du joueur, payé une seule fois par session
+    s.awards = s.awards || {};
+    const table = RESULT_BUDGET[session.session_type];
+    const player = results.find((r) => r.id === driverId);
+    if (table && player?.position && s.awards[index] == null) {
+        s.awards[index] = (table[player.position - 1] ?? 1) * 1_000_000;
+        s.budget = (s.budget || 0) + s.awards[index];
+    }
     saveState(s);
-    return { results };
+    return { results, award: s.awards[index] ?? null, budget: s.budget || 0 };
 }
 
 export function mockResetSeason() {
@@ -238,6 +253,7 @@ export function mockResetSeason() {
     s.drivers  = SEED_DRIVERS.map((d) => ({ ...d, points: 0, wins: 0, podiums: 0, pole_positions: 0, fastest_laps: 0 }));
     s.season   = (s.season || 2026) + 1;
     s.budget   = 10_000_000;
+    s.awards   = {};
     saveState(s);
     return { season: s.season };
 }
@@ -250,7 +266,7 @@ export function mockAwardBudget(amount) {
     const s = getState();
     s.budget = (s.budget || 0) + Math.max(0, Number(amount) || 0);
     saveState(s);
-    return { budget: s.budget };
+    return { budget: s.budget, created: true };
 }
 
 const TRAINING_COST = {
@@ -311,7 +327,7 @@ export function mockDispatch(path, options = {}) {
         const idx   = parseInt(simMatch[1]);
         const force = path.includes("force=1");
         try {
-            return Promise.resolve(mockSimulate(idx, force));
+            return Promise.resolve(mockSimulate(idx, force, body.driver ?? null));
         } catch (e) {
             return Promise.reject(e);
         }